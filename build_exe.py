@@ -58,6 +58,25 @@ def install_cx_freeze():
             print(f"cx_Freeze 安装失败: {e}")
             return False
 
+def build_thumbnail_atlas():
+    """生成DLC缩略图图集（resources/dlc_images.atlas），失败时程序仍可逐个读取JPEG"""
+    print("正在生成DLC缩略图图集...")
+    
+    try:
+        result = subprocess.run([
+            sys.executable, "build_thumbnail_atlas.py"
+        ], capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            print("图集生成成功")
+        else:
+            print("图集生成失败，将只使用JPEG图片:")
+            print(result.stdout)
+            print(result.stderr)
+            
+    except Exception as e:
+        print(f"生成图集时发生错误: {e}")
+
 def build_exe():
     """构建可执行文件"""
     print("开始构建可执行文件...")
@@ -145,8 +164,8 @@ def main():
     print("=" * 50)
     
     # 检查Python版本
-    if sys.version_info < (3, 7):
-        print("错误: 需要Python 3.7或更高版本")
+    if sys.version_info < (3, 10):
+        print("错误: 需要Python 3.10或更高版本")
         return False
     
     print(f"Python版本: {sys.version}")
@@ -158,6 +177,9 @@ def main():
     # 清理构建目录
     clean_build_dirs()
     
+    # 生成缩略图图集（随resources目录一起打包）
+    build_thumbnail_atlas()
+    
     # 构建可执行文件
     if not build_exe():
         return False
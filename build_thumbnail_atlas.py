@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DLC缩略图图集生成脚本
+把resources/dlc_images中的所有DLC头图解码、缩放为列表图标尺寸，
+写入resources/dlc_images.atlas，程序启动时内存映射该文件，不再逐个解码JPEG
+（下载新图片后需要重新运行，打包脚本会自动运行）
+"""
+
+import sys
+from pathlib import Path
+
+from ui.ThumbnailAtlas import ATLAS_FILE_NAME, write_atlas
+from ui.ThumbnailCache import THUMBNAIL_SIZE, decode_image
+
+
+def collect_tiles(images_dir):
+    """
+    解码目录中所有以DLC ID命名的图片
+
+    Args:
+        images_dir: DLC图片目录
+
+    Returns:
+        (dict, int): {DLC ID: (QImage, 源图片的os.stat结果)}, 失败数量
+    """
+    tiles = {}
+    failed_count = 0
+    for path in sorted(images_dir.glob("*.jpg")):
+        if not path.stem.isdigit():
+            print(f"  ⊘ 跳过: 文件名不是DLC ID ({path.name})")
+            continue
+
+        image, error = decode_image(path, THUMBNAIL_SIZE)
+        if image is None:
+            print(f"  ✗ 解码失败: {path.name}: {error}")
+            failed_count += 1
+            continue
+        tiles[int(path.stem)] = (image, path.stat())
+    return tiles, failed_count
+
+
+def main():
+    """主函数"""
+    print("=" * 60)
+    print("DLC缩略图图集生成工具")
+    print("=" * 60)
+
+    base_path = Path(__file__).parent
+    images_dir = base_path / "resources" / "dlc_images"
+    atlas_path = base_path / "resources" / ATLAS_FILE_NAME
+
+    if not images_dir.is_dir():
+        print(f"错误: 找不到图片目录 {images_dir}")
+        return False
+
+    print(f"\n图片目录: {images_dir}")
+    print(f"图块尺寸: {THUMBNAIL_SIZE.width()}x{THUMBNAIL_SIZE.height()}")
+
+    tiles, failed_count = collect_tiles(images_dir)
+    if not tiles:
+        print("错误: 没有可用的图片")
+        return False
+
+    try:
+        count = write_atlas(atlas_path, tiles)
+    except Exception as e:
+        print(f"错误: 写入图集失败: {e}")
+        return False
+
+    size_mb = atlas_path.stat().st_size / 1024 / 1024
+    print("\n" + "=" * 60)
+    print("生成完成!")
+    print(f"图块: {count} 个")
+    print(f"失败: {failed_count} 个")
+    print(f"图集: {atlas_path} ({size_mb:.1f} MB)")
+    print("=" * 60)
+
+    return failed_count == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -6,9 +6,19 @@
 
 import json
 import os
+import time
+import atexit
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 import logging
 
+from config_schema import CONFIG_KEYS, SECTIONS, Settings, settings_from_dict, settings_to_dict
+
+
+# 最后一次修改后等待多久再写入文件（秒），连续的多次修改只写一次
+SAVE_DELAY = 0.5
+
 
 class Config:
     """配置管理类"""
@@ -17,40 +27,8 @@ class Config:
         """初始化配置"""
         self.logger = logging.getLogger(__name__)
         
-        # 默认配置
-        self.default_config = {
-            "app": {
-                "name": "ETS2 DLC Tools",
-                "version": "1.0.0",
-                "debug": False
-            },
-            "window": {
-                "width": 1200,
-                "height": 800,
-                "x": 100,
-                "y": 100,
-                "maximized": False
-            },
-            "logging": {
-                "level": "INFO",
-                "file": "logs/app.log",
-                "max_size": 1048576,   # 1MB
-                "backup_count": 5
-            },
-            "dlc": {
-                "game_path": "",
-                "mods_path": "",
-                "backup_path": "backups",
-                "auto_backup": True
-            },
-            "ui": {
-                "theme": "light",
-                "language": "zh_CN",
-                "font_size": 12,
-                "show_toolbar": True,
-                "show_statusbar": True
-            }
-        }
+        # 默认配置（配置项的类型、默认值和取值范围见config_schema）
+        self.default_config = settings_to_dict(Settings())
         
         # 配置文件路径
         if config_file:
@@ -58,95 +36,270 @@ class Config:
         else:
             self.config_file = Path(__file__).parent / "config.json"
         
-        # 加载配置
-        self.config = self.load_config()
+        # 加载配置：settings为各分组的类型化配置，extra保存不在配置结构中的其他配置项
+        self.settings, self.extra = self.load_config()
+        
+        # 配置变化订阅: [(配置项或分组, 回调)]
+        self._subscribers = []
+        
+        # 延迟写入：set只记录修改，由后台线程在修改停止SAVE_DELAY秒后写入一次
+        self.save_delay = SAVE_DELAY
+        self._lock = threading.RLock()
+        self._save_condition = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._version = 0          # 每次修改递增
+        self._saved_version = 0    # 已写入文件的版本
+        self._save_deadline = None # 计划写入的时间
+        self._batch_depth = 0
+        self._writer = None
+        # 程序没有经过closeEvent退出时也写入尚未保存的修改
+        atexit.register(self.flush)
         
         self.logger.info(f"配置初始化完成，配置文件: {self.config_file}")
     
     def load_config(self):
-        """加载配置文件"""
+        """
+        加载配置文件，类型或取值无效的配置项使用默认值
+        
+        Returns:
+            (Settings, dict): 类型化配置，以及不在配置结构中的其他配置项
+        """
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     loaded_config = json.load(f)
-                    # 合并默认配置和加载的配置
-                    config = self.merge_config(self.default_config.copy(), loaded_config)
-                    self.logger.info("配置文件加载成功")
-                    return config
+                settings, extra = settings_from_dict(loaded_config, self._report_invalid)
+                self.logger.info("配置文件加载成功")
+                return settings, extra
             else:
                 self.logger.info("配置文件不存在，使用默认配置")
-                return self.default_config.copy()
+                return Settings(), {}
         except Exception as e:
             self.logger.error(f"加载配置文件失败: {e}")
-            return self.default_config.copy()
+            return Settings(), {}
+    
+    def _report_invalid(self, key_path, message):
+        """记录配置文件中被拒绝的值"""
+        self.logger.warning(f"配置项无效，使用默认值: {key_path or self.config_file} ({message})")
+    
+    @property
+    def config(self):
+        """完整配置的字典副本（写入config.json的内容），修改副本不会改变配置"""
+        with self._lock:
+            return settings_to_dict(self.settings, self.extra)
     
     def save_config(self):
-        """保存配置到文件"""
+        """立即保存配置到文件（取消尚未执行的延迟写入）"""
+        with self._lock:
+            self._save_deadline = None
+        return self._write_snapshot(force=True)
+    
+    def flush(self):
+        """立即写入尚未保存的修改（程序退出前调用）"""
+        with self._lock:
+            self._save_deadline = None
+            if self._version == self._saved_version:
+                return True
+        return self._write_snapshot()
+    
+    @contextmanager
+    def batch(self):
+        """
+        批量修改配置：with块中的多次set只在块结束后安排一次写入
+        
+        用法:
+            with config.batch():
+                config.set('window.x', 100)
+                config.set('window.y', 100)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._version != self._saved_version:
+                    self._schedule_save()
+    
+    def _schedule_save(self):
+        """安排延迟写入（每次修改都把写入时间推后，一连串修改只写一次）"""
+        with self._lock:
+            self._save_deadline = time.monotonic() + self.save_delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="ConfigWriter", daemon=True)
+                self._writer.start()
+            self._save_condition.notify()
+    
+    def _writer_loop(self):
+        """后台写入线程：等到计划的写入时间后写入一次"""
+        while True:
+            with self._save_condition:
+                while self._save_deadline is None:
+                    self._save_condition.wait()
+                remaining = self._save_deadline - time.monotonic()
+                if remaining > 0:
+                    self._save_condition.wait(remaining)
+                    continue
+                self._save_deadline = None
+            self._write_snapshot()
+    
+    def _write_snapshot(self, force=False):
+        """
+        序列化当前配置并写入文件（可在任意线程调用）
+        
+        Args:
+            force: 没有未保存的修改时也写入
+        """
+        with self._lock:
+            if not force and self._version == self._saved_version:
+                return True
+            try:
+                text = json.dumps(self.config, indent=4, ensure_ascii=False)
+            except Exception as e:
+                self.logger.error(f"保存配置文件失败: {e}")
+                return False
+            version = self._version
+        
+        with self._write_lock:
+            # 其他线程已经写入了更新的版本
+            if not force and version <= self._saved_version:
+                return True
+            if not self._write_file(text):
+                return False
+            with self._lock:
+                self._saved_version = max(self._saved_version, version)
+        self.logger.info("配置文件保存成功")
+        return True
+    
+    def _write_file(self, text):
+        """先写入临时文件再替换，写入中途出错不会留下空的或不完整的配置文件"""
+        temp_file = self.config_file.with_name(self.config_file.name + ".tmp")
         try:
             # 确保配置目录存在
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            
-            self.logger.info("配置文件保存成功")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.config_file)
             return True
         except Exception as e:
             self.logger.error(f"保存配置文件失败: {e}")
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
             return False
     
     def get(self, key_path, default=None):
-        """获取配置值"""
-        keys = key_path.split('.')
-        value = self.config
+        """
+        获取配置值
         
+        Args:
+            key_path: 点分路径（如'ui.theme'），或分组名称（如'logging'，返回该分组的字典副本）
+            default: 不在配置结构中的配置项不存在时返回的值
+        """
+        key = CONFIG_KEYS.get(key_path)
+        if key is not None:
+            return key.get(self.settings)
+        
+        if key_path in SECTIONS:
+            return self.config[key_path]
+        
+        # 不在配置结构中的配置项
+        value = self.extra
         try:
-            for key in keys:
-                value = value[key]
+            for name in key_path.split('.'):
+                value = value[name]
             return value
         except (KeyError, TypeError):
             return default
     
     def set(self, key_path, value):
-        """设置配置值"""
-        keys = key_path.split('.')
-        config = self.config
+        """
+        设置配置值（值有变化时安排写入并通知订阅者）
+        
+        Returns:
+            bool: 是否设置成功，类型或取值无效时返回False
+        """
+        key = CONFIG_KEYS.get(key_path)
         
         try:
-            # 遍历到倒数第二个键
-            for key in keys[:-1]:
-                if key not in config:
-                    config[key] = {}
-                config = config[key]
-            
-            # 设置最后一个键的值
-            config[keys[-1]] = value
-            
-            # 自动保存配置
-            self.save_config()
+            with self._lock:
+                if key is not None:
+                    value = key.validate(value)
+                    if key.get(self.settings) == value:
+                        return True
+                    key.set(self.settings, value)
+                elif key_path in SECTIONS:
+                    raise ValueError("不能直接替换整个分组，请设置其中的配置项")
+                else:
+                    keys = key_path.split('.')
+                    config = self.extra
+                    # 遍历到倒数第二个键
+                    for name in keys[:-1]:
+                        if name not in config:
+                            config[name] = {}
+                        config = config[name]
+                    
+                    # 设置最后一个键的值
+                    config[keys[-1]] = value
+                self._version += 1
+                
+                # 自动保存配置（延迟写入，批量修改时在batch结束后写入）
+                if self._batch_depth == 0:
+                    self._schedule_save()
             
             self.logger.info(f"配置已更新: {key_path} = {value}")
-            return True
         except Exception as e:
-            self.logger.error(f"设置配置失败: {e}")
+            self.logger.error(f"设置配置失败 {key_path}: {e}")
             return False
+        
+        self._notify(key_path, value)
+        return True
     
-    def merge_config(self, default, custom):
-        """合并配置"""
-        if not isinstance(default, dict) or not isinstance(custom, dict):
-            return custom
+    def subscribe(self, key_path, callback):
+        """
+        订阅配置变化
         
-        for key, value in custom.items():
-            if key in default and isinstance(default[key], dict) and isinstance(value, dict):
-                default[key] = self.merge_config(default[key], value)
-            else:
-                default[key] = value
+        Args:
+            key_path: 配置项（如'ui.theme'）或分组（如'ui'，订阅分组内所有配置项）
+            callback: callback(key_path, value)，在调用set的线程中执行
         
-        return default
+        Returns:
+            取消订阅的函数
+        """
+        entry = (key_path, callback)
+        with self._lock:
+            self._subscribers.append(entry)
+        
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        
+        return unsubscribe
+    
+    def _notify(self, key_path, value):
+        """通知订阅了该配置项或其所在分组的回调（在锁外执行，回调中可以再次set）"""
+        section = key_path.split('.', 1)[0]
+        with self._lock:
+            callbacks = [callback for subscribed, callback in self._subscribers
+                         if subscribed == key_path or subscribed == section]
+        for callback in callbacks:
+            try:
+                callback(key_path, value)
+            except Exception as e:
+                self.logger.error(f"配置变化回调失败 {key_path}: {e}")
     
     def reset_to_default(self):
         """重置为默认配置"""
-        self.config = self.default_config.copy()
+        with self._lock:
+            self.settings = Settings()
+            self.extra = {}
+            self._version += 1
         self.save_config()
         self.logger.info("配置已重置为默认值")
     
@@ -194,10 +347,12 @@ class Config:
     
     def set_window_geometry(self, geometry):
         """设置窗口几何信息"""
-        self.set('window.x', geometry.get('x', 100))
-        self.set('window.y', geometry.get('y', 100))
-        self.set('window.width', geometry.get('width', 1200))
-        self.set('window.height', geometry.get('height', 800))
+        with self.batch():
+            self.set('window.x', geometry.get('x', 100))
+            self.set('window.y', geometry.get('y', 100))
+            self.set('window.width', geometry.get('width', 1200))
+            self.set('window.height', geometry.get('height', 800))
+            self.set('window.maximized', geometry.get('maximized', False))
     
     def get_theme(self):
         """获取主题设置"""
@@ -206,11 +361,10 @@ class Config:
     def set_theme(self, theme):
         """设置主题"""
         return self.set('ui.theme', theme)
-        self.set('window.maximized', geometry.get('maximized', False))
     
     def get_ui_theme(self):
         """获取UI主题"""
-        return self.get('ui.theme', 'default')
+        return self.get('ui.theme')
     
     def set_ui_theme(self, theme):
         """设置UI主题"""
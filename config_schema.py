@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+配置结构 - config_schema
+用带__slots__的数据类描述config.json中每个分组的配置项（类型、默认值、取值范围），
+加载时逐项校验；运行时通过预先生成的访问器（CONFIG_KEYS）直接读写属性，
+不再每次拆分点分路径、逐级查找字典
+"""
+
+import copy
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+
+
+def _choices(*values):
+    """字段元数据：只允许列出的取值"""
+    return {'choices': values}
+
+
+def _range(minimum=None, maximum=None):
+    """字段元数据：数值范围（包含边界）"""
+    return {'min': minimum, 'max': maximum}
+
+
+@dataclass(slots=True)
+class AppSettings:
+    """程序信息"""
+    name: str = "ETS2 DLC Tools"
+    version: str = "1.0.0"
+    debug: bool = False
+    # 列表绘制统计（也可用环境变量ETS2_DLC_PAINT_STATS开启）
+    paint_stats: bool = False
+
+
+@dataclass(slots=True)
+class WindowSettings:
+    """窗口位置和大小"""
+    width: int = field(default=1200, metadata=_range(100))
+    height: int = field(default=800, metadata=_range(100))
+    x: int = 100
+    y: int = 100
+    maximized: bool = False
+
+
+@dataclass(slots=True)
+class LoggingSettings:
+    """日志设置"""
+    level: str = field(default="INFO", metadata=_choices("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+    file: str = "logs/app.log"
+    max_size: int = field(default=1048576, metadata=_range(1024))   # 1MB
+    backup_count: int = field(default=5, metadata=_range(0))
+
+
+@dataclass(slots=True)
+class DlcSettings:
+    """游戏和DLC目录设置"""
+    game_path: str = ""
+    # 游戏主程序的大小和修改时间，启动时用于确认game_path仍然有效
+    game_fingerprint: dict = field(default_factory=dict)
+    mods_path: str = ""
+    backup_path: str = "backups"
+    auto_backup: bool = True
+
+
+@dataclass(slots=True)
+class UiSettings:
+    """界面设置"""
+    theme: str = field(default="light", metadata=_choices("light", "dark"))
+    language: str = field(default="zh_CN", metadata=_choices("zh_CN", "en"))
+    font_size: int = field(default=12, metadata=_range(6, 72))
+    show_toolbar: bool = True
+    show_statusbar: bool = True
+
+
+@dataclass(slots=True)
+class Settings:
+    """完整配置（每个分组对应config.json中的一个对象）"""
+    app: AppSettings = field(default_factory=AppSettings)
+    window: WindowSettings = field(default_factory=WindowSettings)
+    logging: LoggingSettings = field(default_factory=LoggingSettings)
+    dlc: DlcSettings = field(default_factory=DlcSettings)
+    ui: UiSettings = field(default_factory=UiSettings)
+
+
+class ConfigKey:
+    """单个配置项的访问器和校验规则"""
+
+    __slots__ = ('path', 'section', 'name', 'type', 'default', 'choices', 'minimum', 'maximum', 'get')
+
+    def __init__(self, section, spec, default):
+        self.path = f"{section}.{spec.name}"
+        self.section = section
+        self.name = spec.name
+        self.type = spec.type
+        self.default = default
+        self.choices = spec.metadata.get('choices')
+        self.minimum = spec.metadata.get('min')
+        self.maximum = spec.metadata.get('max')
+        # 读取函数：get(settings) -> 值
+        self.get = attrgetter(self.path)
+
+    def set(self, settings, value):
+        """写入已校验的值"""
+        setattr(getattr(settings, self.section), self.name, value)
+
+    def validate(self, value):
+        """
+        校验配置值
+
+        Returns:
+            校验通过的值
+
+        Raises:
+            ValueError: 类型或取值无效
+        """
+        # bool是int的子类，整数配置项不接受True/False
+        if not isinstance(value, self.type) or (self.type is int and isinstance(value, bool)):
+            raise ValueError(f"应为{self.type.__name__}类型，实际为 {value!r}")
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"应为 {'/'.join(self.choices)} 之一，实际为 {value!r}")
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f"不能小于 {self.minimum}，实际为 {value!r}")
+        if self.maximum is not None and value > self.maximum:
+            raise ValueError(f"不能大于 {self.maximum}，实际为 {value!r}")
+        return value
+
+    def default_value(self):
+        """默认值（可变默认值返回副本）"""
+        return copy.deepcopy(self.default)
+
+
+def _build_keys():
+    defaults = Settings()
+    keys = {}
+    for section in fields(Settings):
+        section_defaults = getattr(defaults, section.name)
+        for spec in fields(section.type):
+            key = ConfigKey(section.name, spec, getattr(section_defaults, spec.name))
+            keys[key.path] = key
+    return keys
+
+
+# 分组名称 -> 分组数据类
+SECTIONS = {section.name: section.type for section in fields(Settings)}
+# 点分路径（如'ui.theme'）-> ConfigKey
+CONFIG_KEYS = _build_keys()
+
+
+def settings_from_dict(data, on_invalid=None):
+    """
+    从config.json的内容构造配置，无效的值使用默认值
+
+    Args:
+        data: 解析后的JSON对象
+        on_invalid: on_invalid(点分路径, 错误信息) 报告被拒绝的值，可选
+
+    Returns:
+        (Settings, dict): 配置，以及不在配置结构中的其他配置项
+    """
+    settings = Settings()
+    extra = {}
+    if not isinstance(data, dict):
+        if on_invalid is not None:
+            on_invalid("", "配置文件的顶层应为对象")
+        return settings, extra
+
+    for section_name, section_data in data.items():
+        if section_name not in SECTIONS:
+            extra[section_name] = section_data
+            continue
+        if not isinstance(section_data, dict):
+            if on_invalid is not None:
+                on_invalid(section_name, f"应为对象，实际为 {section_data!r}")
+            continue
+
+        for name, value in section_data.items():
+            key = CONFIG_KEYS.get(f"{section_name}.{name}")
+            if key is None:
+                # 不在结构中的配置项原样保留
+                extra.setdefault(section_name, {})[name] = value
+                continue
+            try:
+                key.set(settings, key.validate(value))
+            except ValueError as e:
+                if on_invalid is not None:
+                    on_invalid(key.path, str(e))
+    return settings, extra
+
+
+def settings_to_dict(settings, extra=None):
+    """
+    把配置转换为写入config.json的字典（包含不在配置结构中的其他配置项）
+
+    Args:
+        settings: Settings实例
+        extra: settings_from_dict返回的其他配置项
+
+    Returns:
+        dict: 新的字典，修改它不影响配置
+    """
+    data = {}
+    for section_name, section_type in SECTIONS.items():
+        section = getattr(settings, section_name)
+        data[section_name] = {spec.name: copy.deepcopy(getattr(section, spec.name))
+                              for spec in fields(section_type)}
+    for name, value in (extra or {}).items():
+        if name in data and isinstance(value, dict):
+            data[name].update(copy.deepcopy(value))
+        else:
+            data[name] = copy.deepcopy(value)
+    return data
@@ -31,6 +31,7 @@ def main():
     print("  • Python 文件 (.py)")
     print("  • 配置文件 (.json)")
     print("  • UI 文件 (.ui)")
+    print("  • 主题样式模板 (.qss)")
     print()
     print("忽略目录:")
     print("  • __pycache__, .git, .idea, logs, Output, venv, env")
@@ -52,7 +53,7 @@ def main():
     reloader = HotReloader(
         script_path=main_script,
         watch_dirs=['.'],  # 监控当前目录及子目录
-        extensions=['.py', '.json', '.ui'],  # 监控的文件类型
+        extensions=['.py', '.json', '.ui', '.qss'],  # 监控的文件类型
         ignore_dirs=[
             '__pycache__', 
             '.git', 
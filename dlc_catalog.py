@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+DLC目录模块 - DlcCatalog
+把dlcs_info.json加载为带索引的只读目录，按文件名和DLC ID常数时间查找
+"""
+
+import logging
+
+from json_cache import load_cached_json
+
+
+# 缓存内容标识，DlcEntry/DlcCatalog的结构变化时递增
+CATALOG_CACHE_TAG = "dlc_catalog:1"
+
+
+class DlcEntry:
+    """目录中的单个DLC（一个DLC可以包含多个.scs文件）"""
+
+    __slots__ = ('dlc_id', 'name', 'files', 'header_image', 'steam_link')
+
+    def __init__(self, dlc_id=0, name="", files=(), header_image="", steam_link=""):
+        self.dlc_id = dlc_id
+        self.name = name
+        self.files = tuple(files)
+        self.header_image = header_image
+        self.steam_link = steam_link
+
+    @classmethod
+    def from_dict(cls, data):
+        """从dlcs_info.json中的一项创建"""
+        return cls(
+            dlc_id=data.get('dlc_id', 0) or 0,
+            name=data.get('name', ""),
+            files=data.get('files', ()),
+            header_image=data.get('header_image', ""),
+            steam_link=data.get('steam_link', ""),
+        )
+
+    def __repr__(self):
+        return f"DlcEntry({self.dlc_id!r}, {self.name!r})"
+
+
+class DlcCatalog:
+    """DLC目录 - 小写文件名和DLC ID到DlcEntry的索引"""
+
+    def __init__(self, entries=()):
+        """
+        初始化目录并建立索引
+
+        Args:
+            entries: DlcEntry列表
+        """
+        self.entries = list(entries)
+        # 小写文件名 -> DlcEntry（多文件DLC的每个文件都指向同一个DlcEntry）
+        self._by_file = {}
+        # DLC ID -> DlcEntry
+        self._by_id = {}
+
+        # 重复的文件名或ID以先出现的为准
+        for entry in self.entries:
+            for file_name in entry.files:
+                self._by_file.setdefault(file_name.lower(), entry)
+            if entry.dlc_id:
+                self._by_id.setdefault(entry.dlc_id, entry)
+
+    @classmethod
+    def from_list(cls, data):
+        """从dlcs_info.json的内容创建目录"""
+        return cls(DlcEntry.from_dict(item) for item in data)
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        从JSON文件加载目录（优先使用源文件旁边的预编译缓存，缓存中已包含索引）
+
+        Args:
+            path: dlcs_info.json路径
+
+        Returns:
+            DlcCatalog: 加载的目录
+
+        Raises:
+            OSError: 文件不存在或无法读取
+            ValueError: JSON格式错误
+        """
+        return load_cached_json(path, cls.from_list, CATALOG_CACHE_TAG)
+
+    @classmethod
+    def load(cls, path):
+        """
+        从JSON文件加载目录
+
+        Args:
+            path: dlcs_info.json路径
+
+        Returns:
+            DlcCatalog: 加载的目录，文件不存在或解析失败时返回空目录
+        """
+        logger = logging.getLogger(__name__)
+        try:
+            catalog = cls.from_file(path)
+            logger.info(f"成功加载 {len(catalog)} 个DLC信息")
+            return catalog
+        except FileNotFoundError:
+            logger.warning(f"DLC信息文件不存在: {path}")
+        except Exception as e:
+            logger.error(f"加载DLC信息失败: {e}")
+        return cls()
+
+    def find_by_file(self, file_name):
+        """根据文件名查找DLC（不区分大小写），找不到时返回None"""
+        return self._by_file.get(file_name.lower())
+
+    def get(self, dlc_id):
+        """根据DLC ID查找DLC，找不到时返回None"""
+        return self._by_id.get(dlc_id)
+
+    def group_files(self, file_name):
+        """获取与文件属于同一DLC的所有文件名（未知文件只返回它自己）"""
+        entry = self.find_by_file(file_name)
+        return entry.files if entry else (file_name,)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
@@ -0,0 +1,473 @@
+# -*- coding: utf-8 -*-
+"""
+DLC文件移动引擎 - DlcMoveEngine
+批量移动前先写入意图日志（journal），整批完成后统一同步目录；
+程序在批量移动中途崩溃时，下次启动根据日志继续完成或回滚。
+同一设备上直接重命名，跨设备时使用零拷贝复制并校验大小后再删除源文件
+"""
+
+import os
+import json
+import errno
+import shutil
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# 意图日志文件名（保存在temp_dlcs文件夹中）
+JOURNAL_FILE_NAME = ".dlc_move_journal.json"
+JOURNAL_VERSION = 1
+
+# 跨设备复制：临时文件后缀、缓冲区大小、并行复制的线程数
+PARTIAL_SUFFIX = ".partial"
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+COPY_WORKERS = 2
+
+# 零拷贝接口不可用时回退到普通读写的错误码
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF,
+                    getattr(errno, 'EOPNOTSUPP', errno.EINVAL),
+                    getattr(errno, 'ENOTSUP', errno.EINVAL)}
+
+# 恢复模式
+RECOVER_REPLAY = "replay"      # 继续完成未完成的移动
+RECOVER_ROLLBACK = "rollback"  # 把已移动的文件移回原位置
+
+
+class MoveResult:
+    """批量移动结果"""
+
+    def __init__(self):
+        self.moved = []    # 成功移动的文件名
+        self.skipped = []  # (文件名, 原因) 源文件不存在或目标已存在
+        self.failed = []   # (文件名, 错误信息)
+        self.cancelled = []  # 因取消而未移动的文件名
+
+    def __repr__(self):
+        return (f"MoveResult(moved={len(self.moved)}, skipped={len(self.skipped)}, "
+                f"failed={len(self.failed)}, cancelled={len(self.cancelled)})")
+
+
+class MoveProgress:
+    """批量移动进度（可在多个复制线程中更新）"""
+
+    def __init__(self, files_total, bytes_total, callback=None):
+        """
+        初始化进度
+
+        Args:
+            files_total: 文件总数
+            bytes_total: 字节总数
+            callback: 进度回调函数 (当前文件名, 已完成文件数, 文件总数, 已完成字节数, 字节总数)
+        """
+        self.files_total = files_total
+        self.bytes_total = bytes_total
+        self.files_done = 0
+        self.bytes_done = 0
+        self.callback = callback
+        self._lock = threading.Lock()
+
+    def add_bytes(self, name, size):
+        """增加已传输的字节数"""
+        with self._lock:
+            self.bytes_done += size
+            self._notify(name)
+
+    def file_done(self, name):
+        """一个文件处理完成（成功、失败或取消）"""
+        with self._lock:
+            self.files_done += 1
+            self._notify(name)
+
+    def _notify(self, name):
+        if self.callback:
+            self.callback(name, self.files_done, self.files_total, self.bytes_done, self.bytes_total)
+
+
+def sync_directory(directory):
+    """
+    把目录项的变化（重命名/新建/删除）刷新到磁盘
+
+    Windows不支持对目录调用fsync（NTFS元数据本身有日志），直接跳过
+    """
+    if os.name == 'nt' or not directory:
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"同步目录失败 {directory}: {e}")
+
+
+def is_same_device(src_path, dst_dir):
+    """判断源文件和目标目录是否在同一设备上（可以直接重命名）"""
+    try:
+        return os.stat(src_path).st_dev == os.stat(dst_dir).st_dev
+    except OSError:
+        return False
+
+
+def _kernel_copy(src_fd, dst_fd, total, progress_callback=None):
+    """
+    使用os.copy_file_range/os.sendfile在内核中复制数据
+
+    Returns:
+        int: 已复制的字节数（接口不可用时可能小于total，由调用方继续复制剩余部分）
+    """
+    copied = 0
+    if os.name == 'nt':
+        return copied
+
+    for method in ('copy_file_range', 'sendfile'):
+        if not hasattr(os, method):
+            continue
+        try:
+            while copied < total:
+                count = min(COPY_BUFFER_SIZE, total - copied)
+                if method == 'copy_file_range':
+                    sent = os.copy_file_range(src_fd, dst_fd, count, copied, copied)
+                else:
+                    os.lseek(dst_fd, copied, os.SEEK_SET)
+                    sent = os.sendfile(dst_fd, src_fd, copied, count)
+                if sent == 0:
+                    break
+                copied += sent
+                if progress_callback:
+                    progress_callback(sent)
+            return copied
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+    return copied
+
+
+def copy_file_fast(src_path, dst_path, progress_callback=None):
+    """
+    复制文件 - 优先使用零拷贝接口，否则使用大缓冲区读写，写完后刷新到磁盘
+
+    Args:
+        src_path: 源文件路径
+        dst_path: 目标文件路径
+        progress_callback: 进度回调函数 (本次复制的字节数)
+
+    Returns:
+        int: 复制的字节数
+    """
+    total = os.path.getsize(src_path)
+    with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+        copied = _kernel_copy(fsrc.fileno(), fdst.fileno(), total, progress_callback)
+
+        if copied < total:
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            buffer = bytearray(COPY_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                size = fsrc.readinto(buffer)
+                if not size:
+                    break
+                fdst.write(view[:size])
+                copied += size
+                if progress_callback:
+                    progress_callback(size)
+
+        fdst.flush()
+        os.fsync(fdst.fileno())
+    return copied
+
+
+class DlcMoveEngine:
+    """带意图日志的批量移动引擎"""
+
+    def __init__(self, journal_dir, max_workers=COPY_WORKERS):
+        """
+        初始化移动引擎
+
+        Args:
+            journal_dir: 意图日志所在目录（一般为temp_dlcs文件夹）
+            max_workers: 跨设备复制时的最大并行数
+        """
+        self.logger = logging.getLogger(__name__)
+        self.journal_path = os.path.join(journal_dir, JOURNAL_FILE_NAME)
+        self.max_workers = max(1, max_workers)
+
+    def has_journal(self):
+        """是否存在未完成的意图日志"""
+        return os.path.exists(self.journal_path)
+
+    def move_batch(self, moves, progress_callback=None, is_cancelled=None):
+        """
+        批量移动文件
+
+        Args:
+            moves: (文件名, 源路径, 目标路径) 列表
+            progress_callback: 进度回调函数，参数见MoveProgress
+            is_cancelled: 返回是否已取消的函数，在每个文件开始前检查
+
+        Returns:
+            MoveResult: 移动结果
+        """
+        result = MoveResult()
+        is_cancelled = is_cancelled or (lambda: False)
+
+        # 预检查：跳过源文件不存在或目标已存在的文件
+        planned = []
+        sizes = {}
+        for name, src_path, dst_path in moves:
+            try:
+                sizes[name] = os.path.getsize(src_path)
+            except OSError:
+                self.logger.warning(f"源文件不存在，跳过: {name}")
+                result.skipped.append((name, "source_missing"))
+                continue
+            if os.path.exists(dst_path):
+                self.logger.warning(f"目标文件已存在，跳过: {name}")
+                result.skipped.append((name, "target_exists"))
+            else:
+                planned.append((name, src_path, dst_path))
+
+        if not planned:
+            return result
+
+        progress = MoveProgress(len(planned), sum(sizes[move[0]] for move in planned), progress_callback)
+
+        # 先写入意图日志，再开始移动
+        self._write_journal(planned)
+
+        # 同一设备上的文件直接重命名，跨设备的文件放入复制队列
+        renames = []
+        copies = []
+        device_cache = {}
+        for move in planned:
+            dirs = (os.path.dirname(move[1]), os.path.dirname(move[2]))
+            if dirs not in device_cache:
+                device_cache[dirs] = is_same_device(move[1], dirs[1])
+            (renames if device_cache[dirs] else copies).append(move)
+
+        touched_dirs = set()
+        for name, src_path, dst_path in renames:
+            if is_cancelled():
+                result.cancelled.append(name)
+                continue
+            try:
+                os.rename(src_path, dst_path)
+                progress.add_bytes(name, sizes[name])
+                self._on_moved(result, touched_dirs, name, src_path, dst_path)
+            except OSError as e:
+                result.failed.append((name, str(e)))
+                self.logger.error(f"移动文件 {name} 失败: {e}")
+            progress.file_done(name)
+
+        if copies:
+            self.logger.info(f"{len(copies)} 个DLC文件需要跨设备复制")
+
+            def copy_task(name, src_path, dst_path):
+                # 取消只在文件边界生效，已开始的复制会完整结束
+                try:
+                    if is_cancelled():
+                        return False
+                    self._copy_move(src_path, dst_path, lambda size: progress.add_bytes(name, size))
+                    return True
+                finally:
+                    progress.file_done(name)
+
+            workers = min(self.max_workers, len(copies))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [(move, pool.submit(copy_task, *move)) for move in copies]
+                for (name, src_path, dst_path), future in futures:
+                    try:
+                        if future.result():
+                            self._on_moved(result, touched_dirs, name, src_path, dst_path)
+                        else:
+                            result.cancelled.append(name)
+                    except OSError as e:
+                        result.failed.append((name, str(e)))
+                        self.logger.error(f"跨设备复制文件 {name} 失败: {e}")
+
+        if result.cancelled:
+            self.logger.info(f"批量移动已取消，{len(result.cancelled)} 个文件未移动")
+
+        # 整批只同步一次目录，然后删除日志
+        for directory in touched_dirs:
+            sync_directory(directory)
+        self._remove_journal()
+
+        return result
+
+    def recover(self, mode=RECOVER_REPLAY, progress_callback=None):
+        """
+        处理上次未完成的意图日志
+
+        Args:
+            mode: RECOVER_REPLAY 继续完成移动，RECOVER_ROLLBACK 回滚到移动前的状态
+            progress_callback: 进度回调函数，参数见MoveProgress
+
+        Returns:
+            MoveResult或None: 没有未完成的日志时返回None
+        """
+        journal = self._read_journal()
+        if journal is None:
+            return None
+
+        self.logger.warning(f"发现未完成的DLC移动日志，开始恢复({mode}): {self.journal_path}")
+        result = MoveResult()
+        touched_dirs = set()
+
+        moves = []
+        for move in journal.get('moves', []):
+            name, journal_src, journal_dst = move.get('name', ''), move.get('src', ''), move.get('dst', '')
+            if not name or not journal_src or not journal_dst:
+                continue
+            # 中断的跨设备复制留下的临时文件总在日志记录的目标位置旁边，与恢复方向无关
+            partials = [journal_dst]
+            if mode == RECOVER_ROLLBACK:
+                # 回滚时复制到日志记录的源位置，上次回滚中断也会在那里留下临时文件
+                partials.append(journal_src)
+                moves.append((name, journal_dst, journal_src, partials))
+            else:
+                moves.append((name, journal_src, journal_dst, partials))
+
+        sizes = {}
+        for name, src_path, _, _ in moves:
+            try:
+                sizes[name] = os.path.getsize(src_path)
+            except OSError:
+                sizes[name] = 0
+        progress = MoveProgress(len(moves), sum(sizes.values()), progress_callback)
+
+        for name, src_path, dst_path, partials in moves:
+            try:
+                for path in partials:
+                    self._remove_partial(path)
+                src_exists = os.path.exists(src_path)
+                dst_exists = os.path.exists(dst_path)
+
+                if src_exists and not dst_exists:
+                    self._move_file(src_path, dst_path, lambda size: progress.add_bytes(name, size))
+                    result.moved.append(name)
+                elif src_exists and dst_exists:
+                    # 跨设备复制已完成但源文件还没删除：大小一致时删除多余的一份
+                    if os.path.getsize(src_path) == os.path.getsize(dst_path):
+                        os.remove(src_path)
+                        result.moved.append(name)
+                    else:
+                        self.logger.warning(f"恢复时两处文件大小不一致，保留原样: {name}")
+                        result.skipped.append((name, "size_mismatch"))
+                else:
+                    # 已经处于目标状态
+                    result.skipped.append((name, "already_done" if dst_exists else "source_missing"))
+                touched_dirs.add(os.path.dirname(src_path))
+                touched_dirs.add(os.path.dirname(dst_path))
+            except OSError as e:
+                result.failed.append((name, str(e)))
+                self.logger.error(f"恢复移动 {name} 失败: {e}")
+            progress.file_done(name)
+
+        for directory in touched_dirs:
+            sync_directory(directory)
+
+        if result.failed:
+            # 仍有失败的文件时保留日志，下次启动再试
+            self.logger.error(f"DLC移动日志恢复未全部完成: {result}")
+        else:
+            self._remove_journal()
+            self.logger.warning(f"DLC移动日志恢复完成: {result}")
+        return result
+
+    def _on_moved(self, result, touched_dirs, name, src_path, dst_path):
+        """记录一个移动成功的文件"""
+        result.moved.append(name)
+        touched_dirs.add(os.path.dirname(src_path))
+        touched_dirs.add(os.path.dirname(dst_path))
+        self.logger.info(f"移动DLC文件: {name} -> {os.path.dirname(dst_path)}")
+
+    def _move_file(self, src_path, dst_path, progress_callback=None):
+        """
+        移动单个文件 - 同一设备上为O(1)的重命名，否则复制后删除
+
+        Args:
+            progress_callback: 进度回调函数 (本次传输的字节数)
+        """
+        if is_same_device(src_path, os.path.dirname(dst_path)):
+            size = os.path.getsize(src_path)
+            os.rename(src_path, dst_path)
+            if progress_callback:
+                progress_callback(size)
+        else:
+            self._copy_move(src_path, dst_path, progress_callback)
+
+    def _copy_move(self, src_path, dst_path, progress_callback=None):
+        """
+        跨设备移动：复制到临时文件，校验大小后改名为目标文件，最后删除源文件
+
+        Raises:
+            OSError: 复制或校验失败（源文件保持不变）
+        """
+        partial_path = dst_path + PARTIAL_SUFFIX
+        try:
+            copy_file_fast(src_path, partial_path, progress_callback)
+
+            src_size = os.path.getsize(src_path)
+            dst_size = os.path.getsize(partial_path)
+            if src_size != dst_size:
+                raise OSError(errno.EIO, f"复制后文件大小不一致: {src_size} != {dst_size}")
+
+            shutil.copystat(src_path, partial_path)
+            os.replace(partial_path, dst_path)
+        except OSError:
+            self._remove_partial(dst_path)
+            raise
+
+        os.remove(src_path)
+
+    def _remove_partial(self, dst_path):
+        """删除中断的复制留下的临时文件"""
+        partial_path = dst_path + PARTIAL_SUFFIX
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    def _write_journal(self, planned):
+        """写入意图日志（先写临时文件再替换，确保日志本身完整）"""
+        journal = {
+            'version': JOURNAL_VERSION,
+            'moves': [{'name': name, 'src': src, 'dst': dst} for name, src, dst in planned]
+        }
+        journal_dir = os.path.dirname(self.journal_path)
+        os.makedirs(journal_dir, exist_ok=True)
+
+        tmp_path = self.journal_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(journal, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+        sync_directory(journal_dir)
+
+    def _read_journal(self):
+        """读取意图日志，不存在或损坏时返回None"""
+        if not os.path.exists(self.journal_path):
+            return None
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                journal = json.load(f)
+            if journal.get('version') != JOURNAL_VERSION:
+                self.logger.warning(f"不支持的DLC移动日志版本: {journal.get('version')}")
+                return None
+            return journal
+        except Exception as e:
+            # 日志是整体替换写入的，损坏时无法判断状态，只能丢弃
+            self.logger.warning(f"DLC移动日志损坏，已忽略: {e}")
+            self._remove_journal()
+            return None
+
+    def _remove_journal(self):
+        """删除意图日志"""
+        try:
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            sync_directory(os.path.dirname(self.journal_path))
+        except OSError as e:
+            self.logger.error(f"删除DLC移动日志失败: {e}")
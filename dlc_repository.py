@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+DLC仓库模块 - DlcRepository
+维护游戏目录（已安装）和temp_dlcs（未安装）中DLC文件的统一内存索引
+"""
+
+import os
+import logging
+
+
+# DLC文件所在位置
+INSTALLED = "installed"   # 游戏安装目录
+PARKED = "parked"         # temp_dlcs文件夹
+
+# 存放已卸载DLC的文件夹名称
+TEMP_DIR_NAME = "temp_dlcs"
+
+
+def other_location(location):
+    """另一个位置（移动文件的源位置或目标位置）"""
+    return PARKED if location == INSTALLED else INSTALLED
+
+
+def is_dlc_file_name(file_name):
+    """判断文件名是否为DLC文件（以dlc开头，后缀为.scs）"""
+    name_lower = file_name.lower()
+    return name_lower.startswith("dlc") and name_lower.endswith(".scs")
+
+
+def iter_dlc_entries(directory):
+    """
+    使用os.scandir遍历目录中的DLC文件
+
+    Args:
+        directory: 要扫描的目录
+
+    Yields:
+        (文件名, 文件大小, 修改时间) 元组
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not is_dlc_file_name(entry.name):
+                continue
+            try:
+                stat = entry.stat()
+                yield entry.name, stat.st_size, stat.st_mtime
+            except OSError:
+                # 扫描期间被删除的文件直接跳过
+                continue
+
+
+class DlcFileRecord:
+    """索引中的单个DLC文件"""
+
+    __slots__ = ('name', 'location', 'path', 'size', 'mtime', 'dlc_info')
+
+    def __init__(self, name, location, path, size=0, mtime=0.0, dlc_info=None):
+        self.name = name
+        self.location = location
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.dlc_info = dlc_info
+
+    def __repr__(self):
+        return f"DlcFileRecord({self.name!r}, {self.location!r})"
+
+
+class DlcRepository:
+    """DLC文件索引 - 所有页面和操作都从这里读取，移动文件后原地更新"""
+
+    def __init__(self, catalog_lookup=None):
+        """
+        初始化DLC仓库
+
+        Args:
+            catalog_lookup: 根据文件名查找DLC信息的函数，找不到时返回None
+        """
+        self.logger = logging.getLogger(__name__)
+        self.catalog_lookup = catalog_lookup
+        self.game_path = ""
+
+        # 位置 -> {文件名 -> DlcFileRecord}（同名文件可能同时存在于游戏目录和temp_dlcs中）
+        self._records = {INSTALLED: {}, PARKED: {}}
+        # 已完成扫描的位置
+        self._loaded = set()
+
+    def set_game_path(self, game_path):
+        """
+        设置游戏路径，路径变化时清空索引
+
+        Returns:
+            bool: 路径是否发生了变化
+        """
+        game_path = game_path or ""
+        if game_path == self.game_path:
+            return False
+
+        self.game_path = game_path
+        for records in self._records.values():
+            records.clear()
+        self._loaded.clear()
+        self.logger.info(f"DLC索引已切换到游戏路径: {game_path}")
+        return True
+
+    @property
+    def temp_dir(self):
+        """temp_dlcs文件夹路径"""
+        return os.path.join(self.game_path, TEMP_DIR_NAME) if self.game_path else ""
+
+    def directory(self, location):
+        """获取指定位置对应的目录"""
+        return self.game_path if location == INSTALLED else self.temp_dir
+
+    def is_loaded(self, location):
+        """指定位置是否已扫描过"""
+        return location in self._loaded
+
+    def invalidate(self, location=None):
+        """标记索引需要重新扫描（不传location时全部失效）"""
+        locations = [location] if location else [INSTALLED, PARKED]
+        for loc in locations:
+            self.clear_location(loc)
+
+    def clear_location(self, location):
+        """清空指定位置的索引"""
+        self._records[location] = {}
+        self._loaded.discard(location)
+
+    def add_entries(self, location, entries):
+        """
+        把扫描结果加入索引
+
+        Args:
+            location: INSTALLED 或 PARKED
+            entries: (文件名, 大小, 修改时间) 元组列表
+
+        Returns:
+            list: 新建的DlcFileRecord列表
+        """
+        directory = self.directory(location)
+        location_records = self._records[location]
+        records = []
+        for name, size, mtime in entries:
+            record = DlcFileRecord(name, location, os.path.join(directory, name), size, mtime,
+                                   self._lookup(name))
+            location_records[name] = record
+            records.append(record)
+        return records
+
+    def mark_loaded(self, location):
+        """标记指定位置扫描完成"""
+        self._loaded.add(location)
+
+    def scan(self, location):
+        """同步扫描指定位置并重建该位置的索引"""
+        self.clear_location(location)
+        directory = self.directory(location)
+        if directory and os.path.isdir(directory):
+            self.add_entries(location, iter_dlc_entries(directory))
+        self.mark_loaded(location)
+        self.logger.info(f"DLC索引扫描完成: {directory} ({len(self.names(location))} 个文件)")
+
+    def ensure_loaded(self, location):
+        """确保指定位置已扫描（未扫描时同步扫描一次）"""
+        if not self.is_loaded(location):
+            self.scan(location)
+
+    def files(self, location):
+        """获取指定位置的所有DLC文件记录（按文件名排序）"""
+        return sorted(self._records[location].values(), key=lambda record: record.name)
+
+    def names(self, location):
+        """获取指定位置的所有DLC文件名（按文件名排序）"""
+        return sorted(self._records[location])
+
+    def get(self, name, location):
+        """根据位置和文件名获取索引记录"""
+        return self._records[location].get(name)
+
+    def record_move(self, name, location):
+        """
+        文件从另一个位置移动到location后原地更新索引（源位置的记录对象移到目标位置继续使用）
+
+        Args:
+            name: DLC文件名
+            location: 文件移动后的位置
+
+        Returns:
+            DlcFileRecord: 更新后的记录
+        """
+        record = self._records[other_location(location)].pop(name, None)
+        path = os.path.join(self.directory(location), name)
+        try:
+            stat = os.stat(path)
+            return self._upsert(name, location, stat.st_size, stat.st_mtime, record)
+        except OSError as e:
+            self.logger.warning(f"更新DLC索引时读取文件信息失败 {path}: {e}")
+            return self._upsert(name, location,
+                                record.size if record else 0, record.mtime if record else 0.0, record)
+
+    def refresh_file(self, name, location):
+        """
+        重新检查单个文件在指定位置的磁盘状态并更新索引（该位置尚未扫描时不检查）
+
+        Returns:
+            DlcFileRecord或None: 文件在该位置的当前记录，不存在时返回None
+        """
+        if not self.is_loaded(location):
+            return self.get(name, location)
+        try:
+            stat = os.stat(os.path.join(self.directory(location), name))
+        except OSError:
+            self._records[location].pop(name, None)
+            return None
+        return self._upsert(name, location, stat.st_size, stat.st_mtime)
+
+    def _upsert(self, name, location, size, mtime, record=None):
+        """
+        新建或原地更新索引记录
+
+        Args:
+            record: 从其他位置移过来的记录，目标位置没有同名记录时复用
+        """
+        location_records = self._records[location]
+        record = location_records.get(name) or record
+        if record is None:
+            record = DlcFileRecord(name, location, "", dlc_info=self._lookup(name))
+        location_records[name] = record
+
+        record.location = location
+        record.path = os.path.join(self.directory(location), name)
+        record.size = size
+        record.mtime = mtime
+        return record
+
+    def _lookup(self, name):
+        """查找文件对应的DLC信息"""
+        if self.catalog_lookup is None:
+            return None
+        return self.catalog_lookup(name)
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+DLC搜索模块 - DlcSearchIndex
+预先把DLC名称、文件名和DLC ID规范化并拆分为词元，
+按精确、前缀、子串、模糊（子序列/单字符拼写错误）的顺序给匹配结果打分
+"""
+
+import os
+import re
+import unicodedata
+
+
+# 单个搜索词的匹配得分（越精确越高，0表示不匹配）
+SCORE_EXACT = 100       # 与某个词元完全相同（含DLC ID）
+SCORE_PREFIX = 80       # 某个词元的前缀
+SCORE_SUBSTRING = 60    # 名称或文件名的子串
+SCORE_TYPO = 40         # 与某个词元只差一个字符
+SCORE_FUZZY = 20        # 按顺序出现在名称或文件名中（如"balkw" -> "balkan_w"）
+# 整个搜索文本（去掉分隔符后）连续出现时的额外得分
+SCORE_PHRASE_BONUS = 20
+
+# 模糊匹配的最短搜索词长度，太短时几乎所有DLC都能匹配
+FUZZY_MIN_LENGTH = 3
+
+# 分隔符（空格、下划线、标点）把文本拆分为词元，中文按连续字符作为一个词元
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def normalize(text):
+    """规范化文本：全角转半角、统一大小写"""
+    return unicodedata.normalize("NFKC", text or "").casefold()
+
+
+def tokenize(text):
+    """把文本拆分为规范化的词元列表"""
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def parse_query(text):
+    """
+    解析搜索文本
+
+    Args:
+        text: 搜索框中的文本
+
+    Returns:
+        tuple: 规范化的搜索词（去重并保持顺序），空文本返回空元组
+    """
+    return tuple(dict.fromkeys(tokenize(text)))
+
+
+def _is_subsequence(term, text):
+    """term中的字符是否按顺序出现在text中"""
+    it = iter(text)
+    return all(char in it for char in term)
+
+
+def _within_one_edit(a, b):
+    """两个字符串是否只差一次插入、删除、替换或相邻交换"""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diff = [i for i in range(la) if a[i] != b[i]]
+        if len(diff) == 1:
+            return True
+        return (len(diff) == 2 and diff[1] == diff[0] + 1
+                and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]])
+    if la > lb:
+        a, b = b, a
+    # a比b少一个字符：跳过b中第一个不同的字符后其余部分应相同
+    for i in range(len(a)):
+        if a[i] != b[i]:
+            return a[i:] == b[i + 1:]
+    return True
+
+
+class SearchKey:
+    """单个DLC文件的预计算搜索数据"""
+
+    __slots__ = ('tokens', 'text', 'compact')
+
+    def __init__(self, name="", file_name="", dlc_id=0):
+        """
+        Args:
+            name: 目录中的DLC名称
+            file_name: DLC文件名（去掉扩展名后参与匹配）
+            dlc_id: DLC ID，0表示目录中没有该DLC
+        """
+        stem = os.path.splitext(file_name)[0]
+        parts = [name, stem]
+        if dlc_id:
+            parts.append(str(dlc_id))
+        # 词元（去重），用于精确、前缀和拼写错误匹配
+        self.tokens = tuple(dict.fromkeys(tokenize(" ".join(parts))))
+        # 规范化的完整文本，用于子串匹配
+        self.text = " ".join(normalize(part) for part in parts)
+        # 去掉分隔符的文本，用于模糊匹配和整句匹配
+        self.compact = "".join(self.tokens)
+
+    def term_score(self, term):
+        """单个搜索词的得分，不匹配时返回0"""
+        prefix = False
+        for token in self.tokens:
+            if token == term:
+                return SCORE_EXACT
+            if token.startswith(term):
+                prefix = True
+        if prefix:
+            return SCORE_PREFIX
+        if term in self.text:
+            return SCORE_SUBSTRING
+        # 数字（如DLC ID）只做精确、前缀和子串匹配
+        if len(term) < FUZZY_MIN_LENGTH or term.isdigit():
+            return 0
+        if any(len(token) > 3 and _within_one_edit(term, token) for token in self.tokens):
+            return SCORE_TYPO
+        if _is_subsequence(term, self.compact):
+            return SCORE_FUZZY
+        return 0
+
+    def score(self, terms):
+        """
+        多个搜索词的总得分（所有搜索词都必须匹配）
+
+        Args:
+            terms: parse_query返回的搜索词
+
+        Returns:
+            int: 得分，不匹配时返回0
+        """
+        total = 0
+        for term in terms:
+            term_score = self.term_score(term)
+            if not term_score:
+                return 0
+            total += term_score
+        if len(terms) > 1 and "".join(terms) in self.compact:
+            total += SCORE_PHRASE_BONUS
+        return total
+
+
+class DlcSearchIndex:
+    """按文件名索引的搜索数据 - 目录中的文件启动时预先建立，未知文件首次搜索时建立"""
+
+    def __init__(self, catalog=()):
+        """
+        初始化搜索索引
+
+        Args:
+            catalog: DlcCatalog（或DlcEntry的可迭代对象）
+        """
+        # 小写文件名 -> SearchKey
+        self._keys = {}
+        for entry in catalog:
+            for file_name in entry.files:
+                self._keys.setdefault(file_name.lower(),
+                                      SearchKey(entry.name, file_name, entry.dlc_id))
+
+    def key_for(self, file_name):
+        """获取文件的搜索数据（不在目录中的文件只按文件名匹配）"""
+        lower = file_name.lower()
+        key = self._keys.get(lower)
+        if key is None:
+            key = self._keys[lower] = SearchKey(file_name=file_name)
+        return key
+
+    def score(self, file_name, terms):
+        """
+        文件与搜索词的匹配得分
+
+        Args:
+            file_name: DLC文件名
+            terms: parse_query返回的搜索词，为空时所有文件都匹配
+
+        Returns:
+            int: 得分，不匹配时返回0
+        """
+        if not terms:
+            return 1
+        return self.key_for(file_name).score(terms)
+
+    def search(self, file_names, text):
+        """
+        搜索文件
+
+        Args:
+            file_names: 要搜索的文件名
+            text: 搜索文本
+
+        Returns:
+            list: 匹配的文件名，按得分从高到低、文件名升序排列
+        """
+        terms = parse_query(text)
+        scored = [(self.score(name, terms), name) for name in file_names]
+        return [name for score, name in sorted(scored, key=lambda item: (-item[0], item[1])) if score]
+
+    def __len__(self):
+        return len(self._keys)
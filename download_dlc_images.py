@@ -7,11 +7,12 @@ DLC图片下载脚本
 
 import os
 import sys
-import json
 import requests
 from pathlib import Path
 from urllib.parse import urlparse
 
+from dlc_catalog import DlcCatalog
+
 def download_image(url, save_path, dlc_name):
     """
     下载单个图片
@@ -65,8 +66,7 @@ def main():
     
     print(f"\n读取DLC信息: {dlcs_info_path}")
     try:
-        with open(dlcs_info_path, 'r', encoding='utf-8') as f:
-            dlcs_info = json.load(f)
+        dlcs_info = DlcCatalog.from_file(dlcs_info_path)
     except Exception as e:
         print(f"错误: 读取DLC信息失败: {e}")
         return False
@@ -87,9 +87,9 @@ def main():
     skipped_count = 0
     
     for i, dlc in enumerate(dlcs_info, 1):
-        dlc_name = dlc.get('name', 'Unknown')
-        dlc_id = dlc.get('dlc_id', 0)
-        header_image = dlc.get('header_image', '')
+        dlc_name = dlc.name or 'Unknown'
+        dlc_id = dlc.dlc_id
+        header_image = dlc.header_image
         
         print(f"\n[{i}/{len(dlcs_info)}] {dlc_name} (ID: {dlc_id})")
         
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+JSON预编译缓存 - json_cache
+把解析（并建立索引）后的JSON数据以pickle格式缓存在源文件旁边，启动时跳过JSON解析
+"""
+
+import os
+import json
+import pickle
+import hashlib
+import logging
+
+
+# 缓存文件后缀（dlcs_info.json -> dlcs_info.json.cache）
+CACHE_SUFFIX = ".cache"
+# 缓存格式版本，头部或序列化方式变化时递增
+CACHE_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+def cache_path_for(path):
+    """获取JSON文件对应的缓存文件路径"""
+    return f"{os.fspath(path)}{CACHE_SUFFIX}"
+
+
+def load_cached_json(path, build=None, tag=""):
+    """
+    通过预编译缓存加载JSON文件
+
+    缓存分为头部和数据两部分：头部记录源文件的大小、修改时间和哈希。
+    大小和修改时间都一致时直接读取数据；只有修改时间不同（如重新安装、复制）时
+    再比较内容哈希，一致则继续使用缓存。
+
+    Args:
+        path: JSON文件路径
+        build: 把解析后的JSON转换为要缓存的对象的函数（如建立索引），为None时缓存原始数据
+        tag: 缓存内容标识，build的结果结构变化时应修改，避免读到旧格式
+
+    Returns:
+        build(解析后的JSON) 的结果
+
+    Raises:
+        OSError: 源文件不存在或无法读取
+        json.JSONDecodeError: 源文件格式错误
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    cache_path = cache_path_for(path)
+
+    raw = None
+    try:
+        with open(cache_path, 'rb') as f:
+            header = pickle.load(f)
+            if (header.get('version') == CACHE_VERSION and header.get('tag') == tag
+                    and header.get('size') == stat.st_size):
+                if header.get('mtime_ns') == stat.st_mtime_ns:
+                    return pickle.load(f)
+
+                with open(path, 'rb') as source:
+                    raw = source.read()
+                if header.get('hash') == _hash(raw):
+                    data = pickle.load(f)
+                    _write_cache(cache_path, stat, raw, data, tag)
+                    return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # 缓存损坏或版本不兼容时重新解析
+        logger.warning(f"读取缓存失败，重新解析JSON: {cache_path}: {e}")
+
+    if raw is None:
+        with open(path, 'rb') as source:
+            raw = source.read()
+    data = json.loads(raw.decode('utf-8'))
+    if build is not None:
+        data = build(data)
+
+    _write_cache(cache_path, stat, raw, data, tag)
+    return data
+
+
+def _hash(raw):
+    """计算源文件内容哈希"""
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _write_cache(cache_path, stat, raw, data, tag):
+    """写入缓存（先写临时文件再替换），安装目录不可写时静默跳过"""
+    header = {
+        'version': CACHE_VERSION,
+        'tag': tag,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'hash': _hash(raw),
+    }
+    temp_path = f"{cache_path}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        logger.debug(f"写入缓存失败: {cache_path}: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -10,6 +10,8 @@ import sys
 from pathlib import Path
 import logging
 
+from json_cache import load_cached_json
+
 
 class LanguageManager:
     """语言管理器类"""
@@ -74,8 +76,7 @@ class LanguageManager:
             return False
         
         try:
-            with open(language_file, 'r', encoding='utf-8') as f:
-                self.translations = json.load(f)
+            self.translations = load_cached_json(language_file, tag="language:1")
             
             self.current_language = language_code
             self.logger.info(f"语言文件加载成功: {language_code}")
@@ -13,18 +13,29 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# 启动分析器最先导入，时间线从这里开始（--profile-startup开启）
+from startup_profiler import get_startup_profiler, parse_profile_arg
+
+profiler = get_startup_profiler()
+trace_file = parse_profile_arg()
+if trace_file:
+    profiler.enable(trace_file)
+
 try:
-    from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtCore import Qt
-    from PyQt6.QtGui import QIcon
+    with profiler.phase("import PyQt6", "import"):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtGui import QIcon
 except ImportError as e:
     print(f"错误: 无法导入PyQt6。请先安装依赖: pip install -r requirements.txt")
     print(f"具体错误: {e}")
     sys.exit(1)
 
-from ui.MainWindow import MainWindow
-from config import Config
-from utils import setup_logging
+with profiler.phase("import ui.MainWindow", "import"):
+    from ui.MainWindow import MainWindow
+with profiler.phase("import config/utils", "import"):
+    from config import Config
+    from utils import setup_logging
 
 
 def main():
@@ -36,10 +47,11 @@ def main():
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     
     # 创建QApplication实例
-    app = QApplication(sys.argv)
-    app.setApplicationName("ETS2 DLC Tools")
-    app.setApplicationVersion("1.0.0")
-    app.setOrganizationName("ETS2DLCTools")
+    with profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
+        app.setApplicationName("ETS2 DLC Tools")
+        app.setApplicationVersion("1.0.0")
+        app.setOrganizationName("ETS2DLCTools")
     
     # 设置应用程序图标（如果存在）
     icon_path = project_root / "resources" / "icon.ico"
@@ -57,21 +69,27 @@ def main():
         print(f"警告: 图标文件不存在: {icon_path}")
     
     # 初始化配置
-    config = Config()
+    with profiler.phase("Config"):
+        config = Config()
     
     # 设置日志 - 使用配置文件中的日志设置
-    log_config = config.get('logging', {})
-    setup_logging(
-        level=log_config.get('level', 'INFO'),
-        log_file=log_config.get('file', 'logs/app.log'),
-        max_size=log_config.get('max_size', 10485760),
-        backup_count=log_config.get('backup_count', 5)
-    )
+    with profiler.phase("setup_logging"):
+        log_settings = config.settings.logging
+        setup_logging(
+            level=log_settings.level,
+            log_file=log_settings.file,
+            max_size=log_settings.max_size,
+            backup_count=log_settings.backup_count
+        )
     
     try:
         # 创建并显示主窗口
-        main_window = MainWindow(config)
-        main_window.show()
+        with profiler.phase("MainWindow"):
+            main_window = MainWindow(config)
+        # 首次绘制完成后写出启动时间线
+        profiler.watch_first_paint(main_window)
+        with profiler.phase("MainWindow.show"):
+            main_window.show()
         
     # 进入事件循环
         sys.exit(app.exec())
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+绘制性能统计模块 - PaintProfiler
+记录列表视图每帧的绘制耗时、重绘次数、布局耗时以及平滑滚动期间的丢帧，
+用于对比渲染改动前后的效果（默认关闭，通过环境变量或配置开启）
+"""
+
+import os
+import time
+import logging
+
+
+# 开启统计的环境变量（值为1/true/yes/on时开启）
+PAINT_STATS_ENV = "ETS2_DLC_PAINT_STATS"
+# 开启统计的配置项
+PAINT_STATS_SETTING = "app.paint_stats"
+
+# 绘制耗时直方图的区间上限（毫秒），最后一个区间没有上限
+HISTOGRAM_BOUNDS = (1, 2, 4, 8, 16, 33, 50, 100)
+
+# 目标帧间隔（60fps）
+FRAME_INTERVAL_MS = 1000 / 60
+
+
+def paint_stats_enabled(config=None):
+    """
+    是否开启绘制统计（环境变量优先于配置）
+
+    Args:
+        config: Config实例或字典，可选
+    """
+    value = os.environ.get(PAINT_STATS_ENV)
+    if value is not None:
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    if config is not None:
+        return bool(config.get(PAINT_STATS_SETTING, False))
+    return False
+
+
+class PaintProfiler:
+    """单个视图的绘制统计"""
+
+    def __init__(self, name):
+        """
+        Args:
+            name: 视图名称（用于日志）
+        """
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        """清空统计数据"""
+        self.frames = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.layouts = 0
+        self.layout_ms = 0.0
+        self.scrolls = 0
+        self.scroll_frames = 0
+        self.dropped_frames = 0
+
+        self._frame_start = None
+        self._scrolling = False
+        self._last_scroll_frame = None
+        self._scroll_start = (0, 0)
+
+    def begin_frame(self):
+        """一帧绘制开始"""
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """一帧绘制结束，记录耗时"""
+        if self._frame_start is None:
+            return
+        now = time.perf_counter()
+        duration = (now - self._frame_start) * 1000
+        self._frame_start = None
+
+        self.frames += 1
+        self.total_ms += duration
+        self.max_ms = max(self.max_ms, duration)
+        self.histogram[self._bucket(duration)] += 1
+
+        if self._scrolling:
+            self.scroll_frames += 1
+            # 与上一帧的间隔超过1.5个目标帧间隔时，按缺少的帧数计为丢帧
+            if self._last_scroll_frame is not None:
+                gap = (now - self._last_scroll_frame) * 1000
+                if gap > FRAME_INTERVAL_MS * 1.5:
+                    self.dropped_frames += round(gap / FRAME_INTERVAL_MS) - 1
+            self._last_scroll_frame = now
+
+    def record_layout(self, duration_ms):
+        """记录一次项目布局（视图延迟布局定时器）的耗时，不足0.1ms的定时器事件忽略"""
+        if duration_ms < 0.1:
+            return
+        self.layouts += 1
+        self.layout_ms += duration_ms
+
+    def scroll_started(self):
+        """平滑滚动动画开始"""
+        self._scrolling = True
+        self._last_scroll_frame = time.perf_counter()
+        self._scroll_start = (self.scroll_frames, self.dropped_frames)
+
+    def scroll_finished(self):
+        """平滑滚动动画结束，记录本次滚动的帧数和丢帧数"""
+        if not self._scrolling:
+            return
+        self._scrolling = False
+        self.scrolls += 1
+        frames = self.scroll_frames - self._scroll_start[0]
+        dropped = self.dropped_frames - self._scroll_start[1]
+        self.logger.debug(f"[{self.name}] 滚动动画: {frames} 帧, 丢帧 {dropped}")
+
+    def average_ms(self):
+        """平均每帧绘制耗时"""
+        return self.total_ms / self.frames if self.frames else 0.0
+
+    def summary(self):
+        """单行摘要（用于界面上的统计浮层）"""
+        return (f"绘制 {self.frames} 次  平均 {self.average_ms():.1f}ms  最大 {self.max_ms:.1f}ms  "
+                f"丢帧 {self.dropped_frames}/{self.scroll_frames}")
+
+    def report(self):
+        """多行统计报告（包含绘制耗时直方图）"""
+        lines = [f"[{self.name}] 绘制统计: {self.summary()}"]
+        if self.layouts:
+            lines.append(f"  布局 {self.layouts} 次, 平均 {self.layout_ms / self.layouts:.1f}ms")
+        lines.append(f"  平滑滚动 {self.scrolls} 次, 滚动期间 {self.scroll_frames} 帧, 丢帧 {self.dropped_frames}")
+        peak = max(self.histogram) or 1
+        lower = 0
+        for bound, count in zip(HISTOGRAM_BOUNDS + (None,), self.histogram):
+            label = f"{lower:>3}-{bound:<3}ms" if bound is not None else f"{lower:>3}+    ms"
+            bar = "#" * round(30 * count / peak)
+            lines.append(f"  {label} {count:>6} {bar}")
+            lower = bound
+        return "\n".join(lines)
+
+    def log_report(self):
+        """把统计报告写入日志"""
+        if self.frames:
+            self.logger.info(self.report())
+
+    def _bucket(self, duration):
+        for i, bound in enumerate(HISTOGRAM_BOUNDS):
+            if duration < bound:
+                return i
+        return len(HISTOGRAM_BOUNDS)
@@ -23,8 +23,9 @@ include_files = [
     "dlcs_info.json",        # DLC数据文件 - 必需
     "ui/",                   # 界面文件 - 必需
     "logs/",                 # 日志目录 - 必需
-    "resources/",            # 资源文件（图标、DLC图片等）- 必需
-    "language/"              # 语言文件 - 必需（用于多语言支持）
+    "resources/",            # 资源文件（图标、DLC图片、build_thumbnail_atlas.py生成的图集）- 必需
+    "language/",             # 语言文件 - 必需（用于多语言支持）
+    "themes/"                # 主题文件 - 必需（样式模板和浅色/深色主题变量）
 ]
 
 # 需要包含的Python包
@@ -33,6 +34,7 @@ packages = [
     "PIL",
     "requests",
     "colorlog",
+    "watchdog",
     "yaml",
     "pathlib",
     "json",
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+启动性能分析模块 - StartupProfiler
+记录程序启动各阶段（模块导入、QApplication、配置、主窗口构建直到首次绘制）的时间线，
+输出为Chrome Trace格式的JSON（可在chrome://tracing或https://ui.perfetto.dev中查看）
+
+使用: python main.py --profile-startup[=输出文件]
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from functools import wraps
+from contextlib import contextmanager
+
+
+# 命令行参数
+PROFILE_STARTUP_ARG = "--profile-startup"
+# 默认输出文件
+DEFAULT_TRACE_FILE = "logs/startup_trace.json"
+
+
+class StartupProfiler:
+    """启动时间线记录器（未开启时所有记录操作都直接返回）"""
+
+    def __init__(self):
+        # 时间线起点（模块首次导入的时间，main.py在其他导入之前导入本模块）
+        self._origin = time.perf_counter()
+        self.enabled = False
+        self.output_path = None
+        self._events = []
+        self._pid = os.getpid()
+        self._tid = threading.get_ident()
+
+    def enable(self, output_path=DEFAULT_TRACE_FILE):
+        """
+        开启记录
+
+        Args:
+            output_path: 时间线输出文件
+        """
+        self.enabled = True
+        self.output_path = output_path
+
+    def _now_us(self):
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    @contextmanager
+    def phase(self, name, category="startup"):
+        """
+        记录一个阶段（with语句块的耗时），阶段可以嵌套
+
+        Args:
+            name: 阶段名称
+            category: 分类（Chrome Trace的cat字段）
+        """
+        if not self.enabled:
+            yield
+            return
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            self._events.append({
+                "name": name, "cat": category, "ph": "X",
+                "ts": round(start, 1), "dur": round(self._now_us() - start, 1),
+                "pid": self._pid, "tid": self._tid,
+            })
+
+    def mark(self, name, category="startup"):
+        """记录一个时间点"""
+        if not self.enabled:
+            return
+        self._events.append({
+            "name": name, "cat": category, "ph": "i", "s": "g",
+            "ts": round(self._now_us(), 1), "pid": self._pid, "tid": self._tid,
+        })
+
+    def watch_first_paint(self, widget):
+        """
+        监听窗口的首次绘制：记录首次绘制的开始和完成时间，完成后写出时间线
+
+        Args:
+            widget: 主窗口
+        """
+        if not self.enabled:
+            return
+
+        from PyQt6.QtCore import QObject, QEvent, QTimer
+
+        profiler = self
+
+        class FirstPaintFilter(QObject):
+            """首次收到绘制事件时记录并移除自身"""
+
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.Paint:
+                    obj.removeEventFilter(self)
+                    profiler.mark("first paint")
+                    # 本次事件循环处理完绘制后再记录完成时间
+                    QTimer.singleShot(0, profiler.finish)
+                return False
+
+        self._paint_filter = FirstPaintFilter(widget)
+        widget.installEventFilter(self._paint_filter)
+
+    def finish(self):
+        """记录启动完成，写出时间线并停止记录"""
+        if not self.enabled:
+            return
+        self.mark("startup complete")
+        self.write(self.output_path)
+        self.enabled = False
+
+    def write(self, path):
+        """
+        写出Chrome Trace格式的时间线，并把各阶段耗时写入日志
+
+        Args:
+            path: 输出文件路径
+        """
+        logger = logging.getLogger(__name__)
+        trace = {
+            "traceEvents": [
+                {"name": "process_name", "ph": "M", "pid": self._pid, "tid": self._tid,
+                 "args": {"name": "ETS2 DLC Tools"}},
+            ] + self._events,
+            "displayTimeUnit": "ms",
+        }
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(trace, f, ensure_ascii=False, indent=1)
+            logger.info(f"启动时间线已写入: {path}")
+        except Exception as e:
+            logger.error(f"写入启动时间线失败: {e}")
+
+        for event in self._events:
+            if event["ph"] == "X":
+                logger.info(f"启动阶段 {event['name']}: {event['dur'] / 1000:.1f}ms")
+            else:
+                logger.info(f"启动时间点 {event['name']}: {event['ts'] / 1000:.1f}ms")
+
+
+# 全局启动分析器实例
+_startup_profiler = StartupProfiler()
+
+
+def get_startup_profiler():
+    """获取全局启动分析器实例"""
+    return _startup_profiler
+
+
+def parse_profile_arg(argv=None):
+    """
+    解析--profile-startup[=输出文件]参数
+
+    Returns:
+        str或None: 输出文件路径，没有该参数时返回None
+    """
+    for arg in (sys.argv if argv is None else argv)[1:]:
+        if arg == PROFILE_STARTUP_ARG:
+            return DEFAULT_TRACE_FILE
+        if arg.startswith(PROFILE_STARTUP_ARG + "="):
+            return arg.split("=", 1)[1] or DEFAULT_TRACE_FILE
+    return None
+
+
+def startup_phase(name):
+    """把方法的执行记录为启动阶段的装饰器（启动完成后不再记录）"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _startup_profiler.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+"""
+Steam游戏定位模块 - steam_locator
+从注册表（Windows）或常见安装目录（Linux/Proton、macOS）找到Steam，
+读取steamapps/libraryfolders.vdf得到所有游戏库，再读取appmanifest_227300.acf得到
+欧洲卡车模拟2的安装目录，不再逐个探测硬编码的盘符路径；
+各游戏库在守护线程中并行探测，无响应的驱动器不会拖住调用方
+"""
+
+import os
+import sys
+import time
+import queue
+import logging
+import threading
+from pathlib import Path
+
+try:
+    import winreg
+except ImportError:  # 非Windows平台
+    winreg = None
+
+
+# 欧洲卡车模拟2的Steam应用ID
+ETS2_APP_ID = 227300
+# 应用清单中没有installdir时使用的默认目录名
+ETS2_INSTALL_DIR = "Euro Truck Simulator 2"
+# 游戏主程序（相对游戏目录），存在任意一个即认为是有效的游戏目录
+GAME_EXECUTABLES = (
+    ("bin", "win_x64", "eurotrucks2.exe"),
+    ("bin", "linux_x64", "eurotrucks2"),
+)
+
+# 每次查找等待游戏库探测结果的最长时间（秒）
+PROBE_TIMEOUT = 3.0
+
+# Windows注册表中记录Steam安装目录的位置
+STEAM_REGISTRY_KEYS = (
+    ("HKEY_CURRENT_USER", r"Software\Valve\Steam", "SteamPath"),
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\WOW6432Node\Valve\Steam", "InstallPath"),
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\Valve\Steam", "InstallPath"),
+)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_vdf(text):
+    """
+    解析Valve KeyValues（VDF/ACF）文本
+
+    Args:
+        text: 文件内容
+
+    Returns:
+        dict: 嵌套字典，值为字符串或字典（重复的键以最后一个为准）
+
+    Raises:
+        ValueError: 格式错误
+    """
+    root = {}
+    stack = [root]
+    key = None
+    i, length = 0, len(text)
+
+    while i < length:
+        ch = text[i]
+        if ch.isspace():
+            i += 1
+        elif text.startswith("//", i):
+            # 行注释
+            end = text.find("\n", i)
+            i = length if end < 0 else end + 1
+        elif ch == '{':
+            if key is None:
+                raise ValueError(f"位置 {i}: 缺少键名")
+            child = {}
+            stack[-1][key] = child
+            stack.append(child)
+            key = None
+            i += 1
+        elif ch == '}':
+            if key is not None or len(stack) == 1:
+                raise ValueError(f"位置 {i}: 多余的 }}")
+            stack.pop()
+            i += 1
+        else:
+            token, i = _read_token(text, i)
+            if key is None:
+                key = token
+            else:
+                stack[-1][key] = token
+                key = None
+
+    if key is not None or len(stack) != 1:
+        raise ValueError("文件不完整")
+    return root
+
+
+def _read_token(text, i):
+    """读取一个（带引号或不带引号的）字符串，返回 (字符串, 结束位置)"""
+    if text[i] != '"':
+        start = i
+        while i < len(text) and not text[i].isspace() and text[i] not in '{}"':
+            i += 1
+        return text[start:i], i
+
+    chars = []
+    i += 1
+    while i < len(text):
+        ch = text[i]
+        if ch == '"':
+            return "".join(chars), i + 1
+        if ch == '\\' and i + 1 < len(text):
+            i += 1
+            ch = {'n': '\n', 't': '\t'}.get(text[i], text[i])
+        chars.append(ch)
+        i += 1
+    raise ValueError("字符串缺少结束引号")
+
+
+def read_vdf(path):
+    """
+    读取并解析VDF文件
+
+    Returns:
+        dict或None: 文件不存在或格式错误时返回None
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return parse_vdf(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"读取Steam配置文件失败 {path}: {e}")
+        return None
+
+
+def _get_key(data, name):
+    """不区分大小写地获取字典中的键（VDF的键名大小写不统一）"""
+    if not isinstance(data, dict):
+        return None
+    if name in data:
+        return data[name]
+    lower = name.lower()
+    for key, value in data.items():
+        if key.lower() == lower:
+            return value
+    return None
+
+
+def _path_key(path):
+    """用于比较路径是否相同的键（解析符号链接，Windows上不区分大小写）"""
+    return os.path.normcase(os.path.realpath(path))
+
+
+def _library_key(path):
+    """用于比较游戏库路径的键（不访问文件系统，游戏库可能位于无响应的网络驱动器上）"""
+    return os.path.normcase(os.path.normpath(str(path)))
+
+
+def _registry_steam_paths():
+    """从Windows注册表读取Steam安装目录"""
+    if winreg is None:
+        return []
+    paths = []
+    for hive_name, sub_key, value_name in STEAM_REGISTRY_KEYS:
+        try:
+            with winreg.OpenKey(getattr(winreg, hive_name), sub_key) as key:
+                value, _ = winreg.QueryValueEx(key, value_name)
+                if value:
+                    paths.append(Path(value))
+        except OSError:
+            continue
+    return paths
+
+
+def find_steam_roots():
+    """
+    查找本机的Steam安装目录（只返回存在steamapps目录的路径，已去重）
+
+    Returns:
+        list: Path列表，按可信程度排序
+    """
+    home = Path.home()
+    if os.name == 'nt':
+        candidates = _registry_steam_paths()
+        # 注册表中没有记录时使用默认安装位置
+        for env in ("ProgramFiles(x86)", "ProgramFiles"):
+            if os.environ.get(env):
+                candidates.append(Path(os.environ[env]) / "Steam")
+    elif sys.platform == 'darwin':
+        candidates = [home / "Library" / "Application Support" / "Steam"]
+    else:
+        # Linux（原生Steam、Flatpak），~/.steam下通常是指向实际目录的符号链接
+        candidates = [
+            home / ".steam" / "steam",
+            home / ".steam" / "root",
+            home / ".local" / "share" / "Steam",
+            home / ".var" / "app" / "com.valvesoftware.Steam" / ".local" / "share" / "Steam",
+        ]
+
+    roots = []
+    seen = set()
+    for path in candidates:
+        try:
+            if not (path / "steamapps").is_dir():
+                continue
+            real = _path_key(path)
+        except OSError:
+            continue
+        if real not in seen:
+            seen.add(real)
+            roots.append(path)
+    return roots
+
+
+def library_folders(steam_root):
+    """
+    读取Steam的所有游戏库
+
+    Args:
+        steam_root: Steam安装目录
+
+    Returns:
+        list: [(游戏库路径, 已安装的应用ID集合或None)]，Steam目录本身总是第一个；
+              旧格式的libraryfolders.vdf没有应用列表，对应的集合为None
+    """
+    steam_root = Path(steam_root)
+    libraries = [(steam_root, None)]
+    data = read_vdf(steam_root / "steamapps" / "libraryfolders.vdf")
+    folders = _get_key(data, "libraryfolders") if data else None
+    if not isinstance(folders, dict):
+        return libraries
+
+    # Steam目录本身也会出现在列表中（可能是符号链接解析后的路径）
+    root_keys = {_library_key(steam_root), _path_key(steam_root)}
+    known = set(root_keys)
+    for index, entry in folders.items():
+        if not index.isdigit():
+            continue
+        if isinstance(entry, dict):
+            # 新格式: "0" { "path" "..." "apps" { "227300" "..." } }
+            path = _get_key(entry, "path")
+            apps = _get_key(entry, "apps")
+            app_ids = set(apps) if isinstance(apps, dict) else None
+        else:
+            # 旧格式: "1" "D:\\SteamLibrary"
+            path, app_ids = entry, None
+        if not path:
+            continue
+
+        key = _library_key(path)
+        if key in known:
+            # 合并Steam目录本身的应用列表
+            if key in root_keys:
+                libraries[0] = (steam_root, app_ids)
+            continue
+        known.add(key)
+        libraries.append((Path(path), app_ids))
+    return libraries
+
+
+def read_app_manifest(library, app_id=ETS2_APP_ID):
+    """
+    读取游戏库中的应用清单
+
+    Returns:
+        dict或None: AppState内容，没有安装该应用时返回None
+    """
+    data = read_vdf(Path(library) / "steamapps" / f"appmanifest_{app_id}.acf")
+    state = _get_key(data, "AppState") if data else None
+    return state if isinstance(state, dict) else None
+
+
+def is_game_directory(path):
+    """检查目录中是否存在游戏主程序"""
+    if not path:
+        return False
+    return any(os.path.isfile(os.path.join(path, *exe)) for exe in GAME_EXECUTABLES)
+
+
+def game_fingerprint(path):
+    """
+    获取游戏目录的指纹（游戏主程序的相对路径、大小和修改时间），用于下次启动时确认目录仍然有效
+
+    Returns:
+        dict或None: 目录中没有游戏主程序时返回None
+    """
+    if not path:
+        return None
+    for exe in GAME_EXECUTABLES:
+        try:
+            stat = os.stat(os.path.join(path, *exe))
+        except OSError:
+            continue
+        return {"exe": "/".join(exe), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return None
+
+
+def verify_game_path(path, fingerprint):
+    """
+    用一次stat检查保存的游戏目录是否仍然有效（游戏主程序的大小和修改时间与指纹一致）
+
+    Args:
+        path: 保存的游戏目录
+        fingerprint: game_fingerprint返回的指纹
+
+    Returns:
+        bool: 是否有效
+    """
+    if not path or not isinstance(fingerprint, dict) or not fingerprint.get("exe"):
+        return False
+    try:
+        stat = os.stat(os.path.join(path, *fingerprint["exe"].split("/")))
+    except OSError:
+        return False
+    return stat.st_size == fingerprint.get("size") and stat.st_mtime_ns == fingerprint.get("mtime_ns")
+
+
+def game_library_candidates(app_id=ETS2_APP_ID):
+    """
+    列出所有可能安装了游戏的游戏库（只读取Steam目录中的配置，不访问游戏库本身）
+
+    Returns:
+        list: 游戏库路径列表，应用列表中记录了该游戏的库在前，没有应用列表的库其次
+    """
+    app_key = str(app_id)
+    candidates = []
+    seen = set()
+    for steam_root in find_steam_roots():
+        try:
+            libraries = library_folders(steam_root)
+        except Exception as e:
+            logger.warning(f"读取Steam游戏库失败 {steam_root}: {e}")
+            continue
+        for library, app_ids in libraries:
+            if app_ids is not None and app_key not in app_ids:
+                continue
+            key = _library_key(library)
+            if key in seen:
+                continue
+            seen.add(key)
+            candidates.append((0 if app_ids is not None else 1, len(candidates), library))
+    return [library for _, _, library in sorted(candidates)]
+
+
+def probe_library(library, app_id=ETS2_APP_ID):
+    """
+    检查游戏库中是否安装了游戏（读取应用清单并确认游戏主程序存在）
+
+    Returns:
+        str或None: 游戏目录
+    """
+    manifest = read_app_manifest(library, app_id)
+    if manifest is None:
+        return None
+    install_dir = _get_key(manifest, "installdir") or ETS2_INSTALL_DIR
+    game_path = os.path.join(library, "steamapps", "common", install_dir)
+    if is_game_directory(game_path):
+        return os.path.normpath(game_path)
+    logger.debug(f"应用清单指向的目录中没有游戏主程序: {game_path}")
+    return None
+
+
+def _probe_worker(library, app_id, results):
+    """探测线程：把 (游戏库, 游戏目录或None) 放入结果队列"""
+    try:
+        game_path = probe_library(library, app_id)
+    except Exception as e:
+        logger.warning(f"探测游戏库失败 {library}: {e}")
+        game_path = None
+    results.put((library, game_path))
+
+
+def _collect_late_results(results, pending, on_late_result):
+    """等待超时后仍在运行的探测，找到游戏时调用回调"""
+    for _ in range(pending):
+        library, game_path = results.get()
+        if game_path:
+            logger.info(f"游戏库 {library} 响应较慢，稍后找到游戏目录: {game_path}")
+            on_late_result(game_path)
+            return
+
+
+def find_game_path(app_id=ETS2_APP_ID, timeout=PROBE_TIMEOUT, on_late_result=None):
+    """
+    查找欧洲卡车模拟2的安装目录
+
+    每个候选游戏库在单独的守护线程中探测，返回最先找到的游戏目录。网络驱动器或休眠的移动硬盘
+    可能长时间无响应，所有探测最多等待timeout秒；之后仍未返回的探测继续在后台运行，
+    找到游戏时在探测线程中调用on_late_result(游戏目录)
+
+    Args:
+        app_id: Steam应用ID
+        timeout: 等待探测结果的最长时间（秒）
+        on_late_result: 超时后才找到游戏时的回调，可选
+
+    Returns:
+        str: 游戏目录，未找到或超时时返回空字符串
+    """
+    candidates = game_library_candidates(app_id)
+    if not candidates:
+        logger.info(f"Steam游戏库中没有找到应用 {app_id}")
+        return ""
+
+    results = queue.Queue()
+    for library in candidates:
+        threading.Thread(target=_probe_worker, args=(library, app_id, results),
+                         name=f"SteamProbe-{library}", daemon=True).start()
+
+    deadline = time.monotonic() + timeout
+    pending = len(candidates)
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            library, game_path = results.get(timeout=remaining)
+        except queue.Empty:
+            break
+        pending -= 1
+        if game_path:
+            logger.info(f"通过Steam游戏库找到游戏目录: {game_path}")
+            return game_path
+
+    if pending:
+        logger.warning(f"{pending} 个游戏库在 {timeout} 秒内没有响应，继续在后台探测")
+        if on_late_result is not None:
+            threading.Thread(target=_collect_late_results, args=(results, pending, on_late_result),
+                             name="SteamProbeLate", daemon=True).start()
+    else:
+        logger.info(f"Steam游戏库中没有找到应用 {app_id}")
+    return ""
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+DLC移动引擎意图日志恢复测试
+
+运行: python -m unittest discover tests
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dlc_mover import DlcMoveEngine, PARTIAL_SUFFIX, RECOVER_REPLAY, RECOVER_ROLLBACK
+
+
+NAME = "dlc_test.scs"
+CONTENT = b"scs" * 1000
+
+
+class RecoverTest(unittest.TestCase):
+    """模拟批量卸载（游戏目录 -> temp_dlcs）中途中断后的恢复"""
+
+    def setUp(self):
+        self.game_dir = tempfile.mkdtemp(prefix="ets2_test_")
+        self.temp_dir = os.path.join(self.game_dir, "temp_dlcs")
+        os.makedirs(self.temp_dir)
+        self.src = os.path.join(self.game_dir, NAME)
+        self.dst = os.path.join(self.temp_dir, NAME)
+        self.engine = DlcMoveEngine(self.temp_dir)
+        self.engine._write_journal([(NAME, self.src, self.dst)])
+
+    def tearDown(self):
+        shutil.rmtree(self.game_dir, ignore_errors=True)
+
+    def write(self, path, content=CONTENT):
+        with open(path, 'wb') as f:
+            f.write(content)
+
+    def assert_finished(self, result, present, absent):
+        """恢复完成：文件只留在一处，没有临时文件，日志已删除"""
+        self.assertEqual(result.failed, [])
+        self.assertTrue(os.path.exists(present))
+        self.assertFalse(os.path.exists(absent))
+        self.assertFalse(os.path.exists(self.src + PARTIAL_SUFFIX))
+        self.assertFalse(os.path.exists(self.dst + PARTIAL_SUFFIX))
+        self.assertFalse(self.engine.has_journal())
+
+    def test_replay_removes_partial(self):
+        """继续完成：删除目标位置的临时文件后重新移动"""
+        self.write(self.src)
+        self.write(self.dst + PARTIAL_SUFFIX, CONTENT[:100])
+        result = self.engine.recover(RECOVER_REPLAY)
+        self.assertEqual(result.moved, [NAME])
+        self.assert_finished(result, self.dst, self.src)
+
+    def test_rollback_removes_partial(self):
+        """回滚：临时文件在日志记录的目标位置（temp_dlcs）旁边，同样要删除"""
+        self.write(self.src)
+        self.write(self.dst + PARTIAL_SUFFIX, CONTENT[:100])
+        result = self.engine.recover(RECOVER_ROLLBACK)
+        self.assertEqual(result.skipped, [(NAME, "already_done")])
+        self.assert_finished(result, self.src, self.dst)
+
+    def test_rollback_after_move(self):
+        """回滚：文件已移动到temp_dlcs时移回游戏目录"""
+        self.write(self.dst)
+        result = self.engine.recover(RECOVER_ROLLBACK)
+        self.assertEqual(result.moved, [NAME])
+        self.assert_finished(result, self.src, self.dst)
+
+    def test_replay_both_copies(self):
+        """继续完成：复制已完成但源文件还没删除时删除源文件"""
+        self.write(self.src)
+        self.write(self.dst)
+        result = self.engine.recover(RECOVER_REPLAY)
+        self.assertEqual(result.moved, [NAME])
+        self.assert_finished(result, self.dst, self.src)
+
+    def test_rollback_both_copies(self):
+        """回滚：两处都有完整文件时删除temp_dlcs中的一份"""
+        self.write(self.src)
+        self.write(self.dst)
+        result = self.engine.recover(RECOVER_ROLLBACK)
+        self.assertEqual(result.moved, [NAME])
+        self.assert_finished(result, self.src, self.dst)
+
+    def test_both_copies_size_mismatch(self):
+        """两处文件大小不一致时保留原样"""
+        self.write(self.src)
+        self.write(self.dst, CONTENT[:100])
+        result = self.engine.recover(RECOVER_REPLAY)
+        self.assertEqual(result.skipped, [(NAME, "size_mismatch")])
+        self.assertTrue(os.path.exists(self.src))
+        self.assertTrue(os.path.exists(self.dst))
+
+    def test_no_journal(self):
+        """没有日志时返回None"""
+        self.engine.recover(RECOVER_REPLAY)
+        self.assertIsNone(self.engine.recover(RECOVER_REPLAY))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+主题管理器 - Theme Manager
+负责加载主题变量文件（themes/light.json、themes/dark.json）并编译样式模板（themes/style.qss），
+编译后的样式表设置到QApplication上，切换主题只需重新设置一次样式表
+"""
+
+import sys
+import time
+import logging
+from pathlib import Path
+from string import Template
+
+from json_cache import load_cached_json
+
+
+# 默认主题
+DEFAULT_THEME = 'light'
+# 样式模板文件名
+STYLE_TEMPLATE_FILE = "style.qss"
+
+
+class ThemeManager:
+    """主题管理器类"""
+
+    def __init__(self, theme_dir=None):
+        """
+        初始化主题管理器
+
+        Args:
+            theme_dir: 主题文件目录路径，默认为当前文件所在目录的themes文件夹
+        """
+        self.logger = logging.getLogger(__name__)
+
+        if theme_dir is None:
+            # 检测是否在打包环境中运行
+            if getattr(sys, 'frozen', False):
+                # 打包后的环境 - 使用可执行文件所在目录
+                base_path = Path(sys.executable).parent
+            else:
+                # 开发环境 - 使用当前文件所在目录
+                base_path = Path(__file__).parent
+
+            self.theme_dir = base_path / "themes"
+        else:
+            self.theme_dir = Path(theme_dir)
+
+        # 支持的主题列表
+        self.supported_themes = ('light', 'dark')
+
+        # 当前已应用的主题
+        self.current_theme = None
+
+        # 样式模板（首次编译时读取）
+        self._template = None
+        # 主题名称 -> 变量字典
+        self._variables = {}
+        # 主题名称 -> 编译后的样式表
+        self._stylesheets = {}
+
+    def normalize(self, theme):
+        """把不支持的主题名称转换为默认主题"""
+        if theme in self.supported_themes:
+            return theme
+        if theme is not None:
+            self.logger.warning(f"不支持的主题: {theme}，使用默认主题")
+        return DEFAULT_THEME
+
+    def colors(self, theme=None):
+        """
+        获取主题变量（颜色）
+
+        Args:
+            theme: 主题名称，默认为当前主题
+
+        Returns:
+            dict: 变量名 -> 颜色值，加载失败时返回空字典
+        """
+        theme = self.normalize(theme or self.current_theme)
+        variables = self._variables.get(theme)
+        if variables is None:
+            theme_file = self.theme_dir / f"{theme}.json"
+            try:
+                variables = load_cached_json(theme_file, tag="theme:1")
+            except Exception as e:
+                self.logger.error(f"加载主题文件失败 {theme_file}: {e}")
+                return {}
+            self._variables[theme] = variables
+        return variables
+
+    def stylesheet(self, theme):
+        """
+        获取编译后的样式表（每个主题只编译一次）
+
+        Args:
+            theme: 主题名称
+
+        Returns:
+            str或None: 样式表，模板或变量缺失时返回None
+        """
+        theme = self.normalize(theme)
+        compiled = self._stylesheets.get(theme)
+        if compiled is not None:
+            return compiled
+
+        try:
+            if self._template is None:
+                template_file = self.theme_dir / STYLE_TEMPLATE_FILE
+                self._template = Template(template_file.read_text(encoding='utf-8'))
+            compiled = self._template.substitute(self.colors(theme))
+        except KeyError as e:
+            self.logger.error(f"主题 {theme} 缺少样式变量: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"编译主题样式失败 {theme}: {e}")
+            return None
+
+        self._stylesheets[theme] = compiled
+        return compiled
+
+    def apply(self, app, theme):
+        """
+        把主题样式表设置到QApplication上（已是当前主题时不重复设置）
+
+        Args:
+            app: QApplication实例
+            theme: 主题名称
+
+        Returns:
+            bool: 是否应用成功
+        """
+        theme = self.normalize(theme)
+        if theme == self.current_theme:
+            return True
+
+        start = time.perf_counter()
+        compiled = self.stylesheet(theme)
+        if compiled is None:
+            return False
+
+        app.setStyleSheet(compiled)
+        self.current_theme = theme
+        self.logger.info(f"已应用主题: {theme} ({(time.perf_counter() - start) * 1000:.1f}ms)")
+        return True
+
+
+# 全局主题管理器实例
+_theme_manager = None
+
+
+def get_theme_manager():
+    """获取全局主题管理器实例"""
+    global _theme_manager
+    if _theme_manager is None:
+        _theme_manager = ThemeManager()
+    return _theme_manager
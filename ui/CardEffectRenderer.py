@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+卡片动画效果渲染器 - CardEffectRenderer
+把悬停发光和点击波纹按卡片尺寸和动画进度预先绘制为QPixmap，
+动画播放时只需贴图，不再每帧进行抗锯齿的圆角矩形绘制
+"""
+
+from PyQt6.QtCore import Qt, QRect, QSize
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap
+
+
+# 每种效果缓存的帧数（动画进度按帧数量化）
+HOVER_FRAMES = 12
+RIPPLE_FRAMES = 8
+
+# 效果超出卡片边缘的距离（发光最多6px，波纹最多20px）
+HOVER_MARGIN = 6
+RIPPLE_MARGIN = 20
+
+
+def ease_out_cubic(t):
+    """三次缓动函数（减速）"""
+    return 1 - pow(1 - t, 3)
+
+
+class CardEffectRenderer:
+    """按 (效果, 卡片尺寸, 帧) 缓存的动画效果贴图"""
+
+    def __init__(self, device_pixel_ratio=1.0):
+        """
+        初始化渲染器
+
+        Args:
+            device_pixel_ratio: 屏幕的设备像素比，高分屏上按物理像素绘制贴图
+        """
+        self.device_pixel_ratio = device_pixel_ratio
+        # (效果, 宽, 高, 帧) -> QPixmap
+        self._frames = {}
+
+    def set_device_pixel_ratio(self, ratio):
+        """设备像素比变化（窗口移动到其他屏幕）时丢弃已缓存的贴图"""
+        if ratio != self.device_pixel_ratio:
+            self.device_pixel_ratio = ratio
+            self._frames.clear()
+
+    def hover_frame(self, size, progress):
+        """
+        悬停效果贴图（外发光、半透明遮罩和边框）
+
+        Args:
+            size: 卡片尺寸（QSize）
+            progress: 动画进度 0~1
+
+        Returns:
+            (QPixmap或None, 边距): 贴图需要绘制在卡片左上角向外偏移边距的位置，进度为0时返回None
+        """
+        frame = round(max(0.0, min(1.0, progress)) * HOVER_FRAMES)
+        if frame == 0:
+            return None, HOVER_MARGIN
+        key = ('hover', size.width(), size.height(), frame)
+        pixmap = self._frames.get(key)
+        if pixmap is None:
+            pixmap = self._frames[key] = self._render_hover(size, frame / HOVER_FRAMES)
+        return pixmap, HOVER_MARGIN
+
+    def ripple_frame(self, size, progress):
+        """
+        点击波纹贴图
+
+        Args:
+            size: 卡片尺寸（QSize）
+            progress: 波纹扩散进度 0~1
+
+        Returns:
+            (QPixmap或None, 边距): 进度为1（波纹已消失）时返回None
+        """
+        frame = round(max(0.0, min(1.0, progress)) * RIPPLE_FRAMES)
+        if frame >= RIPPLE_FRAMES:
+            return None, RIPPLE_MARGIN
+        key = ('ripple', size.width(), size.height(), frame)
+        pixmap = self._frames.get(key)
+        if pixmap is None:
+            pixmap = self._frames[key] = self._render_ripple(size, frame / RIPPLE_FRAMES)
+        return pixmap, RIPPLE_MARGIN
+
+    def clear(self):
+        """清空缓存"""
+        self._frames.clear()
+
+    def _create_pixmap(self, size, margin):
+        """创建透明贴图，返回 (QPixmap, 卡片在贴图中的位置)"""
+        width, height = size.width() + 2 * margin, size.height() + 2 * margin
+        ratio = self.device_pixel_ratio
+        pixmap = QPixmap(QSize(round(width * ratio), round(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap, QRect(margin, margin, size.width(), size.height())
+
+    def _render_hover(self, size, t):
+        pixmap, rect = self._create_pixmap(size, HOVER_MARGIN)
+        painter = QPainter(pixmap)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            progress = ease_out_cubic(t)
+
+            # 动态圆角半径：从12px增大到18px
+            radius = 12 + int(6 * progress)
+
+            # 外发光效果（多层）
+            painter.setPen(Qt.PenStyle.NoPen)
+            for i in range(3):
+                offset = int((3 - i) * 2 * progress)
+                glow_rect = rect.adjusted(-offset, -offset, offset, offset)
+                painter.setBrush(QColor(3, 102, 214, int(30 * progress * (1 - i * 0.3))))
+                painter.drawRoundedRect(glow_rect, radius + offset, radius + offset)
+
+            # 圆角遮罩层（半透明蓝色覆盖）
+            painter.setBrush(QColor(230, 242, 255, int(50 * progress)))
+            painter.drawRoundedRect(rect, radius, radius)
+
+            # 圆角边框
+            border_pen = QPen(QColor(9, 105, 218, int(255 * progress)))
+            border_pen.setWidth(int(3 * progress))
+            painter.setPen(border_pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), radius, radius)
+        finally:
+            painter.end()
+        return pixmap
+
+    def _render_ripple(self, size, t):
+        pixmap, rect = self._create_pixmap(size, RIPPLE_MARGIN)
+        painter = QPainter(pixmap)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(33, 136, 255, int(100 * (1 - t))))
+            ripple_size = int(RIPPLE_MARGIN * t)
+            painter.drawRoundedRect(rect.adjusted(-ripple_size, -ripple_size, ripple_size, ripple_size), 12, 12)
+        finally:
+            painter.end()
+        return pixmap
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+DLC目录监控 - DlcDirectoryWatcher
+使用watchdog监控游戏目录和temp_dlcs，合并并防抖文件事件后通知界面线程
+"""
+
+import os
+import time
+import threading
+import logging
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+from dlc_repository import is_dlc_file_name, TEMP_DIR_NAME
+
+
+class DlcEventHandler(FileSystemEventHandler):
+    """把watchdog事件转换为DLC文件名集合"""
+
+    def __init__(self, callback):
+        """
+        初始化处理器
+
+        Args:
+            callback: 回调函数 (文件名集合, 是否需要重新建立监控)
+        """
+        super().__init__()
+        self.callback = callback
+
+    def on_any_event(self, event):
+        """处理所有文件事件（在watchdog线程中调用）"""
+        paths = [event.src_path]
+        dest_path = getattr(event, 'dest_path', '')
+        if dest_path:
+            paths.append(dest_path)
+
+        if event.is_directory:
+            # temp_dlcs文件夹被创建或移入时需要把它加入监控
+            if event.event_type in ('created', 'moved') and any(
+                    os.path.basename(path) == TEMP_DIR_NAME for path in paths):
+                self.callback(set(), True)
+            return
+
+        names = {os.path.basename(path) for path in paths}
+        names = {name for name in names if is_dlc_file_name(name)}
+        if names:
+            self.callback(names, False)
+
+
+class DlcDirectoryWatcher(QObject):
+    """DLC目录监控器 - 事件在短时间内合并，每个文件只通知一次"""
+
+    # 发生变化的DLC文件名列表（已去重）
+    files_changed = pyqtSignal(list)
+    # 内部信号：watchdog线程通知界面线程有新事件
+    _events_arrived = pyqtSignal()
+
+    def __init__(self, debounce_ms=300, max_delay_ms=2000, parent=None):
+        """
+        初始化监控器
+
+        Args:
+            debounce_ms: 最后一个事件之后等待的时间
+            max_delay_ms: 持续有事件时（如Steam正在写入大文件）最长的通知间隔
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.max_delay = max_delay_ms / 1000.0
+
+        self._observer = None
+        self._directories = []
+        self._watched = []
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._rewatch_needed = False
+        self._burst_started = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._flush)
+        self._events_arrived.connect(self._on_events_arrived)
+
+    def watch(self, directories):
+        """
+        开始监控目录（会替换之前的监控），不存在的目录会被忽略
+
+        Args:
+            directories: 目录列表
+        """
+        self.stop()
+        self._directories = [d for d in directories if d]
+
+        existing = [d for d in self._directories if os.path.isdir(d)]
+        self._watched = existing
+        if not existing:
+            return
+
+        try:
+            observer = Observer()
+            handler = DlcEventHandler(self._on_events)
+            for directory in existing:
+                observer.schedule(handler, directory, recursive=False)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+            self.logger.info(f"开始监控DLC目录: {', '.join(existing)}")
+        except Exception as e:
+            self.logger.error(f"启动DLC目录监控失败: {e}")
+
+    def refresh(self):
+        """之前不存在的目录被创建后重新建立监控"""
+        existing = [d for d in self._directories if os.path.isdir(d)]
+        if existing != self._watched:
+            self.watch(self._directories)
+
+    def stop(self):
+        """停止监控"""
+        if self._observer is None:
+            return
+        try:
+            self._observer.stop()
+            self._observer.join(timeout=1)
+        except Exception as e:
+            self.logger.error(f"停止DLC目录监控失败: {e}")
+        self._observer = None
+
+    def _on_events(self, names, rewatch):
+        """收到文件事件（watchdog线程）"""
+        with self._lock:
+            self._pending |= names
+            self._rewatch_needed = self._rewatch_needed or rewatch
+        self._events_arrived.emit()
+
+    def _on_events_arrived(self):
+        """防抖：每个新事件重新计时，但同一批事件最多等待max_delay"""
+        now = time.monotonic()
+        if not self._timer.isActive():
+            self._burst_started = now
+            self._timer.start()
+        elif now - self._burst_started < self.max_delay:
+            self._timer.start()
+
+    def _flush(self):
+        """把合并后的事件通知出去"""
+        with self._lock:
+            names = sorted(self._pending)
+            self._pending.clear()
+            rewatch = self._rewatch_needed
+            self._rewatch_needed = False
+
+        if rewatch:
+            self.refresh()
+        if names:
+            self.files_changed.emit(names)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+DLC搜索代理模型 - DlcFilterProxyModel
+按DlcSearchIndex的得分过滤并排序DLC列表，源模型插入的新行自动按当前搜索文本过滤
+"""
+
+from PyQt6.QtCore import QSortFilterProxyModel
+
+from dlc_search import parse_query
+from ui.DlcListModel import FILE_NAME_ROLE
+
+
+class DlcFilterProxyModel(QSortFilterProxyModel):
+    """DLC搜索代理模型 - 没有搜索文本时保持源模型的顺序，否则按匹配程度排序"""
+
+    def __init__(self, search_index, parent=None):
+        """
+        初始化代理模型
+
+        Args:
+            search_index: DlcSearchIndex实例
+        """
+        super().__init__(parent)
+        self.search_index = search_index
+        self.setDynamicSortFilter(True)
+
+        self._terms = ()
+        # 文件名 -> 当前搜索词的得分（搜索词变化时清空）
+        self._scores = {}
+
+    def set_query(self, text):
+        """
+        设置搜索文本
+
+        Args:
+            text: 搜索框中的文本
+
+        Returns:
+            bool: 规范化后的搜索词是否变化（未变化时不重新过滤）
+        """
+        terms = parse_query(text)
+        if terms == self._terms:
+            return False
+
+        self._terms = terms
+        self._scores = {}
+        self.invalidate()
+        # 有搜索词时按得分排序，-1恢复源模型的顺序
+        self.sort(0 if terms else -1)
+        return True
+
+    def terms(self):
+        """当前的搜索词"""
+        return self._terms
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._terms:
+            return True
+        return self._score(source_row) > 0
+
+    def lessThan(self, left, right):
+        # 得分高的在前，得分相同时按文件名排序
+        left_score, right_score = self._score(left.row()), self._score(right.row())
+        if left_score != right_score:
+            return left_score > right_score
+        return (left.data(FILE_NAME_ROLE) or "") < (right.data(FILE_NAME_ROLE) or "")
+
+    def _score(self, source_row):
+        name = self.sourceModel().index(source_row, 0).data(FILE_NAME_ROLE)
+        if not name:
+            return 0
+        score = self._scores.get(name)
+        if score is None:
+            score = self._scores[name] = self.search_index.score(name, self._terms)
+        return score
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+DLC卡片委托 - DlcItemDelegate
+绘制DLC网格中的卡片：缩略图、名称以及悬停/选中状态
+"""
+
+from PyQt6.QtCore import Qt, QRect, QRectF, QSize
+from PyQt6.QtGui import QColor, QFont, QIcon, QLinearGradient, QPainter, QPen
+from PyQt6.QtWidgets import QStyle, QStyledItemDelegate
+
+
+# 选中卡片配色（已安装页面蓝色主题，未安装页面绿色主题）
+CARD_THEMES = {
+    'installed': {
+        'selected': ("#2188ff", "#0366d6", "#005cc5"),
+        'selected_border': "#79b8ff",
+        'selected_hover': ("#54a3ff", "#2188ff", "#0366d6"),
+        'selected_hover_border': "#c8e1ff",
+    },
+    'uninstalled': {
+        'selected': ("#66bb6a", "#4caf50", "#43a047"),
+        'selected_border': "#a5d6a7",
+        'selected_hover': ("#81c784", "#66bb6a", "#4caf50"),
+        'selected_hover_border': "#c8e6c9",
+    },
+}
+
+# 未选中卡片的默认配色（浅色主题），界面主题切换时由set_colors替换
+DEFAULT_CARD_COLORS = {
+    'card_top': "#ffffff",
+    'card_bottom': "#fafbfc",
+    'card_border': "#e1e4e8",
+    'card_text': "#24292e",
+    'installed_hover_text': "#0366d6",
+    'uninstalled_hover_text': "#2e7d32",
+}
+
+CARD_RADIUS = 12
+CARD_MARGIN = 3
+CARD_PADDING = 8
+
+
+class DlcItemDelegate(QStyledItemDelegate):
+    """DLC卡片委托"""
+
+    def __init__(self, theme='installed', item_size=QSize(251, 171), icon_size=QSize(240, 120), parent=None):
+        """
+        初始化委托
+
+        Args:
+            theme: CARD_THEMES中的主题名称
+            item_size: 卡片尺寸（网格尺寸减去间距）
+            icon_size: 缩略图尺寸
+        """
+        super().__init__(parent)
+        self.theme_name = theme
+        self.theme = CARD_THEMES[theme]
+        self.item_size = item_size
+        self.icon_size = icon_size
+        self.set_colors(DEFAULT_CARD_COLORS)
+
+    def set_colors(self, colors):
+        """
+        设置未选中卡片的配色（来自界面主题变量，缺少的变量使用默认配色）
+
+        Args:
+            colors: 主题变量字典
+        """
+        def color(key):
+            return QColor(colors.get(key, DEFAULT_CARD_COLORS[key]))
+
+        self._card_stops = (color('card_top'), color('card_bottom'))
+        self._card_border = color('card_border')
+        self._text_color = color('card_text')
+        self._hover_text_color = color(f"{self.theme_name}_hover_text")
+
+    def sizeHint(self, option, index):
+        return self.item_size
+
+    def paint(self, painter, option, index):
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        card = QRectF(option.rect.adjusted(CARD_MARGIN, CARD_MARGIN, -CARD_MARGIN, -CARD_MARGIN))
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # 卡片背景和边框（未选中时的悬停效果由视图绘制）
+        if selected:
+            stops = self.theme['selected_hover'] if hovered else self.theme['selected']
+            border = self.theme['selected_hover_border'] if hovered else self.theme['selected_border']
+            self._draw_card(painter, card, stops, border, 3)
+            text_color = QColor("#ffffff")
+            weight = QFont.Weight.Bold
+        elif hovered:
+            text_color = self._hover_text_color
+            weight = QFont.Weight.DemiBold
+        else:
+            self._draw_card(painter, card, self._card_stops, self._card_border, 2)
+            text_color = self._text_color
+            weight = QFont.Weight.Medium
+
+        content = option.rect.adjusted(CARD_PADDING, CARD_PADDING, -CARD_PADDING, -CARD_PADDING)
+
+        # 缩略图
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(icon, QIcon) and not icon.isNull():
+            icon_rect = QRect(0, 0, self.icon_size.width(), self.icon_size.height())
+            icon_rect.moveCenter(content.center())
+            icon_rect.moveTop(content.top())
+            icon.paint(painter, icon_rect)
+            text_rect = content.adjusted(0, self.icon_size.height() + 4, 0, 0)
+            alignment = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop
+        else:
+            text_rect = content
+            alignment = Qt.AlignmentFlag.AlignCenter
+
+        # 名称
+        font = QFont(option.font)
+        font.setWeight(weight)
+        painter.setFont(font)
+        painter.setPen(text_color)
+        text = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        painter.drawText(text_rect, alignment | Qt.TextFlag.TextWordWrap, text)
+
+        painter.restore()
+
+    def _draw_card(self, painter, rect, stops, border, border_width):
+        """绘制渐变背景的圆角卡片"""
+        gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
+        for i, color in enumerate(stops):
+            gradient.setColorAt(i / (len(stops) - 1), QColor(color))
+        painter.setBrush(gradient)
+        painter.setPen(QPen(QColor(border), border_width))
+        half = border_width / 2
+        painter.drawRoundedRect(rect.adjusted(half, half, -half, -half), CARD_RADIUS, CARD_RADIUS)
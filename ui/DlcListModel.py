@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+DLC列表模型 - DlcListModel
+以DLC索引记录为数据源的列表模型，名称、提示和缩略图都在视图需要时通过角色按需获取
+"""
+
+import bisect
+import logging
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+# 自定义数据角色
+FILE_NAME_ROLE = Qt.ItemDataRole.UserRole          # DLC文件名
+DLC_ID_ROLE = Qt.ItemDataRole.UserRole + 1         # DLC ID（目录中没有时为0）
+RECORD_ROLE = Qt.ItemDataRole.UserRole + 2         # DlcFileRecord
+PREFETCH_ROLE = Qt.ItemDataRole.UserRole + 3       # 预取缩略图（以低于可见项目的优先级排队）
+
+
+def contiguous_ranges(rows):
+    """把已排序的行号分组为连续区间 [(first, last), ...]"""
+    ranges = []
+    for row in rows:
+        if ranges and row == ranges[-1][1] + 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return [tuple(r) for r in ranges]
+
+
+def display_name(record):
+    """列表中显示的名称 - 目录中有DLC信息时显示DLC名称，否则显示文件名"""
+    dlc_info = record.dlc_info
+    if dlc_info and dlc_info.name:
+        return dlc_info.name
+    return record.name
+
+
+class DlcListModel(QAbstractListModel):
+    """按文件名排序的DLC列表模型"""
+
+    def __init__(self, thumbnail_loader=None, placeholder_icon=None, parent=None):
+        """
+        初始化模型
+
+        Args:
+            thumbnail_loader: ThumbnailLoader实例，用于按需加载缩略图
+            placeholder_icon: 缩略图加载完成前显示的图标
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.thumbnail_loader = thumbnail_loader
+        self.placeholder_icon = placeholder_icon
+
+        # 与行一一对应的记录和文件名（文件名用于二分查找）
+        self._records = []
+        self._names = []
+        # DLC ID -> 文件名集合，缩略图加载完成后定位需要重绘的行
+        self._names_by_id = {}
+
+        if thumbnail_loader is not None:
+            thumbnail_loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._records)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._records):
+            return None
+
+        record = self._records[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return display_name(record)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            name = display_name(record)
+            return f"{name}\n文件: {record.name}" if record.dlc_info else record.name
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._thumbnail(record)
+        if role == PREFETCH_ROLE:
+            return self._thumbnail(record, visible=False)
+        if role == FILE_NAME_ROLE:
+            return record.name
+        if role == DLC_ID_ROLE:
+            return self._dlc_id(record)
+        if role == RECORD_ROLE:
+            return record
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def set_records(self, records):
+        """用新的记录列表替换全部内容"""
+        self.beginResetModel()
+        self._records = sorted(records, key=lambda record: record.name)
+        self._names = [record.name for record in self._records]
+        self._names_by_id = {}
+        for record in self._records:
+            self._index_id(record)
+        self.endResetModel()
+
+    def sync(self, records):
+        """
+        与新的记录列表做差异更新：只移除消失的行、插入新增的行，
+        未变化的行保持不动（选择状态、滚动位置和已加载的图标都不受影响）
+
+        Args:
+            records: 当前应显示的全部记录
+
+        Returns:
+            list: 新插入的记录（按文件名排序）
+        """
+        current = {record.name: record for record in records}
+
+        # 移除消失的文件（从后往前，连续的行合并为一次通知）
+        removed_rows = [row for row, name in enumerate(self._names) if name not in current]
+        for first, last in reversed(contiguous_ranges(removed_rows)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for record in self._records[first:last + 1]:
+                self._unindex_id(record)
+            del self._records[first:last + 1]
+            del self._names[first:last + 1]
+            self.endRemoveRows()
+
+        # 保留的文件指向新的记录，只有大小或修改时间变化时才重绘
+        for row, old in enumerate(self._records):
+            record = current[old.name]
+            if record is old:
+                continue
+            self._records[row] = record
+            if (record.size, record.mtime) != (old.size, old.mtime):
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+        # 插入新增的文件（插入位置相同的连续文件合并为一次通知）
+        existing = set(self._names)
+        added = sorted((record for name, record in current.items() if name not in existing),
+                       key=lambda record: record.name)
+        groups = []
+        for record in added:
+            position = bisect.bisect(self._names, record.name)
+            if groups and groups[-1][0] == position:
+                groups[-1][1].append(record)
+            else:
+                groups.append((position, [record]))
+
+        offset = 0
+        for position, group in groups:
+            row = position + offset
+            self.beginInsertRows(QModelIndex(), row, row + len(group) - 1)
+            self._records[row:row] = group
+            self._names[row:row] = [record.name for record in group]
+            for record in group:
+                self._index_id(record)
+            self.endInsertRows()
+            offset += len(group)
+
+        return added
+
+    def insert_records(self, records):
+        """按文件名排序插入记录（已存在的文件会被替换）"""
+        for record in records:
+            row = self.row_of(record.name)
+            if row >= 0:
+                old = self._records[row]
+                self._records[row] = record
+                if (record.size, record.mtime) != (old.size, old.mtime):
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index)
+                continue
+
+            row = bisect.bisect(self._names, record.name)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._records.insert(row, record)
+            self._names.insert(row, record.name)
+            self._index_id(record)
+            self.endInsertRows()
+
+    def remove_name(self, name):
+        """
+        移除单个文件
+
+        Returns:
+            DlcFileRecord或None: 被移除的记录
+        """
+        row = self.row_of(name)
+        if row < 0:
+            return None
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        record = self._records.pop(row)
+        del self._names[row]
+        self._unindex_id(record)
+        self.endRemoveRows()
+        return record
+
+    def update_record(self, record):
+        """文件内容变化（大小、修改时间）后通知视图重绘该行（记录可能已被原地修改，总是发出通知）"""
+        row = self.row_of(record.name)
+        if row < 0:
+            self.insert_records([record])
+            return
+        self._records[row] = record
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def clear(self):
+        """清空模型"""
+        self.set_records([])
+
+    def row_of(self, name):
+        """文件名所在的行，不存在时返回-1"""
+        row = bisect.bisect_left(self._names, name)
+        if row < len(self._names) and self._names[row] == name:
+            return row
+        return -1
+
+    def record(self, row):
+        """获取指定行的记录"""
+        return self._records[row]
+
+    def names(self):
+        """所有文件名（已排序）"""
+        return list(self._names)
+
+    def _dlc_id(self, record):
+        return record.dlc_info.dlc_id if record.dlc_info else 0
+
+    def _index_id(self, record):
+        dlc_id = self._dlc_id(record)
+        if dlc_id:
+            self._names_by_id.setdefault(dlc_id, set()).add(record.name)
+
+    def _unindex_id(self, record):
+        dlc_id = self._dlc_id(record)
+        names = self._names_by_id.get(dlc_id)
+        if names:
+            names.discard(record.name)
+            if not names:
+                del self._names_by_id[dlc_id]
+
+    def _thumbnail(self, record, visible=True):
+        """
+        缩略图 - 已缓存时直接返回，否则请求后台加载并先返回占位图标
+
+        Args:
+            visible: 是否为正在绘制的可见项目（否则为预取）
+        """
+        dlc_id = self._dlc_id(record)
+        if not dlc_id or self.thumbnail_loader is None:
+            return None
+
+        hit, icon = self.thumbnail_loader.cache.cached_icon(dlc_id)
+        if hit:
+            return icon
+        self.thumbnail_loader.request(dlc_id, visible)
+        return self.placeholder_icon
+
+    def _on_thumbnail_ready(self, dlc_id):
+        """缩略图加载完成，重绘对应的行"""
+        for name in self._names_by_id.get(dlc_id, ()):
+            row = self.row_of(name)
+            if row >= 0:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
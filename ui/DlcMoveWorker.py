@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+DLC移动工作器 - DlcMoveWorker
+在线程池中执行批量移动，向界面线程回传进度并支持在文件边界取消
+"""
+
+import time
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from dlc_mover import DlcMoveEngine, MoveResult
+
+
+class DlcMoveSignals(QObject):
+    """移动工作器信号（QRunnable本身不能发射信号）"""
+
+    # 当前文件名, 已完成文件数, 文件总数, 已传输字节数, 总字节数
+    progress = pyqtSignal(str, int, int, 'qint64', 'qint64')
+    # MoveResult
+    finished = pyqtSignal(object)
+    # 错误信息
+    failed = pyqtSignal(str)
+    # 任务结束（完成或出错都会在run返回前最后发出）
+    done = pyqtSignal()
+
+
+class DlcMoveWorker(QRunnable):
+    """后台批量移动任务（或恢复上次中断的批量移动）"""
+
+    def __init__(self, journal_dir, moves, progress_interval=0.1, recover_mode=None):
+        """
+        初始化移动任务
+
+        Args:
+            journal_dir: 意图日志所在目录（temp_dlcs）
+            moves: (文件名, 源路径, 目标路径) 列表
+            progress_interval: 两次进度信号之间的最短间隔（秒），文件完成时总是发送
+            recover_mode: RECOVER_REPLAY或RECOVER_ROLLBACK时不移动moves，而是恢复意图日志中未完成的移动
+        """
+        super().__init__()
+        # 由调用方持有引用直到done信号，避免线程池删除后信号对象失效
+        self.setAutoDelete(False)
+        self.logger = logging.getLogger(__name__)
+        self.journal_dir = journal_dir
+        self.moves = moves
+        self.progress_interval = progress_interval
+        self.recover_mode = recover_mode
+        self.signals = DlcMoveSignals()
+        self._cancelled = False
+        self._last_emit = 0.0
+        self._last_files_done = -1
+
+    def cancel(self):
+        """请求取消（正在移动的文件会完整结束，之后的文件不再移动）"""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        """是否已请求取消"""
+        return self._cancelled
+
+    def _on_progress(self, name, files_done, files_total, bytes_done, bytes_total):
+        """节流进度信号，避免大文件复制时刷屏界面线程"""
+        now = time.monotonic()
+        if files_done == self._last_files_done and now - self._last_emit < self.progress_interval:
+            return
+        self._last_emit = now
+        self._last_files_done = files_done
+        self.signals.progress.emit(name, files_done, files_total, bytes_done, bytes_total)
+
+    def run(self):
+        """执行批量移动或恢复"""
+        try:
+            engine = DlcMoveEngine(self.journal_dir)
+            if self.recover_mode:
+                # 恢复中途不能取消，日志已被其他进程处理时返回空结果
+                result = engine.recover(self.recover_mode, self._on_progress) or MoveResult()
+            else:
+                result = engine.move_batch(self.moves, self._on_progress, self.is_cancelled)
+            self.signals.finished.emit(result)
+        except Exception as e:
+            self.logger.error(f"批量移动DLC文件失败: {e}")
+            self.signals.failed.emit(str(e))
+        finally:
+            self.signals.done.emit()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+DLC扫描工作器 - DlcScanWorker
+在线程池中使用os.scandir扫描目录，分批把DLC文件回传给界面线程
+"""
+
+import os
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from dlc_repository import iter_dlc_entries
+
+
+class DlcScanSignals(QObject):
+    """扫描工作器信号（QRunnable本身不能发射信号）"""
+
+    # 扫描序号, 本批次找到的 (文件名, 大小, 修改时间) 列表
+    batch_found = pyqtSignal(int, list)
+    # 扫描序号, 找到的文件总数
+    finished = pyqtSignal(int, int)
+    # 扫描序号（目录不存在）
+    missing = pyqtSignal(int)
+    # 扫描序号, 错误信息
+    failed = pyqtSignal(int, str)
+    # 任务结束（完成、取消或出错都会在run返回前最后发出）
+    done = pyqtSignal()
+
+
+class DlcScanWorker(QRunnable):
+    """后台DLC目录扫描任务，支持分批回传和取消"""
+
+    def __init__(self, scan_id, directory, location=None, batch_size=16):
+        """
+        初始化扫描任务
+
+        Args:
+            scan_id: 扫描序号，用于界面线程丢弃过期的结果
+            directory: 要扫描的目录
+            location: 目录在DLC索引中对应的位置
+            batch_size: 每批回传的文件数量
+        """
+        super().__init__()
+        # 由调用方持有引用直到done信号，避免线程池删除后信号对象失效
+        self.setAutoDelete(False)
+        self.logger = logging.getLogger(__name__)
+        self.scan_id = scan_id
+        self.directory = directory
+        self.location = location
+        self.batch_size = batch_size
+        self.signals = DlcScanSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """请求取消扫描（在处理下一个目录项时生效）"""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        """是否已请求取消"""
+        return self._cancelled
+
+    def run(self):
+        """执行扫描"""
+        try:
+            if not self.directory or not os.path.isdir(self.directory):
+                if not self._cancelled:
+                    self.signals.missing.emit(self.scan_id)
+                return
+
+            total = 0
+            batch = []
+            for entry in iter_dlc_entries(self.directory):
+                if self._cancelled:
+                    self.logger.info(f"DLC扫描已取消: {self.directory}")
+                    return
+
+                batch.append(entry)
+                total += 1
+                if len(batch) >= self.batch_size:
+                    self.signals.batch_found.emit(self.scan_id, batch)
+                    batch = []
+
+            if self._cancelled:
+                return
+            if batch:
+                self.signals.batch_found.emit(self.scan_id, batch)
+            self.signals.finished.emit(self.scan_id, total)
+
+        except Exception as e:
+            self.logger.error(f"扫描DLC目录失败 {self.directory}: {e}")
+            if not self._cancelled:
+                self.signals.failed.emit(self.scan_id, str(e))
+        finally:
+            self.signals.done.emit()
@@ -10,18 +10,41 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QTreeWidget, QTreeWidgetItem, QSplitter,
                              QMessageBox, QFileDialog, QApplication, QToolButton,
                              QFrame, QScrollArea, QGraphicsDropShadowEffect, QSizePolicy,
-                             QListWidget, QListWidgetItem, QComboBox, QScrollBar)
-from PyQt6.QtCore import (Qt, QTimer, pyqtSignal, QThread, QSize, QUrl,
-                          QPropertyAnimation, QEasingCurve, pyqtProperty)
-from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPixmap, QDesktopServices, QWheelEvent
+                             QListWidgetItem, QComboBox, QScrollBar, QProgressBar,
+                             QListView)
+from PyQt6.QtCore import (Qt, QTimer, pyqtSignal, QThreadPool, QSize, QUrl, QPoint, QRect,
+                          QPropertyAnimation, QEasingCurve, pyqtProperty,
+                          QItemSelectionModel, QModelIndex, QPersistentModelIndex,
+                          QVariantAnimation, QElapsedTimer)
+from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPainter, QDesktopServices, QWheelEvent
 
 import os
 import sys
+import time
 import logging
-import shutil
-import json
+import threading
 from pathlib import Path
+from config import Config
 from language_manager import get_language_manager, tr
+from theme_manager import get_theme_manager
+from utils import create_progress_callback
+from paint_profiler import PaintProfiler, paint_stats_enabled
+from startup_profiler import startup_phase
+from steam_locator import find_game_path, game_fingerprint, verify_game_path, is_game_directory
+from dlc_catalog import DlcCatalog
+from dlc_search import DlcSearchIndex
+from dlc_repository import DlcRepository, INSTALLED, PARKED, TEMP_DIR_NAME
+from dlc_mover import DlcMoveEngine, RECOVER_REPLAY
+from ui.DlcScanWorker import DlcScanWorker
+from ui.DlcDirectoryWatcher import DlcDirectoryWatcher
+from ui.DlcMoveWorker import DlcMoveWorker
+from ui.ThumbnailCache import ThumbnailCache, THUMBNAIL_SIZE
+from ui.ThumbnailAtlas import ThumbnailAtlas, ATLAS_FILE_NAME
+from ui.ThumbnailLoader import ThumbnailLoader, create_placeholder_icon
+from ui.DlcListModel import DlcListModel, FILE_NAME_ROLE, PREFETCH_ROLE
+from ui.DlcFilterProxyModel import DlcFilterProxyModel
+from ui.DlcItemDelegate import DlcItemDelegate
+from ui.CardEffectRenderer import CardEffectRenderer, HOVER_MARGIN, RIPPLE_MARGIN
 
 
 class AnimatedListItem(QListWidgetItem):
@@ -32,8 +55,13 @@ class AnimatedListItem(QListWidgetItem):
         self._opacity = 1.0
 
 
-class SmoothScrollListWidget(QListWidget):
-    """支持平滑滚动和动画效果的QListWidget"""
+# 悬停动画时长、点击动画每个阶段（缩小、波纹扩散）的时长（毫秒）
+HOVER_DURATION = 160
+CLICK_PHASE_DURATION = 110
+
+
+class SmoothScrollListView(QListView):
+    """支持平滑滚动和动画效果的QListView（卡片由委托绘制，悬停/点击动画由视图绘制）"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -42,32 +70,149 @@ class SmoothScrollListWidget(QListWidget):
         self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         self._animation.setDuration(300)  # 300ms动画时长
         
-        # 悬停动画相关
-        self._hover_item = None
-        self._hover_timer = QTimer()
-        self._hover_timer.timeout.connect(self._on_hover_animation)
-        self._hover_timer.setInterval(16)  # 60fps
+        self.logger = logging.getLogger(__name__)
+        
+        # 悬停和点击效果预先绘制为贴图，动画时只贴图
+        self._effects = CardEffectRenderer(self.devicePixelRatioF())
+        # 已记录过的绘制错误，避免每帧重复写日志
+        self._paint_errors = set()
+        
+        # 悬停动画相关（使用持久索引，行被移除后自动失效）
+        self._hover_item = QPersistentModelIndex()
+        self._hover_start = 0
         self._hover_progress = 0.0
         
         # 点击动画相关
-        self._click_item = None
-        self._click_timer = QTimer()
-        self._click_timer.timeout.connect(self._on_click_animation)
-        self._click_timer.setInterval(16)
+        self._click_item = QPersistentModelIndex()
+        self._click_start = 0
         self._click_progress = 0.0
-        self._click_phase = 0  # 0: 缩小, 1: 放大
+        self._click_phase = 0  # 0: 缩小, 1: 放大（波纹扩散）
+        
+        # 悬停和点击动画共用一个动画时钟，没有进行中的效果时停止
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._effect_animation = QVariantAnimation(self)
+        self._effect_animation.setStartValue(0.0)
+        self._effect_animation.setEndValue(1.0)
+        self._effect_animation.setDuration(1000)
+        self._effect_animation.setLoopCount(-1)
+        self._effect_animation.valueChanged.connect(lambda value: self._on_effect_frame())
         
         # 防止拖动多选
-        self._last_pressed_item = None
+        self._last_pressed_item = QPersistentModelIndex()
         self._is_mouse_pressed = False
         
+        # 列表为空时显示的提示（如"未找到DLC文件"或错误信息）
+        self._message = ""
+        self._message_color = QColor("#6c757d")
+        
         # 设置滚动模式
-        self.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
-        self.setHorizontalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollMode(QListView.ScrollMode.ScrollPerPixel)
         
         # 启用鼠标追踪以实现悬停效果
         self.setMouseTracking(True)
         self.viewport().setMouseTracking(True)
+        
+        # 滚动停止后预取可视区域附近的缩略图
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(50)
+        self._prefetch_timer.timeout.connect(self.prefetch_nearby)
+        self.verticalScrollBar().valueChanged.connect(lambda value: self._prefetch_timer.start())
+        
+        # 绘制统计（enable_paint_profiler开启后才记录）
+        self.paint_profiler = None
+        self._overlay_timer = None
+    
+    def set_theme_colors(self, colors):
+        """
+        界面主题切换时更新卡片配色和空列表提示的颜色
+        
+        Args:
+            colors: 主题变量字典
+        """
+        delegate = self.itemDelegate()
+        if isinstance(delegate, DlcItemDelegate):
+            delegate.set_colors(colors)
+        self._message_color = QColor(colors.get('muted_text', "#6c757d"))
+        self.viewport().update()
+    
+    def enable_paint_profiler(self, name):
+        """
+        开启绘制统计：记录每帧绘制耗时、布局耗时和平滑滚动丢帧，并在右上角显示统计浮层
+        
+        Args:
+            name: 视图名称（用于日志）
+        """
+        if self.paint_profiler is not None:
+            return
+        self.paint_profiler = PaintProfiler(name)
+        self._animation.stateChanged.connect(self._on_scroll_animation_state)
+        
+        # 定时刷新浮层（只重绘浮层区域，不计入帧统计）
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.setInterval(500)
+        self._overlay_timer.timeout.connect(lambda: self.viewport().update(self._overlay_rect()))
+        self._overlay_timer.start()
+    
+    def _on_scroll_animation_state(self, new_state, old_state):
+        """平滑滚动动画开始/结束"""
+        if new_state == QPropertyAnimation.State.Running:
+            self.paint_profiler.scroll_started()
+        elif new_state == QPropertyAnimation.State.Stopped:
+            self.paint_profiler.scroll_finished()
+    
+    def _overlay_rect(self):
+        """统计浮层区域（视口右上角）"""
+        viewport = self.viewport().rect()
+        return QRect(viewport.right() - 383, viewport.top() + 4, 380, 20)
+    
+    def timerEvent(self, event):
+        """视图定时器事件（开启统计时记录耗时 - QListView在延迟布局定时器中排列项目）"""
+        if self.paint_profiler is None:
+            super().timerEvent(event)
+            return
+        start = time.perf_counter()
+        super().timerEvent(event)
+        self.paint_profiler.record_layout((time.perf_counter() - start) * 1000)
+    
+    def set_message(self, message):
+        """设置列表为空时显示的提示文本"""
+        self._message = message
+        self.viewport().update()
+    
+    def selected_file_names(self):
+        """选中项的文件名（按行排序）"""
+        indexes = sorted(self.selectionModel().selectedIndexes(), key=lambda index: index.row())
+        return [index.data(FILE_NAME_ROLE) for index in indexes if index.data(FILE_NAME_ROLE)]
+    
+    def selected_display_names(self):
+        """选中项的显示名称（按行排序）"""
+        indexes = sorted(self.selectionModel().selectedIndexes(), key=lambda index: index.row())
+        return [index.data() for index in indexes if index.data()]
+    
+    def prefetch_nearby(self, margin=1.0):
+        """
+        读取可视区域上下各margin屏内项目的缩略图，模型会为尚未缓存的项目排队加载
+        （可视区域内的项目按可见优先级排队，区域外的按预取优先级排队）
+        
+        Args:
+            margin: 预取范围（屏数）
+        """
+        model = self.model()
+        grid = self.gridSize()
+        if model is None or model.rowCount() == 0 or not grid.isValid():
+            return
+        
+        viewport = self.viewport().rect()
+        extra = int(viewport.height() * margin)
+        for y in range(viewport.top() - extra, viewport.bottom() + extra, grid.height()):
+            for x in range(viewport.left(), viewport.right(), grid.width()):
+                center = QPoint(x + grid.width() // 2, y + grid.height() // 2)
+                index = self.indexAt(center)
+                if index.isValid():
+                    index.data(Qt.ItemDataRole.DecorationRole if viewport.contains(center) else PREFETCH_ROLE)
     
     def wheelEvent(self, event: QWheelEvent):
         """重写鼠标滚轮事件，添加平滑滚动动画"""
@@ -95,21 +240,21 @@ class SmoothScrollListWidget(QListWidget):
         
         # 只处理左键点击
         if event.button() == Qt.MouseButton.LeftButton:
-            item = self.itemAt(event.pos())
-            if item:
+            index = self.indexAt(event.pos())
+            if index.isValid():
                 # 记录按下的item和状态
-                self._last_pressed_item = item
+                self._last_pressed_item = QPersistentModelIndex(index)
                 self._is_mouse_pressed = True
                 
                 # 切换选择状态
-                item.setSelected(not item.isSelected())
+                self.selectionModel().select(index, QItemSelectionModel.SelectionFlag.Toggle)
                 
                 # 触发点击动画
-                self._click_item = item
+                self._click_item = QPersistentModelIndex(index)
+                self._click_start = self._clock.elapsed()
                 self._click_progress = 0.0
                 self._click_phase = 0
-                if not self._click_timer.isActive():
-                    self._click_timer.start()
+                self._start_effects()
                 
                 # 不调用父类方法，避免默认的选择行为
                 event.accept()
@@ -124,7 +269,7 @@ class SmoothScrollListWidget(QListWidget):
         
         if event.button() == Qt.MouseButton.LeftButton:
             self._is_mouse_pressed = False
-            self._last_pressed_item = None
+            self._last_pressed_item = QPersistentModelIndex()
         
         super().mouseReleaseEvent(event)
     
@@ -133,174 +278,155 @@ class SmoothScrollListWidget(QListWidget):
         # 如果鼠标正在按下，禁止触发任何选择行为
         if self._is_mouse_pressed:
             # 只更新悬停效果，不触发选择
-            item = self.itemAt(event.pos())
-            if item != self._hover_item:
-                if self._hover_timer.isActive():
-                    self._hover_timer.stop()
-                self._hover_item = item
-                if item:
-                    self._hover_progress = 0.0
-                    self._hover_timer.start()
+            self._set_hover_item(self.indexAt(event.pos()))
             # 不调用父类方法，完全禁止拖动选择
             event.accept()
             return
         
         # 正常的悬停处理
         super().mouseMoveEvent(event)
-        item = self.itemAt(event.pos())
-        
-        if item != self._hover_item:
-            # 停止之前的悬停动画
-            if self._hover_timer.isActive():
-                self._hover_timer.stop()
-            
-            self._hover_item = item
-            if item:
-                # 开始新的悬停动画
-                self._hover_progress = 0.0
-                self._hover_timer.start()
+        self._set_hover_item(self.indexAt(event.pos()))
     
     def leaveEvent(self, event):
         """鼠标离开事件 - 停止悬停动画"""
         super().leaveEvent(event)
-        if self._hover_timer.isActive():
-            self._hover_timer.stop()
-        self._hover_item = None
-        self.viewport().update()
+        self._update_item(self._hover_item, HOVER_MARGIN)
+        self._hover_item = QPersistentModelIndex()
+        self._hover_progress = 0.0
     
-    def _on_hover_animation(self):
-        """悬停动画帧更新"""
-        self._hover_progress += 0.1
-        if self._hover_progress >= 1.0:
-            self._hover_progress = 1.0
-            self._hover_timer.stop()
+    def _set_hover_item(self, index):
+        """切换悬停的项目并重新开始悬停动画"""
+        item = QPersistentModelIndex(index)
+        if item == self._hover_item:
+            return
         
-        # 触发重绘
-        if self._hover_item:
-            rect = self.visualItemRect(self._hover_item)
-            self.viewport().update(rect)
-    
-    
-    def _on_click_animation(self):
-        """点击动画帧更新"""
-        self._click_progress += 0.15
+        self._update_item(self._hover_item, HOVER_MARGIN)
+        self._hover_item = item
+        self._hover_progress = 0.0
+        if item.isValid():
+            self._hover_start = self._clock.elapsed()
+            self._start_effects()
+    
+    def _start_effects(self):
+        """启动动画时钟（已在运行时不重复启动）"""
+        if self._effect_animation.state() != QVariantAnimation.State.Running:
+            self._effect_animation.start()
+    
+    def _on_effect_frame(self):
+        """动画时钟的每一帧：按经过的时间更新悬停和点击进度，只重绘受影响的区域"""
+        now = self._clock.elapsed()
+        running = False
+        
+        if self._hover_item.isValid() and self._hover_progress < 1.0:
+            self._hover_progress = min(1.0, (now - self._hover_start) / HOVER_DURATION)
+            self._update_item(self._hover_item, HOVER_MARGIN)
+            running = self._hover_progress < 1.0
+        
+        if self._click_item.isValid():
+            elapsed = (now - self._click_start) / CLICK_PHASE_DURATION
+            if elapsed < 1.0:  # 缩小阶段
+                self._click_phase, self._click_progress = 0, elapsed
+            else:  # 放大阶段
+                self._click_phase, self._click_progress = 1, min(1.0, elapsed - 1.0)
+            self._update_item(self._click_item, RIPPLE_MARGIN)
+            if self._click_progress >= 1.0 and self._click_phase == 1:
+                self._click_item = QPersistentModelIndex()
+            else:
+                running = True
         
-        if self._click_phase == 0:  # 缩小阶段
-            if self._click_progress >= 1.0:
-                self._click_progress = 0.0
-                self._click_phase = 1
-        else:  # 放大阶段
-            if self._click_progress >= 1.0:
-                self._click_progress = 1.0
-                self._click_timer.stop()
-                self._click_item = None
-        
-        # 触发重绘
-        if self._click_item:
-            rect = self.visualItemRect(self._click_item)
-            self.viewport().update(rect)
+        if not running:
+            self._effect_animation.stop()
+    
+    def _update_item(self, item, margin):
+        """重绘项目及其外侧的效果区域"""
+        if item.isValid():
+            rect = self.visualRect(QModelIndex(item))
+            if rect.isValid():
+                self.viewport().update(rect.adjusted(-margin, -margin, margin, margin))
     
     def paintEvent(self, event):
-        """重写绘制事件以应用动画效果"""
+        """重写绘制事件以应用动画效果（开启统计时记录耗时并绘制统计浮层）"""
+        profiler = self.paint_profiler
+        if profiler is None:
+            self._paint_view(event)
+            return
+        
+        # 只刷新浮层的重绘不计入帧统计
+        overlay = self._overlay_rect()
+        is_frame = not overlay.contains(event.rect())
+        if is_frame:
+            profiler.begin_frame()
+        self._paint_view(event)
+        if is_frame:
+            profiler.end_frame()
+        self._paint_overlay(overlay)
+    
+    def _paint_overlay(self, rect):
+        """绘制统计浮层"""
+        painter = QPainter(self.viewport())
+        try:
+            painter.fillRect(rect, QColor(0, 0, 0, 160))
+            font = painter.font()
+            font.setPointSize(8)
+            painter.setFont(font)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(rect.adjusted(6, 0, -6, 0), Qt.AlignmentFlag.AlignVCenter, self.paint_profiler.summary())
+        finally:
+            painter.end()
+    
+    def _paint_view(self, event):
+        """绘制列表、空列表提示以及悬停/点击效果"""
         super().paintEvent(event)
         
-        from PyQt6.QtGui import QPainter, QColor, QPen
+        # 列表为空时显示提示
+        if self._message and (self.model() is None or self.model().rowCount() == 0):
+            painter = QPainter(self.viewport())
+            painter.setPen(self._message_color)
+            painter.drawText(self.viewport().rect().adjusted(20, 20, -20, -20),
+                             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+                             self._message)
+            painter.end()
+            return
+        
+        # 设备像素比变化（窗口移动到其他屏幕）时重新生成贴图
+        self._effects.set_device_pixel_ratio(self.devicePixelRatioF())
         
         # 绘制悬停动画效果
-        if self._hover_item and self._hover_progress > 0:
+        if self._hover_item.isValid() and self._hover_progress > 0:
             try:
-                rect = self.visualItemRect(self._hover_item)
-                if not rect.isValid():
-                    return
-                
-                painter = QPainter(self.viewport())
-                try:
-                    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-                    
-                    # 计算动画参数（使用缓动函数）
-                    progress = self._ease_out_cubic(self._hover_progress)
-                    
-                    # 动态圆角半径：从12px增大到18px
-                    radius = 12 + int(6 * progress)
-                    
-                    # 绘制外发光效果（多层）
-                    for i in range(3):
-                        offset = int((3 - i) * 2 * progress)
-                        glow_rect = rect.adjusted(-offset, -offset, offset, offset)
-                        glow_alpha = int(30 * progress * (1 - i * 0.3))
-                        glow_color = QColor(3, 102, 214, glow_alpha)
-                        painter.setPen(Qt.PenStyle.NoPen)
-                        painter.setBrush(glow_color)
-                        painter.drawRoundedRect(glow_rect, radius + offset, radius + offset)
-                    
-                    # 绘制圆角遮罩层（半透明蓝色覆盖）
-                    overlay_color = QColor(230, 242, 255, int(50 * progress))
-                    painter.setBrush(overlay_color)
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.drawRoundedRect(rect, radius, radius)
-                    
-                    # 绘制圆角边框
-                    border_pen = QPen(QColor(9, 105, 218, int(255 * progress)))
-                    border_pen.setWidth(int(3 * progress))
-                    painter.setPen(border_pen)
-                    painter.setBrush(Qt.BrushStyle.NoBrush)
-                    painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), radius, radius)
-                    
-                finally:
-                    painter.end()
+                rect = self.visualRect(QModelIndex(self._hover_item))
+                if rect.isValid():
+                    pixmap, margin = self._effects.hover_frame(rect.size(), self._hover_progress)
+                    if pixmap is not None:
+                        painter = QPainter(self.viewport())
+                        try:
+                            painter.drawPixmap(rect.x() - margin, rect.y() - margin, pixmap)
+                        finally:
+                            painter.end()
             except Exception as e:
-                pass  # 静默处理绘制错误
+                self._log_paint_error("悬停效果", e)
         
-        # 绘制点击动画效果
-        if self._click_item and self._click_timer.isActive():
+        # 绘制点击动画效果（放大阶段的脉冲波纹）
+        if self._click_item.isValid() and self._click_phase == 1:
             try:
-                rect = self.visualItemRect(self._click_item)
-                if not rect.isValid():
-                    return
-                
-                painter = QPainter(self.viewport())
-                try:
-                    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-                    
-                    if self._click_phase == 0:  # 缩小阶段
-                        progress = self._ease_in_cubic(self._click_progress)
-                        scale = 1.0 - 0.05 * progress
-                    else:  # 放大阶段
-                        progress = self._ease_out_elastic(self._click_progress)
-                        scale = 0.95 + 0.05 * progress
-                    
-                    # 绘制脉冲波纹效果
-                    if self._click_phase == 1:
-                        ripple_alpha = int(100 * (1 - self._click_progress))
-                        ripple_color = QColor(33, 136, 255, ripple_alpha)
-                        painter.setPen(Qt.PenStyle.NoPen)
-                        painter.setBrush(ripple_color)
-                        
-                        ripple_size = int(20 * self._click_progress)
-                        ripple_rect = rect.adjusted(-ripple_size, -ripple_size, ripple_size, ripple_size)
-                        painter.drawRoundedRect(ripple_rect, 12, 12)
-                finally:
-                    painter.end()
+                rect = self.visualRect(QModelIndex(self._click_item))
+                if rect.isValid():
+                    pixmap, margin = self._effects.ripple_frame(rect.size(), self._click_progress)
+                    if pixmap is not None:
+                        painter = QPainter(self.viewport())
+                        try:
+                            painter.drawPixmap(rect.x() - margin, rect.y() - margin, pixmap)
+                        finally:
+                            painter.end()
             except Exception as e:
-                pass  # 静默处理绘制错误
-    
-    def _ease_out_cubic(self, t):
-        """三次缓动函数（减速）"""
-        return 1 - pow(1 - t, 3)
-    
-    def _ease_in_cubic(self, t):
-        """三次缓动函数（加速）"""
-        return t * t * t
-    
-    def _ease_out_elastic(self, t):
-        """弹性缓动函数"""
-        import math
-        if t == 0 or t == 1:
-            return t
-        
-        p = 0.3
-        s = p / 4
-        return pow(2, -10 * t) * math.sin((t - s) * (2 * math.pi) / p) + 1
+                self._log_paint_error("点击效果", e)
+    
+    def _log_paint_error(self, effect, error):
+        """记录绘制错误（同一错误只记录一次）"""
+        key = (effect, str(error))
+        if key not in self._paint_errors:
+            self._paint_errors.add(key)
+            self.logger.error(f"绘制{effect}失败: {error}")
 
 
 class MainWindow(QMainWindow):
@@ -308,35 +434,84 @@ class MainWindow(QMainWindow):
     
     # 自定义信号
     status_updated = pyqtSignal(str)
+    # 后台检测到的游戏路径（未找到时为空字符串）
+    game_path_detected = pyqtSignal(str)
+    # 界面相关的配置项发生变化（配置项路径, 新值）
+    config_changed = pyqtSignal(str, object)
     
     def __init__(self, config=None):
         super().__init__()
-        self.config = config or {}
+        self.config = config if config is not None else Config()
         self.logger = logging.getLogger(__name__)
         self.language_manager = get_language_manager()
+        self.theme_manager = get_theme_manager()
+        
+        # 订阅界面配置的变化，由config_changed信号在界面线程中处理
+        self.config_changed.connect(self.on_config_changed)
+        self._unsubscribe_config = self.config.subscribe('ui', self.config_changed.emit)
+        
+        # 游戏路径 - 优先使用上次保存的路径（游戏主程序的大小和修改时间与保存时一致），
+        # 否则在窗口显示后后台自动检测（检测较慢的驱动器不会拖住首次绘制）
+        self.game_path = self.load_saved_game_path()
+        self._game_path_detection_started = False
+        self.game_path_detected.connect(self.on_game_path_detected)
         
-        # 初始化游戏路径 - 只通过自动检测获取，不从配置读取
-        self.game_path = self.find_ets2_installation_path()
+        # 加载DLC信息数据（按文件名和DLC ID建立索引）
+        self.dlc_catalog = self.load_dlcs_info()
+        # 名称、文件名和DLC ID的搜索索引
+        self.dlc_search_index = DlcSearchIndex(self.dlc_catalog)
         
-        # 加载DLC信息数据
-        self.dlcs_info = self.load_dlcs_info()
+        # 游戏目录和temp_dlcs中DLC文件的统一索引
+        self.dlc_repository = DlcRepository(self.find_dlc_info_by_file)
         
-        # 使用本地图片
+        # 监控游戏目录和temp_dlcs的外部变化（Steam更新、验证游戏完整性、手动复制等）
+        self.dlc_watcher = DlcDirectoryWatcher(parent=self)
+        self.dlc_watcher.files_changed.connect(self.on_dlc_files_changed)
+        
+        # 使用本地图片，按图标尺寸缓存在内存和磁盘中
         # self.network_manager = QNetworkAccessManager()
-        self.image_cache = {}  # 缓存已加载的本地图片
+        self.thumbnail_cache = self.create_thumbnail_cache()
+        # 后台解码缩略图，加载完成前显示共用的占位图标
+        self.thumbnail_loader = ThumbnailLoader(self.thumbnail_cache, parent=self)
+        self.placeholder_icon = create_placeholder_icon(THUMBNAIL_SIZE)
+        
+        # 后台扫描DLC目录的线程池
+        self.scan_pool = QThreadPool(self)
+        self._scan_serial = 0
+        # 线程池中尚未结束的扫描和移动任务（线程池不持有任务，页面取消或替换任务后仍需保留引用）
+        self._running_workers = set()
+        
+        # 后台执行批量安装/卸载的线程池（同时只运行一个批次）
+        self.move_pool = QThreadPool(self)
+        self.move_pool.setMaxThreadCount(1)
+        # 上次批量移动中途中断留下的意图日志在界面创建后交给move_pool恢复，恢复完成前不扫描DLC列表
+        recovery_worker = self.create_recovery_worker(self.game_path)
+        self.move_worker = recovery_worker
+        # 关闭窗口时正在等待批量移动结束
+        self._closing = False
         
         # 加载保存的语言设置
-        saved_language = self.config.get('ui.language', 'zh_CN')
-        if saved_language in ['zh_CN', 'en']:
-            self.language_manager.load_language(saved_language)
+        saved_language = self.config.settings.ui.language
+        if self.language_manager.load_language(saved_language):
             self.logger.info(f"已加载保存的语言设置: {saved_language}")
         
+        # 输入停止后再过滤列表的间隔（毫秒）
+        self.search_delay = 150
+        
+        # 首次显示后延迟多久开始创建未安装页面和设置页面（毫秒）
+        self.deferred_pages_delay = 300
+        
+        # 列表绘制统计（环境变量ETS2_DLC_PAINT_STATS=1或配置app.paint_stats开启）
+        self.paint_stats = paint_stats_enabled(self.config)
+        
         # 初始化UI
         self.init_ui()
         self.setup_menu()
         self.setup_toolbar()
         self.setup_statusbar()
-
+        
+        if recovery_worker is not None:
+            self.start_move_recovery(recovery_worker)
         
         # 添加窗口大小变化监听器
         self.resize_timer = QTimer()
@@ -345,38 +520,22 @@ class MainWindow(QMainWindow):
         
         self.logger.info("主窗口初始化完成")
     
+    @startup_phase("MainWindow.load_dlcs_info")
     def load_dlcs_info(self):
         """加载DLC信息数据从dlcs_info.json"""
-        try:
-            # 检测是否在打包环境中运行
-            if getattr(sys, 'frozen', False):
-                base_path = Path(sys.executable).parent
-            else:
-                base_path = Path(__file__).parent.parent
-            
-            dlcs_info_path = base_path / "dlcs_info.json"
-            
-            if dlcs_info_path.exists():
-                with open(dlcs_info_path, 'r', encoding='utf-8') as f:
-                    dlcs_info = json.load(f)
-                    self.logger.info(f"成功加载 {len(dlcs_info)} 个DLC信息")
-                    return dlcs_info
-            else:
-                self.logger.warning(f"DLC信息文件不存在: {dlcs_info_path}")
-                return []
-        except Exception as e:
-            self.logger.error(f"加载DLC信息失败: {e}")
-            return []
+        # 检测是否在打包环境中运行
+        if getattr(sys, 'frozen', False):
+            base_path = Path(sys.executable).parent
+        else:
+            base_path = Path(__file__).parent.parent
+        
+        return DlcCatalog.load(base_path / "dlcs_info.json")
     
     def find_dlc_info_by_file(self, filename):
         """根据文件名查找DLC信息"""
-        filename_lower = filename.lower()
-        for dlc in self.dlcs_info:
-            for file in dlc.get('files', []):
-                if file.lower() == filename_lower:
-                    return dlc
-        return None
+        return self.dlc_catalog.find_by_file(filename)
     
+    @startup_phase("MainWindow.init_ui")
     def init_ui(self):
         """初始化用户界面 - 固定尺寸1000x700，禁止用户缩放"""
         # 设置窗口属性
@@ -437,6 +596,7 @@ class MainWindow(QMainWindow):
         else:
             self.logger.warning(f"图标文件不存在: {icon_path}")
     
+    @startup_phase("MainWindow.create_left_panel")
     def create_left_panel(self):
         """创建左侧菜单栏 - 高度占满100%，带阴影效果"""
         panel = QWidget()
@@ -520,6 +680,7 @@ class MainWindow(QMainWindow):
         btn.clicked.connect(callback)
         return btn
     
+    @startup_phase("MainWindow.create_main_workspace")
     def create_main_workspace(self):
         """创建主工作区"""
         workspace = QWidget()
@@ -530,7 +691,7 @@ class MainWindow(QMainWindow):
         title_layout = QHBoxLayout(title_area)
         
         self.workspace_title = QLabel("欢迎使用ETS2 DLC Tools")
-        self.workspace_title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 10px;")
+        self.workspace_title.setObjectName("workspace_title")
         title_layout.addWidget(self.workspace_title)
         
         title_layout.addStretch()
@@ -570,6 +731,7 @@ class MainWindow(QMainWindow):
         
         return workspace
     
+    @startup_phase("MainWindow.create_right_panel")
     def create_right_panel(self):
         """创建右侧主要内容区域 - 支持动态内容切换"""
         panel = QWidget()
@@ -589,30 +751,112 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(self.content_stack)
         
+        # 批量移动进度面板（移动时显示）
+        self.move_progress_panel = self.create_move_progress_panel()
+        layout.addWidget(self.move_progress_panel)
+        
+        return panel
+    
+    def create_move_progress_panel(self):
+        """创建批量移动进度面板 - 当前文件、总进度、速度和剩余时间，以及取消按钮"""
+        panel = QFrame()
+        panel.setObjectName("move_progress_panel")
+        layout = QHBoxLayout(panel)
+        layout.setContentsMargins(15, 8, 15, 8)
+        layout.setSpacing(10)
+        
+        info_layout = QVBoxLayout()
+        info_layout.setSpacing(4)
+        
+        # 当前文件（通过status_updated信号更新）
+        self.move_file_label = QLabel()
+        self.move_file_label.setObjectName("move_file_label")
+        self.status_updated.connect(self.move_file_label.setText)
+        info_layout.addWidget(self.move_file_label)
+        
+        self.move_progress_bar = QProgressBar()
+        self.move_progress_bar.setRange(0, 100)
+        self.move_progress_bar.setTextVisible(False)
+        self.move_progress_bar.setFixedHeight(8)
+        info_layout.addWidget(self.move_progress_bar)
+        
+        # 已传输大小、速度和剩余时间
+        self.move_status_label = QLabel()
+        self.move_status_label.setObjectName("move_status_label")
+        info_layout.addWidget(self.move_status_label)
+        
+        layout.addLayout(info_layout, 1)
+        
+        self.move_cancel_btn = QPushButton(tr('common.cancel'))
+        self.move_cancel_btn.clicked.connect(self.cancel_dlc_move)
+        layout.addWidget(self.move_cancel_btn)
+        
+        panel.setVisible(False)
         return panel
     
     def create_content_pages(self):
-        """创建不同菜单对应的内容页面"""
+        """创建不同菜单对应的内容页面（未安装和设置页面在首次显示或首次绘制后的空闲时间创建）"""
         # 已安装DLC页面
         self.installed_page = self.create_installed_page()
         self.stack_layout.addWidget(self.installed_page)
         
-        # 未安装DLC页面
-        self.uninstalled_page = self.create_uninstalled_page()
-        self.stack_layout.addWidget(self.uninstalled_page)
-        
-        # 设置页面
-        self.settings_page = self.create_settings_page()
-        self.stack_layout.addWidget(self.settings_page)
+        # 未安装DLC页面和设置页面延迟创建
+        self.uninstalled_page = None
+        self.settings_page = None
+        self._deferred_pages_scheduled = False
         
         # 默认显示已安装DLC页面
         self.show_installed_dlc()
     
+    def ensure_uninstalled_page(self):
+        """获取未安装DLC页面，尚未创建时创建"""
+        if self.uninstalled_page is None:
+            self.uninstalled_page = self.create_uninstalled_page()
+            self.uninstalled_page.hide()
+            self.stack_layout.addWidget(self.uninstalled_page)
+            # 批量移动进行中时创建的页面同样禁用操作按钮
+            if self.move_worker is not None:
+                for btn in self.uninstalled_page.action_buttons:
+                    btn.setEnabled(False)
+        return self.uninstalled_page
+    
+    def ensure_settings_page(self):
+        """获取设置页面，尚未创建时创建"""
+        if self.settings_page is None:
+            self.settings_page = self.create_settings_page()
+            self.settings_page.hide()
+            self.stack_layout.addWidget(self.settings_page)
+        return self.settings_page
+    
+    def dlc_pages(self):
+        """已创建的DLC页面（已安装、未安装）"""
+        return [page for page in (self.installed_page, self.uninstalled_page) if page is not None]
+    
+    def showEvent(self, event):
+        """窗口首次显示后，在空闲时间逐个创建延迟的页面"""
+        super().showEvent(event)
+        if not self._deferred_pages_scheduled:
+            self._deferred_pages_scheduled = True
+            QTimer.singleShot(self.deferred_pages_delay, self.build_deferred_pages)
+        if not self.game_path:
+            self.start_game_path_detection()
+    
+    def build_deferred_pages(self):
+        """每次只创建一个页面，让出事件循环后再创建下一个，避免界面卡顿"""
+        if self.uninstalled_page is None:
+            self.ensure_uninstalled_page()
+        elif self.settings_page is None:
+            self.ensure_settings_page()
+        else:
+            return
+        QTimer.singleShot(0, self.build_deferred_pages)
+    
 
     
     def create_github_button(self):
         """创建GitHub图标按钮"""
         github_btn = QToolButton()
+        github_btn.setObjectName("github_btn")
         github_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
         github_btn.setFixedSize(32, 32)
         github_btn.setToolTip("访问GitHub仓库")
@@ -635,20 +879,6 @@ class MainWindow(QMainWindow):
                 if not github_icon.isNull():
                     github_btn.setIcon(github_icon)
                     github_btn.setIconSize(QSize(24, 24))
-                    github_btn.setStyleSheet("""
-                        QToolButton {
-                            border: none;
-                            border-radius: 4px;
-                            background-color: transparent;
-                            padding: 4px;
-                        }
-                        QToolButton:hover {
-                            background-color: rgba(0, 0, 0, 0.1);
-                        }
-                        QToolButton:pressed {
-                            background-color: rgba(0, 0, 0, 0.2);
-                        }
-                    """)
                     self.logger.info(f"GitHub图标设置成功: {github_icon_path}")
                 else:
                     self.logger.warning(f"GitHub图标文件无效: {github_icon_path}")
@@ -667,22 +897,11 @@ class MainWindow(QMainWindow):
     def set_fallback_github_icon(self, github_btn):
         """设置备用的GitHub图标（使用emoji）"""
         github_btn.setText("🐙")  # 使用章鱼emoji作为GitHub图标
-        github_btn.setStyleSheet("""
-            QToolButton {
-                font-size: 20px;
-                border: none;
-                border-radius: 4px;
-                background-color: transparent;
-                padding: 4px;
-            }
-            QToolButton:hover {
-                background-color: rgba(0, 0, 0, 0.1);
-            }
-        """)
     
     def create_github_button_for_settings(self):
         """为设置页面创建GitHub图标按钮"""
         github_btn = QPushButton()
+        github_btn.setObjectName("github_repo_btn")
         github_btn.setToolTip(tr('settings.github_repo'))
         github_btn.setFixedHeight(40)
         github_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -709,26 +928,6 @@ class MainWindow(QMainWindow):
             self.logger.warning(f"设置页面GitHub图标文件不存在: {github_icon_path}")
             self.set_fallback_github_icon_for_settings(github_btn)
         
-        # 设置按钮样式
-        github_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #24292e;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 500;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #2f363d;
-            }
-            QPushButton:pressed {
-                background-color: #1f2328;
-            }
-        """)
-        
         # 连接点击事件到GitHub仓库
         github_btn.clicked.connect(self.open_github_repo)
         return github_btn
@@ -736,24 +935,6 @@ class MainWindow(QMainWindow):
     def set_fallback_github_icon_for_settings(self, github_btn):
         """为设置页面设置备用的GitHub图标"""
         github_btn.setText(f"🐙 {tr('settings.github_repo')}")  # 使用章鱼emoji作为GitHub图标
-        github_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #24292e;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 500;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #2f363d;
-            }
-            QPushButton:pressed {
-                background-color: #1f2328;
-            }
-        """)
     
     def open_github_repo(self):
         """打开GitHub仓库链接"""
@@ -787,6 +968,7 @@ class MainWindow(QMainWindow):
             self.logger.error(f"打开日志文件夹失败: {e}")
             QMessageBox.warning(self, "警告", f"无法打开日志文件夹: {e}")
     
+    @startup_phase("MainWindow.create_installed_page")
     def create_installed_page(self):
         """创建已安装DLC页面"""
         page = QWidget()
@@ -818,30 +1000,14 @@ class MainWindow(QMainWindow):
         search_layout.setContentsMargins(0, 10, 0, 10)
         
         search_label = QLabel("🔍")
-        search_label.setStyleSheet("font-size: 16px;")
+        search_label.setObjectName("search_icon")
         search_layout.addWidget(search_label)
         
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("搜索DLC名称...")
+        self.search_input.setPlaceholderText("搜索DLC名称、文件名或ID...")
         self.search_input.setClearButtonEnabled(True)
         self.search_input.textChanged.connect(self.filter_installed_dlc)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #e1e4e8;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                background-color: #ffffff;
-                color: #24292e;
-            }
-            QLineEdit:focus {
-                border-color: #2196f3;
-                background-color: #f8f9fa;
-            }
-            QLineEdit:hover {
-                border-color: #0366d6;
-            }
-        """)
+        self.search_input.setObjectName("dlc_search_input")
         search_layout.addWidget(self.search_input)
         layout.addWidget(search_widget)
         
@@ -850,41 +1016,48 @@ class MainWindow(QMainWindow):
         self.selection_info.setObjectName("selection_info")
         self.selection_info.setVisible(False)
         self.selection_info.setWordWrap(True)
-        self.selection_info.setStyleSheet("""
-            QLabel#selection_info {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e3f2fd, stop:1 #bbdefb);
-                border: 2px solid #2196f3;
-                border-radius: 8px;
-                padding: 12px 16px;
-                margin: 10px 0;
-                color: #1565c0;
-                font-size: 13px;
-                font-weight: 500;
-            }
-        """)
         layout.addWidget(self.selection_info)
         
-        # DLC文件列表 - 使用平滑滚动的QListWidget，设置为网格模式
-        dlc_list = SmoothScrollListWidget()
+        # DLC文件列表 - 使用平滑滚动的QListView，设置为网格模式
+        dlc_list = SmoothScrollListView()
         dlc_list.setObjectName("installed_dlc_list")
-        dlc_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)  # 多选模式（不需要Ctrl/Shift）
-        dlc_list.setViewMode(QListWidget.ViewMode.IconMode)  # 图标模式（网格布局）
+        dlc_list.setSelectionMode(QListView.SelectionMode.MultiSelection)  # 多选模式（不需要Ctrl/Shift）
+        dlc_list.setViewMode(QListView.ViewMode.IconMode)  # 图标模式（网格布局）
         dlc_list.setIconSize(QSize(240, 120))  # 图标尺寸240x120
         dlc_list.setGridSize(QSize(255, 175))  # 网格255x175，继续缩小
-        dlc_list.setResizeMode(QListWidget.ResizeMode.Adjust)  # 自动调整
-        dlc_list.setMovement(QListWidget.Movement.Static)  # 禁止拖动
+        dlc_list.setResizeMode(QListView.ResizeMode.Adjust)  # 自动调整
+        dlc_list.setMovement(QListView.Movement.Static)  # 禁止拖动
         dlc_list.setSpacing(2)  # 最小间距2px
         dlc_list.setWordWrap(True)  # 文本换行
         dlc_list.setUniformItemSizes(True)  # 统一项目尺寸
         
+        # 数据来自DLC索引，名称和缩略图在绘制时按需获取
+        # 视图显示搜索代理模型，过滤和排序不改动源模型
+        model = DlcListModel(self.thumbnail_loader, self.placeholder_icon, dlc_list)
+        proxy = DlcFilterProxyModel(self.dlc_search_index, dlc_list)
+        proxy.setSourceModel(model)
+        dlc_list.setModel(proxy)
+        dlc_list.setItemDelegate(DlcItemDelegate('installed', parent=dlc_list))
+        dlc_list.set_theme_colors(self.theme_manager.colors())
+        
         # 连接选择变化事件
-        dlc_list.itemSelectionChanged.connect(self.on_dlc_selection_changed)
+        dlc_list.selectionModel().selectionChanged.connect(lambda selected, deselected: self.on_dlc_selection_changed())
         
+        if self.paint_stats:
+            dlc_list.enable_paint_profiler(dlc_list.objectName())
         layout.addWidget(dlc_list)
         
         # 保存列表引用，用于后续更新
         page.dlc_list = dlc_list
+        page.model = model
+        page.proxy = proxy
+        page.directory = None  # 列表当前显示的目录
+        page.location = INSTALLED
+        page.search_input = self.search_input
+        page.search_timer = self.create_search_timer(page)
+        page.scan_worker = None
+        # 等待页面扫描完成后继续的操作（如安装/卸载全部）
+        page.scan_waiters = []
         
         # 操作按钮
         actions = QWidget()
@@ -906,9 +1079,11 @@ class MainWindow(QMainWindow):
         actions_layout.addStretch()
         
         layout.addWidget(actions)
+        page.action_buttons = [self.uninstall_selected_btn, self.uninstall_all_btn]
         
         return page
     
+    @startup_phase("MainWindow.create_uninstalled_page")
     def create_uninstalled_page(self):
         """创建未安装DLC页面"""
         page = QWidget()
@@ -940,30 +1115,14 @@ class MainWindow(QMainWindow):
         search_layout.setContentsMargins(0, 10, 0, 10)
         
         search_label = QLabel("🔍")
-        search_label.setStyleSheet("font-size: 16px;")
+        search_label.setObjectName("search_icon")
         search_layout.addWidget(search_label)
         
         self.uninstalled_search_input = QLineEdit()
-        self.uninstalled_search_input.setPlaceholderText("搜索DLC名称...")
+        self.uninstalled_search_input.setPlaceholderText("搜索DLC名称、文件名或ID...")
         self.uninstalled_search_input.setClearButtonEnabled(True)
         self.uninstalled_search_input.textChanged.connect(self.filter_uninstalled_dlc)
-        self.uninstalled_search_input.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #e1e4e8;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                background-color: #ffffff;
-                color: #24292e;
-            }
-            QLineEdit:focus {
-                border-color: #2196f3;
-                background-color: #f8f9fa;
-            }
-            QLineEdit:hover {
-                border-color: #0366d6;
-            }
-        """)
+        self.uninstalled_search_input.setObjectName("dlc_search_input")
         search_layout.addWidget(self.uninstalled_search_input)
         layout.addWidget(search_widget)
         
@@ -972,41 +1131,48 @@ class MainWindow(QMainWindow):
         self.uninstalled_selection_info.setObjectName("uninstalled_selection_info")
         self.uninstalled_selection_info.setVisible(False)
         self.uninstalled_selection_info.setWordWrap(True)
-        self.uninstalled_selection_info.setStyleSheet("""
-            QLabel#uninstalled_selection_info {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e8f5e9, stop:1 #c8e6c9);
-                border: none;
-                border-radius: 8px;
-                padding: 12px 16px;
-                margin: 10px 0;
-                color: #2e7d32;
-                font-size: 13px;
-                font-weight: 500;
-            }
-        """)
         layout.addWidget(self.uninstalled_selection_info)
         
         # DLC文件列表 - 使用网格模式，与已安装页面一致
-        dlc_list = SmoothScrollListWidget()
+        dlc_list = SmoothScrollListView()
         dlc_list.setObjectName("uninstalled_dlc_list")
-        dlc_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)  # 多选模式
-        dlc_list.setViewMode(QListWidget.ViewMode.IconMode)  # 图标模式（网格布局）
+        dlc_list.setSelectionMode(QListView.SelectionMode.MultiSelection)  # 多选模式
+        dlc_list.setViewMode(QListView.ViewMode.IconMode)  # 图标模式（网格布局）
         dlc_list.setIconSize(QSize(240, 120))  # 图标尺寸240x120
         dlc_list.setGridSize(QSize(255, 175))  # 网格255x175
-        dlc_list.setResizeMode(QListWidget.ResizeMode.Adjust)  # 自动调整
-        dlc_list.setMovement(QListWidget.Movement.Static)  # 禁止拖动
+        dlc_list.setResizeMode(QListView.ResizeMode.Adjust)  # 自动调整
+        dlc_list.setMovement(QListView.Movement.Static)  # 禁止拖动
         dlc_list.setSpacing(2)  # 最小间距2px
         dlc_list.setWordWrap(True)  # 文本换行
         dlc_list.setUniformItemSizes(True)  # 统一项目尺寸
         
+        # 数据来自DLC索引，名称和缩略图在绘制时按需获取
+        # 视图显示搜索代理模型，过滤和排序不改动源模型
+        model = DlcListModel(self.thumbnail_loader, self.placeholder_icon, dlc_list)
+        proxy = DlcFilterProxyModel(self.dlc_search_index, dlc_list)
+        proxy.setSourceModel(model)
+        dlc_list.setModel(proxy)
+        dlc_list.setItemDelegate(DlcItemDelegate('uninstalled', parent=dlc_list))
+        dlc_list.set_theme_colors(self.theme_manager.colors())
+        
         # 连接选择变化事件
-        dlc_list.itemSelectionChanged.connect(self.on_uninstalled_dlc_selection_changed)
+        dlc_list.selectionModel().selectionChanged.connect(lambda selected, deselected: self.on_uninstalled_dlc_selection_changed())
         
+        if self.paint_stats:
+            dlc_list.enable_paint_profiler(dlc_list.objectName())
         layout.addWidget(dlc_list)
         
         # 保存列表引用，用于后续更新
         page.dlc_list = dlc_list
+        page.model = model
+        page.proxy = proxy
+        page.directory = None  # 列表当前显示的目录
+        page.location = PARKED
+        page.search_input = self.uninstalled_search_input
+        page.search_timer = self.create_search_timer(page)
+        page.scan_worker = None
+        # 等待页面扫描完成后继续的操作（如安装/卸载全部）
+        page.scan_waiters = []
         
         # 操作按钮
         actions = QWidget()
@@ -1026,37 +1192,104 @@ class MainWindow(QMainWindow):
         actions_layout.addStretch()
         
         layout.addWidget(actions)
+        page.action_buttons = [self.install_selected_btn, self.install_all_btn]
         
         return page
     
-    def find_ets2_installation_path(self):
-        """自动搜索欧洲卡车模拟2的安装路径"""
-        # 常用的安装路径列表
-        common_paths = [
-            'C:\\Program Files (x86)\\Steam\\steamapps\\common\\Euro Truck Simulator 2',
-            'C:\\Program Files\\Steam\\steamapps\\common\\Euro Truck Simulator 2',
-            'D:\\Steam\\steamapps\\common\\Euro Truck Simulator 2',
-            'D:\\SteamLibrary\\steamapps\\common\\Euro Truck Simulator 2',
-            'E:\\Steam\\steamapps\\common\\Euro Truck Simulator 2',
-            'E:\\SteamLibrary\\steamapps\\common\\Euro Truck Simulator 2',
-            'F:\\Steam\\steamapps\\common\\Euro Truck Simulator 2',
-            'F:\\SteamLibrary\\steamapps\\common\\Euro Truck Simulator 2',
-            'G:\\Steam\\steamapps\\common\\Euro Truck Simulator 2',
-            'G:\\SteamLibrary\\steamapps\\common\\Euro Truck Simulator 2'
-        ]
-        
-        # 检查每个路径是否存在
-        for path in common_paths:
-            if os.path.exists(path) and os.path.isdir(path):
-                # 进一步验证是否存在游戏主程序
-                game_exe = os.path.join(path, "bin", "win_x64", "eurotrucks2.exe")
-                if os.path.exists(game_exe):
-                    self.logger.info(f"找到欧洲卡车模拟2安装路径: {path}")
-                    return path
-        
-        self.logger.info("未找到欧洲卡车模拟2安装路径，使用默认路径")
+    @startup_phase("MainWindow.load_saved_game_path")
+    def load_saved_game_path(self):
+        """
+        读取配置中保存的游戏路径，用保存的指纹检查（一次stat）游戏主程序是否未变化
+        
+        Returns:
+            str: 仍然有效的游戏路径，没有保存或已失效时返回空字符串
+        """
+        dlc_settings = self.config.settings.dlc
+        path = dlc_settings.game_path
+        if not path:
+            return ""
+        if verify_game_path(path, dlc_settings.game_fingerprint):
+            self.logger.info(f"使用已保存的游戏路径: {path}")
+            return path
+        self.logger.info(f"已保存的游戏路径已失效或游戏已更新，重新检测: {path}")
         return ""
-
+    
+    def save_game_path(self, path):
+        """
+        把游戏路径和游戏主程序的指纹保存到配置
+        
+        Returns:
+            bool: 是否保存（目录中没有游戏主程序时不保存，由配置在后台延迟写入）
+        """
+        fingerprint = game_fingerprint(path)
+        if fingerprint is None:
+            self.logger.warning(f"目录中没有游戏主程序，不保存游戏路径: {path}")
+            return False
+        dlc_settings = self.config.settings.dlc
+        if dlc_settings.game_path == path and dlc_settings.game_fingerprint == fingerprint:
+            return True
+        with self.config.batch():
+            self.config.set('dlc.game_path', path)
+            self.config.set('dlc.game_fingerprint', fingerprint)
+        return True
+    
+    def start_game_path_detection(self):
+        """在守护线程中查找欧洲卡车模拟2的安装路径，结果通过game_path_detected信号回到界面线程"""
+        if self._game_path_detection_started:
+            return
+        self._game_path_detection_started = True
+        
+        def detect():
+            try:
+                path = find_game_path(on_late_result=self._emit_game_path)
+            except Exception as e:
+                self.logger.error(f"查找欧洲卡车模拟2安装路径失败: {e}")
+                path = ""
+            self._emit_game_path(path)
+        
+        threading.Thread(target=detect, name="GamePathDetection", daemon=True).start()
+    
+    def _emit_game_path(self, path):
+        """从检测线程发出检测结果（窗口已销毁时忽略）"""
+        try:
+            self.game_path_detected.emit(path)
+        except RuntimeError:
+            pass
+    
+    def on_game_path_detected(self, path):
+        """后台检测到游戏路径（可能在窗口显示很久之后才返回），更新设置页面并重新扫描列表"""
+        if self.game_path:
+            return
+        if not path:
+            # 检测失败时，已保存的路径（如手动选择的非Steam安装、游戏更新后指纹失效）仍是游戏目录则继续使用
+            saved_path = self.config.settings.dlc.game_path
+            if not saved_path or not is_game_directory(saved_path):
+                self.logger.info("未找到欧洲卡车模拟2安装路径，请在设置中手动选择")
+                return
+            path = saved_path
+            self.logger.info(f"继续使用已保存的游戏路径: {path}")
+        else:
+            self.logger.info(f"找到欧洲卡车模拟2安装路径: {path}")
+        
+        self.game_path = path
+        self.save_game_path(path)
+        
+        # 设置页面的输入框为空时填入检测结果（用户已手动输入的路径优先）
+        if self.settings_page is not None and not self.game_path_input.text().strip():
+            self.game_path_input.setText(path)
+        
+        # 正在批量移动时不切换目录
+        if self.move_worker is not None:
+            return
+        
+        # 完成上次中断的批量移动，恢复完成后再扫描
+        recovery_worker = self.create_recovery_worker(path)
+        if recovery_worker is not None:
+            self.start_move_recovery(recovery_worker)
+        elif self.get_game_path() == path:
+            self.refresh_dlc_pages()
+    
+    @startup_phase("MainWindow.create_settings_page")
     def create_settings_page(self):
         """创建设置页面"""
         page = QWidget()
@@ -1080,12 +1313,8 @@ class MainWindow(QMainWindow):
         self.game_path_input = QLineEdit()
         self.game_path_input.setPlaceholderText("请选择欧洲卡车模拟2的安装路径...")
         
-        # 自动搜索游戏路径
-        auto_detected_path = self.find_ets2_installation_path()
-        if auto_detected_path:
-            self.game_path_input.setText(auto_detected_path)
-        else:
-            self.game_path_input.setText("C:\\Program Files (x86)\\Steam\\steamapps\\common\\Euro Truck Simulator 2")
+        # 使用自动检测到的游戏路径（检测尚未完成时留空，完成后自动填入）
+        self.game_path_input.setText(self.game_path)
         
         game_path_layout.addWidget(self.game_path_input)
         
@@ -1095,8 +1324,6 @@ class MainWindow(QMainWindow):
         
         settings_layout.addLayout(game_path_layout)
         
-        # 主题设置已移除
-        
         # 实用工具区域
         tools_group = QWidget()
         tools_layout = QVBoxLayout(tools_group)
@@ -1104,134 +1331,59 @@ class MainWindow(QMainWindow):
         # 语言设置
         language_layout = QHBoxLayout()
         self.language_label = QLabel(tr('settings.language'))
-        self.language_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: 600;
-                color: #2c3e50;
-                min-width: 80px;
-                padding-right: 12px;
-                background-color: transparent;
-            }
-        """)
+        self.language_label.setObjectName("settings_label")
         language_layout.addWidget(self.language_label)
         
         self.language_combo = QComboBox()
+        self.language_combo.setObjectName("settings_combo")
         self.language_combo.addItems(["中文", "English"])
         self.language_combo.setToolTip("切换界面语言")
         
-        # 设置当前语言（从配置读取，默认为中文）
-        current_lang = self.config.get('ui.language', 'zh_CN')
-        if current_lang == 'en':
-            self.language_combo.setCurrentIndex(1)  # English
-        else:
-            self.language_combo.setCurrentIndex(0)  # 中文
+        # 设置当前语言（从配置读取）
+        self.language_combo.setCurrentIndex(self.language_combo_index(self.config.settings.ui.language))
         
         self.language_combo.currentIndexChanged.connect(self.on_language_changed)
-        self.language_combo.setStyleSheet("""
-            QComboBox {
-                border: 2px solid #e9ecef;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 140px;
-                background-color: #ffffff;
-                color: #495057;
-                selection-background-color: #007bff;
-            }
-            QComboBox:hover {
-                border-color: #007bff;
-                background-color: #f8f9fa;
-            }
-            QComboBox:focus {
-                border-color: #0056b3;
-                outline: none;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-                background-color: transparent;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 6px solid transparent;
-                border-right: 6px solid transparent;
-                border-top: 6px solid #6c757d;
-                margin-right: 8px;
-            }
-            QComboBox::down-arrow:hover {
-                border-top-color: #007bff;
-            }
-            QComboBox::down-arrow:pressed {
-                border-top-color: #0056b3;
-            }
-            QComboBox QAbstractItemView {
-                border: 2px solid #e9ecef;
-                border-radius: 8px;
-                background-color: #ffffff;
-                selection-background-color: #007bff;
-                selection-color: #ffffff;
-                outline: none;
-                margin-top: 2px;
-                padding: 4px;
-            }
-            QComboBox QAbstractItemView::item {
-                padding: 8px 12px;
-                border-radius: 4px;
-                margin: 2px 0;
-            }
-            QComboBox QAbstractItemView::item:hover {
-                background-color: #f8f9fa;
-                color: #495057;
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background-color: #007bff;
-                color: #ffffff;
-            }
-        """)
         language_layout.addWidget(self.language_combo)
         language_layout.addStretch()
         tools_layout.addLayout(language_layout)
         
+        # 主题设置
+        theme_layout = QHBoxLayout()
+        self.theme_label = QLabel(tr('settings.theme'))
+        self.theme_label.setObjectName("settings_label")
+        theme_layout.addWidget(self.theme_label)
+        
+        self.theme_combo = QComboBox()
+        self.theme_combo.setObjectName("settings_combo")
+        for theme in self.theme_manager.supported_themes:
+            self.theme_combo.addItem(tr(f'settings.theme_{theme}'), theme)
+        self.theme_combo.setToolTip(tr('settings.theme'))
+        
+        # 设置当前主题
+        current_index = self.theme_combo.findData(self.theme_manager.current_theme)
+        self.theme_combo.setCurrentIndex(max(current_index, 0))
+        
+        self.theme_combo.currentIndexChanged.connect(self.on_theme_changed)
+        theme_layout.addWidget(self.theme_combo)
+        theme_layout.addStretch()
+        tools_layout.addLayout(theme_layout)
+        
         # 添加分隔线
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet("color: #e9ecef;")
+        separator.setObjectName("settings_separator")
         tools_layout.addWidget(separator)
         
         # 打开日志文件夹按钮
         self.open_logs_btn = QPushButton(tr('settings.open_logs'))
+        self.open_logs_btn.setObjectName("open_logs_btn")
         self.open_logs_btn.setToolTip(tr('settings.open_logs'))
         self.open_logs_btn.clicked.connect(self.open_logs_folder)
-        self.open_logs_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1e7e34;
-            }
-        """)
         tools_layout.addWidget(self.open_logs_btn)
         
         # 日志说明标签
         self.logs_info_label = QLabel(tr('settings.logs_info'))
-        self.logs_info_label.setStyleSheet("""
-            QLabel {
-                color: #6c757d;
-                font-size: 12px;
-                padding: 5px;
-            }
-        """)
+        self.logs_info_label.setObjectName("logs_info_label")
         tools_layout.addWidget(self.logs_info_label)
         
         # GitHub仓库链接按钮
@@ -1246,43 +1398,79 @@ class MainWindow(QMainWindow):
     
     def show_page(self, page_widget):
         """显示指定页面，隐藏其他页面"""
-        # 隐藏所有页面
-        self.installed_page.hide()
-        self.uninstalled_page.hide()
-        self.settings_page.hide()
+        # 隐藏所有已创建的页面
+        for page in (self.installed_page, self.uninstalled_page, self.settings_page):
+            if page is not None:
+                page.hide()
         
         # 显示指定页面
         page_widget.show()
     
-    def on_language_changed(self, index):
-        """语言切换事件处理"""
-        # 根据索引确定语言代码
-        if index == 0:  # 中文
-            language_code = 'zh_CN'
-            language_name = '中文'
-        else:  # English
-            language_code = 'en'
-            language_name = 'English'
-        
-        # 加载新语言
-        if self.language_manager.load_language(language_code):
-            self.logger.info(f"语言切换为: {language_name} ({language_code})")
-            
-            # 保存语言设置到配置（存储在ui.language中）
-            if self.config:
-                self.config.set('ui.language', language_code)
-                self.config.save_config()
+    def on_theme_changed(self, index):
+        """主题切换事件处理（保存到ui.theme，由配置变化通知应用主题）"""
+        self.config.set('ui.theme', self.theme_combo.itemData(index))
+    
+    def apply_theme(self, theme):
+        """
+        应用界面主题：设置应用程序样式表并更新列表卡片配色
+        
+        Args:
+            theme: 主题名称
             
-            # 更新界面文本
-            self.update_ui_texts()
-        else:
-            self.logger.error(f"语言加载失败: {language_code}")
-            # 恢复之前的语言选择
-            current_lang = self.config.get('ui.language', 'zh_CN')
-            if current_lang == 'en':
-                self.language_combo.setCurrentIndex(1)
+        Returns:
+            bool: 是否应用成功
+        """
+        if not self.theme_manager.apply(QApplication.instance(), theme):
+            self.logger.error(f"主题应用失败: {theme}")
+            return False
+        
+        colors = self.theme_manager.colors()
+        for page in self.dlc_pages():
+            page.dlc_list.set_theme_colors(colors)
+        return True
+    
+    def on_language_changed(self, index):
+        """语言切换事件处理（保存到ui.language，由配置变化通知切换界面语言）"""
+        language_code = 'en' if index == 1 else 'zh_CN'
+        self.config.set('ui.language', language_code)
+    
+    @staticmethod
+    def language_combo_index(language_code):
+        """语言代码对应的语言下拉框索引（0: 中文，1: English）"""
+        return 1 if language_code == 'en' else 0
+    
+    def select_combo_index(self, combo, index):
+        """设置下拉框的当前项而不触发切换事件"""
+        combo.blockSignals(True)
+        combo.setCurrentIndex(max(index, 0))
+        combo.blockSignals(False)
+    
+    def on_config_changed(self, key_path, value):
+        """
+        界面配置变化（设置页面的修改和代码中的config.set都经过这里）
+        
+        Args:
+            key_path: 配置项路径
+            value: 新值
+        """
+        if key_path == 'ui.theme':
+            if not self.apply_theme(value):
+                # 恢复为仍在使用的主题
+                self.config.set('ui.theme', self.theme_manager.current_theme)
+                value = self.theme_manager.current_theme
+            if self.settings_page is not None:
+                self.select_combo_index(self.theme_combo, self.theme_combo.findData(value))
+        elif key_path == 'ui.language':
+            if self.language_manager.load_language(value):
+                self.logger.info(f"语言切换为: {value}")
+                self.update_ui_texts()
             else:
-                self.language_combo.setCurrentIndex(0)
+                self.logger.error(f"语言加载失败: {value}")
+                # 恢复为仍在使用的语言
+                self.config.set('ui.language', self.language_manager.current_language)
+                value = self.language_manager.current_language
+            if self.settings_page is not None:
+                self.select_combo_index(self.language_combo, self.language_combo_index(value))
     
 
     def update_ui_texts(self):
@@ -1313,8 +1501,8 @@ class MainWindow(QMainWindow):
             if self.uninstall_all_btn:
                 self.uninstall_all_btn.setText(tr('installed.uninstall_all'))
         
-        # 更新未安装页面文本
-        if hasattr(self, 'uninstalled_page'):
+        # 更新未安装页面文本（尚未创建的页面在创建时使用当前语言）
+        if self.uninstalled_page is not None:
             # 查找未安装页面的标题标签
             title_label = self.uninstalled_page.findChild(QLabel, "page_title")
             if title_label:
@@ -1331,8 +1519,12 @@ class MainWindow(QMainWindow):
             if self.install_all_btn:
                 self.install_all_btn.setText(tr('uninstalled.install_all'))
         
+        # 更新批量移动进度面板
+        if hasattr(self, 'move_cancel_btn'):
+            self.move_cancel_btn.setText(tr('common.cancel'))
+        
         # 更新设置页面文本
-        if hasattr(self, 'settings_page'):
+        if self.settings_page is not None:
             # 查找设置页面的标题标签
             title_label = self.settings_page.findChild(QLabel, "page_title")
             if title_label:
@@ -1350,6 +1542,13 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'language_label'):
                 self.language_label.setText(tr('settings.language'))
             
+            # 更新主题标签和选项
+            if hasattr(self, 'theme_label'):
+                self.theme_label.setText(tr('settings.theme'))
+                self.theme_combo.setToolTip(tr('settings.theme'))
+                for i in range(self.theme_combo.count()):
+                    self.theme_combo.setItemText(i, tr(f'settings.theme_{self.theme_combo.itemData(i)}'))
+            
             # 更新日志按钮
             if hasattr(self, 'open_logs_btn'):
                 self.open_logs_btn.setText(tr('settings.open_logs'))
@@ -1372,304 +1571,26 @@ class MainWindow(QMainWindow):
         
         self.logger.info("界面文本已更新为当前语言")
     
+    @startup_phase("MainWindow.setup_menu")
     def setup_menu(self):
         """设置菜单栏 - 简化版本"""
         pass  # 移除菜单栏
     
+    @startup_phase("MainWindow.setup_toolbar")
     def setup_toolbar(self):
         """设置工具栏 - 简化版本"""
         pass  # 移除工具栏
     
+    @startup_phase("MainWindow.setup_statusbar")
     def setup_statusbar(self):
         """设置状态栏 - 简化版本"""
         pass  # 移除状态栏
     
+    @startup_phase("MainWindow.apply_styles")
     def apply_styles(self):
-        """应用默认样式"""
-        self.setStyleSheet("""
-            /* 主窗口样式 */
-            QMainWindow {
-                background-color: #f8f9fa;
-            }
-            
-            /* 左侧菜单栏样式 */
-            QWidget#left_menu_panel {
-                background-color: #ffffff;
-                border-right: 1px solid #e9ecef;
-            }
-            
-            /* 导航栏标题 */
-            QLabel#nav_title {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 20px 10px;
-                background-color: #f8f9fa;
-                border-right: 1px solid #e9ecef;
-            }
-            
-            /* 导航栏分隔线 */
-            QFrame#nav_separator {
-                background-color: #e9ecef;
-                min-height: 1px;
-                max-height: 1px;
-            }
-            
-            /* 导航按钮样式 */
-            QToolButton {
-                border: none;
-                background-color: transparent;
-                color: #495057;
-                font-size: 14px;
-                text-align: left;
-                padding: 15px 20px;
-                margin: 0px;
-                border-radius: 0px;
-                width: 100%;
-            }
-            
-            QToolButton:hover {
-                background-color: #f1f3f4;
-                color: #212529;
-                border-left: 3px solid #007bff;
-            }
-            
-            QToolButton:pressed {
-                background-color: #e9ecef;
-            }
-            
-            QToolButton:checked {
-                background-color: #e3f2fd;
-                color: #1976d2;
-                border-left: 3px solid #1976d2;
-                font-weight: 500;
-            }
-            
-            /* 右侧内容区域样式 */
-            QWidget#right_content_panel {
-                background-color: #f8f9fa;
-            }
-            
-            QWidget#content_stack {
-                background-color: #ffffff;
-                border-radius: 8px;
-                margin: 20px;
-            }
-            
-            /* 页面标题 */
-            QLabel#page_title {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 20px 0px;
-            }
-            
-            /* 页面副标题 */
-            QLabel#page_subtitle {
-                font-size: 16px;
-                color: #6c757d;
-                padding: 10px 0px;
-            }
-            
-            /* 页面功能介绍 */
-            QLabel#page_features {
-                font-size: 14px;
-                color: #495057;
-                line-height: 1.6;
-                padding: 20px;
-                background-color: #f8f9fa;
-                border-radius: 8px;
-                border: 1px solid #e9ecef;
-            }
-            
-            /* 页面头部 */
-            QWidget#page_header {
-                border-bottom: 1px solid #e9ecef;
-                padding-bottom: 15px;
-                margin-bottom: 20px;
-            }
-            
-            /* 内容区域 */
-            QTextEdit#content_area {
-                border: 1px solid #e9ecef;
-                border-radius: 4px;
-                background-color: #ffffff;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 13px;
-                color: #212529;
-            }
-            
-            /* 游戏路径信息区域 */
-            QWidget#path_info {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 10px;
-                margin: 10px 0;
-            }
-            
-            QLabel#path_label {
-                font-weight: bold;
-                color: #495057;
-                min-width: 100px;
-            }
-            
-
-            
-            /* 页面操作按钮区域 */
-            QWidget#page_actions {
-                border-top: 1px solid #e9ecef;
-                padding-top: 15px;
-                margin-top: 20px;
-            }
-            
-            /* 按钮样式 */
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 100px;
-            }
-            
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-            
-            /* 输入框样式 */
-            QLineEdit {
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 14px;
-                background-color: #ffffff;
-                color: #495057;
-            }
-            
-            QLineEdit:focus {
-                border-color: #80bdff;
-                outline: none;
-            }
-            
-            /* 标签样式 */
-            QLabel {
-                color: #212529;
-                font-size: 14px;
-            }
-            
-            /* DLC列表样式 - 网格视图，现代化交互效果 */
-            QListWidget#installed_dlc_list {
-                background-color: #f8f9fa;
-                border: none;
-                outline: none;
-                padding: 5px;
-            }
-            
-            /* 默认状态 - 白色卡片，细边框 */
-            QListWidget#installed_dlc_list::item {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #fafbfc);
-                border: 2px solid #e1e4e8;
-                border-radius: 12px;
-                padding: 8px;
-                margin: 3px;
-                text-align: center;
-                color: #24292e;
-                font-weight: 500;
-            }
-            
-            /* 悬停效果 - 移除边框，完全由paintEvent绘制 */
-            QListWidget#installed_dlc_list::item:hover {
-                background: transparent;
-                border: none;
-                color: #0366d6;
-                font-weight: 600;
-            }
-            
-            /* 选中状态 - 渐变蓝色背景 + 发光边框 + 白色文字 */
-            QListWidget#installed_dlc_list::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2188ff, stop:0.5 #0366d6, stop:1 #005cc5);
-                border: 3px solid #79b8ff;
-                border-radius: 12px;
-                color: #ffffff;
-                font-weight: 700;
-            }
-            
-            /* 选中且悬停 - 更亮的蓝色渐变 */
-            QListWidget#installed_dlc_list::item:selected:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #54a3ff, stop:0.5 #2188ff, stop:1 #0366d6);
-                border: 3px solid #c8e1ff;
-                border-radius: 12px;
-            }
-            
-            /* 焦点状态 - 外发光效果 */
-            QListWidget#installed_dlc_list::item:focus {
-                border: 3px solid #79b8ff;
-                outline: none;
-            }
-            
-            /* 未安装DLC列表样式 - 与已安装列表一致，使用绿色主题 */
-            QListWidget#uninstalled_dlc_list {
-                background-color: #f8f9fa;
-                border: none;
-                outline: none;
-                padding: 5px;
-            }
-            
-            /* 默认状态 - 白色卡片，细边框 */
-            QListWidget#uninstalled_dlc_list::item {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #fafbfc);
-                border: 2px solid #e1e4e8;
-                border-radius: 12px;
-                padding: 8px;
-                margin: 3px;
-                text-align: center;
-                color: #24292e;
-                font-weight: 500;
-            }
-            
-            /* 悬停效果 - 绿色文字 */
-            QListWidget#uninstalled_dlc_list::item:hover {
-                background: transparent;
-                border: none;
-                color: #2e7d32;
-                font-weight: 600;
-            }
-            
-            /* 选中状态 - 渐变绿色背景 + 发光边框 + 白色文字 */
-            QListWidget#uninstalled_dlc_list::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66bb6a, stop:0.5 #4caf50, stop:1 #43a047);
-                border: 3px solid #a5d6a7;
-                border-radius: 12px;
-                color: #ffffff;
-                font-weight: 700;
-            }
-            
-            /* 选中且悬停 - 更亮的绿色渐变 */
-            QListWidget#uninstalled_dlc_list::item:selected:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #81c784, stop:0.5 #66bb6a, stop:1 #4caf50);
-                border: 3px solid #c8e6c9;
-                border-radius: 12px;
-            }
-            
-            /* 焦点状态 - 外发光效果 */
-            QListWidget#uninstalled_dlc_list::item:focus {
-                border: 3px solid #a5d6a7;
-                outline: none;
-            }
-        """)
+        """应用保存的界面主题（样式定义在themes目录中，编译后设置到应用程序上）"""
+        if not self.apply_theme(self.config.settings.ui.theme):
+            self.apply_theme('light')
     
     # 事件处理方法
 
@@ -1702,6 +1623,7 @@ class MainWindow(QMainWindow):
         """显示已安装DLC"""
         self.update_nav_button_state(self.installed_btn)
         self.show_page(self.installed_page)
+        self.cancel_dlc_scan(self.uninstalled_page)
         self.logger.info("显示已安装DLC")
         
         # 检查DLC文件
@@ -1710,11 +1632,12 @@ class MainWindow(QMainWindow):
     def show_uninstalled_dlc(self):
         """显示未安装的DLC - 动态切换内容"""
         self.update_nav_button_state(self.uninstalled_btn)
-        self.show_page(self.uninstalled_page)
+        self.show_page(self.ensure_uninstalled_page())
+        self.cancel_dlc_scan(self.installed_page)
         self.logger.info("显示未安装DLC")
         
-        # 自动刷新未安装DLC列表
-        self.refresh_uninstalled_dlc()
+        # 显示未安装DLC列表
+        self.show_uninstalled_dlc_list()
     
     def update_nav_button_state(self, active_button):
         """更新导航按钮状态"""
@@ -1730,141 +1653,511 @@ class MainWindow(QMainWindow):
     def refresh_installed_dlc(self):
         """刷新已安装DLC列表"""
         self.logger.info("刷新已安装DLC列表")
-        # 重新检查DLC文件
+        # 使索引失效后重新扫描游戏目录
+        self.sync_game_path()
+        self.dlc_repository.invalidate(INSTALLED)
         self.check_and_display_dlcs()
     
+    def get_game_path(self):
+        """获取当前游戏路径 - 优先从设置界面的输入框获取，设置页面尚未创建时使用自动检测的路径，都为空时尝试从config读取"""
+        if self.settings_page is not None and self.game_path_input.text().strip():
+            return self.game_path_input.text().strip()
+        if self.game_path:
+            return self.game_path
+        return self.config.settings.dlc.game_path
+    
+    def sync_game_path(self):
+        """把当前游戏路径同步到DLC索引（路径变化时索引会被清空），返回游戏路径"""
+        game_path = self.get_game_path()
+        if self.dlc_repository.set_game_path(game_path):
+            self.dlc_watcher.watch([game_path, self.dlc_repository.temp_dir])
+        return game_path
+    
     def check_and_display_dlcs(self):
         """检查DLC文件并显示相应信息（带图片）"""
-        try:
-            # 优先从设置界面的输入框获取路径，若为空则尝试从config读取
-            game_path = self.game_path_input.text().strip() if hasattr(self, 'game_path_input') and self.game_path_input.text().strip() else (
-                self.config.get('dlc', {}).get('game_path', '') if hasattr(self.config, 'get') else self.config.get("game_path", "")
-            )
-            if not game_path or not os.path.exists(game_path):
-                self.installed_page.dlc_list.clear()
-                self.uninstall_all_btn.setVisible(False)
-                return
-            
-            # 查找以dlc开头，后缀为.scs的文件
-            dlc_files = []
-            for file in os.listdir(game_path):
-                if file.lower().startswith("dlc") and file.lower().endswith(".scs"):
-                    dlc_files.append(file)
-            
-            # 清空列表并重新填充
-            self.installed_page.dlc_list.clear()
-            
-            if dlc_files:
-                # 按名称排序并添加到列表
-                for file in sorted(dlc_files):
-                    # 查找对应的DLC信息
-                    dlc_info = self.find_dlc_info_by_file(file)
-                    
-                    if dlc_info:
-                        # 如果找到DLC信息，只显示DLC名称
-                        display_text = dlc_info.get('name', file)
-                        item = QListWidgetItem(display_text)
-                        item.setData(Qt.ItemDataRole.UserRole, file)  # 保存文件名
-                        item.setToolTip(f"{dlc_info.get('name', file)}\n文件: {file}")  # 悬停提示显示完整信息
-                        
-                        # 从本地加载图标
-                        self.load_image_for_item(item, dlc_info)
-                    else:
-                        # 如果没有找到DLC信息，只显示文件名
-                        item = QListWidgetItem(file)
-                        item.setData(Qt.ItemDataRole.UserRole, file)
-                        item.setToolTip(file)
-                    
-                    self.installed_page.dlc_list.addItem(item)
-                
-                self.uninstall_selected_btn.setVisible(True)
-                self.uninstall_all_btn.setVisible(True)
-                self.logger.info(f"在 {game_path} 中找到 {len(dlc_files)} 个DLC文件")
+        self.display_dlc_page(self.installed_page)
+    
+    def display_dlc_page(self, page):
+        """
+        显示页面对应位置的DLC文件 - 索引已加载时直接从内存读取，否则在后台扫描一次
+        
+        Args:
+            page: 已安装/未安装页面
+        """
+        if self.move_worker is not None and self.move_worker.recover_mode:
+            # 正在恢复上次中断的批量移动，恢复完成后重新扫描
+            return
+        self.sync_game_path()
+        if self.dlc_repository.is_loaded(page.location):
+            self.cancel_dlc_scan(page)
+            self.populate_dlc_page(page, self.dlc_repository.files(page.location))
+        else:
+            self.start_dlc_scan(page)
+    
+    def refresh_dlc_pages(self):
+        """文件移动后从DLC索引重新填充已创建的页面"""
+        for page in self.dlc_pages():
+            self.display_dlc_page(page)
+    
+    def populate_dlc_page(self, page, records):
+        """用索引记录更新页面列表 - 只插入新增、移除消失的文件，保留选择状态和滚动位置"""
+        page.model.sync(records)
+        page.directory = self.dlc_repository.directory(page.location)
+        self.finish_dlc_page(page, len(records), page.directory)
+    
+    def add_dlc_items(self, page, records):
+        """把DLC记录按文件名排序插入页面列表"""
+        if not records:
+            return
+        # 移除"未找到DLC文件"/错误提示
+        page.dlc_list.set_message("")
+        # 代理模型自动按当前搜索文本过滤新插入的行
+        page.model.insert_records(records)
+    
+    def remove_dlc_item(self, page, name):
+        """从页面列表中移除单个DLC文件"""
+        page.model.remove_name(name)
+    
+    def on_dlc_files_changed(self, names):
+        """
+        目录监控报告文件变化 - 逐个文件增量更新索引和列表，不重建整个列表
+        
+        Args:
+            names: 发生变化的DLC文件名列表
+        """
+        changed_pages = set()
+        
+        for name in names:
+            for location, existed, record in self.sync_dlc_item(name, changed_pages):
+                if not existed:
+                    self.logger.info(f"检测到新增DLC文件: {name} ({location})")
+                elif not record:
+                    self.logger.info(f"检测到DLC文件被删除: {name} ({location})")
+                else:
+                    self.logger.info(f"检测到DLC文件被修改: {name} ({location})")
+        
+        self.update_dlc_page_states(changed_pages)
+    
+    def sync_dlc_item(self, name, changed_pages, update=None):
+        """
+        更新单个文件的索引，并把两个位置中发生变化的记录同步到对应页面
+        （文件移动时记录对象和已加载的图标直接复用）
+        
+        Args:
+            name: DLC文件名
+            changed_pages: 行数发生变化的页面会加入这个集合
+            update: 更新索引的函数，默认按磁盘状态重新检查两个位置
+        
+        Returns:
+            list: 发生变化的位置 [(位置, 变化前是否存在, 当前记录或None)]
+        """
+        locations = (INSTALLED, PARKED)
+        before = {}
+        for location in locations:
+            record = self.dlc_repository.get(name, location)
+            before[location] = (record.size, record.mtime) if record else None
+        
+        if update is not None:
+            update()
+        else:
+            for location in locations:
+                self.dlc_repository.refresh_file(name, location)
+        
+        changes = []
+        for location in locations:
+            record = self.dlc_repository.get(name, location)
+            if before[location] == ((record.size, record.mtime) if record else None):
+                # 本程序自己移动的文件，索引已经是最新的
+                continue
+            changes.append((location, before[location] is not None, record))
+            if self.update_dlc_item(location, name, before[location] is not None, record):
+                changed_pages.add(self.dlc_page(location))
+        return changes
+    
+    def dlc_page(self, location):
+        """位置对应的页面（尚未创建时为None）"""
+        return self.installed_page if location == INSTALLED else self.uninstalled_page
+    
+    def update_dlc_item(self, location, name, existed, record):
+        """
+        按索引记录更新页面中的单行
+        
+        Args:
+            location: 发生变化的位置
+            name: DLC文件名
+            existed: 变化前该位置是否有这个文件
+            record: 文件在该位置的当前记录，已不存在时为None
+        
+        Returns:
+            bool: 页面行数是否发生了变化
+        """
+        # 尚未创建的页面不需要更新，创建后首次显示时从索引读取；
+        # 尚未扫描的位置在显示该页面时会完整扫描一次
+        page = self.dlc_page(location)
+        if (page is None or page.scan_worker is not None
+                or not self.dlc_repository.is_loaded(location)):
+            return False
+        
+        if existed and record:
+            # 文件内容变化，只重绘该行
+            page.model.update_record(record)
+            return False
+        if existed:
+            self.remove_dlc_item(page, name)
+        else:
+            self.add_dlc_items(page, [record])
+        return True
+    
+    def update_dlc_page_states(self, pages):
+        """行数变化后更新按钮状态和空列表提示"""
+        for page in pages:
+            if not page.model.rowCount():
+                self.finish_dlc_page(page, 0, self.dlc_repository.directory(page.location))
             else:
-                # 未找到DLC文件
-                item = QListWidgetItem(tr('uninstalled.no_files'))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-                self.installed_page.dlc_list.addItem(item)
-                self.uninstall_selected_btn.setVisible(False)
-                self.uninstall_all_btn.setVisible(False)
-                self.logger.info(f"在 {game_path} 中未找到DLC文件")
-                
-        except Exception as e:
-            self.installed_page.dlc_list.clear()
-            error_item = QListWidgetItem(f"{tr('common.error')}: {str(e)}")
-            error_item.setFlags(error_item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-            self.installed_page.dlc_list.addItem(error_item)
-            self.uninstall_selected_btn.setVisible(False)
-            self.uninstall_all_btn.setVisible(False)
-            self.logger.error(f"检查DLC文件时出错: {e}")
-    
-    def load_image_for_item(self, item, dlc_info):
-        """从本地加载DLC图片"""
-        # 获取DLC ID
-        dlc_id = dlc_info.get('dlc_id', 0)
-        if not dlc_id:
+                page.dlc_list.set_message("")
+                for btn in page.action_buttons:
+                    btn.setVisible(True)
+    
+    def finish_dlc_page(self, page, total, directory):
+        """列表填充完成后更新按钮状态和空列表提示"""
+        if total:
+            page.dlc_list.set_message("")
+            for btn in page.action_buttons:
+                btn.setVisible(True)
+            self.logger.info(f"在 {directory} 中找到 {total} 个DLC文件")
+        else:
+            # 未找到DLC文件
+            page.dlc_list.set_message(tr('uninstalled.no_files'))
+            for btn in page.action_buttons:
+                btn.setVisible(False)
+            self.logger.info(f"在 {directory} 中未找到DLC文件")
+    
+    def start_dlc_scan(self, page):
+        """
+        在后台扫描页面对应的目录，扫描结果写入DLC索引并分批填充到页面列表中
+        
+        Args:
+            page: 已安装/未安装页面
+        """
+        # 同一页面同时只保留一个扫描任务
+        self.cancel_dlc_scan(page)
+        
+        # 重新扫描同一目录时保留现有的行，扫描完成后再移除已不存在的文件
+        directory = self.dlc_repository.directory(page.location)
+        if page.directory != directory:
+            page.model.clear()
+            page.directory = directory
+        self.dlc_repository.clear_location(page.location)
+        
+        self._scan_serial += 1
+        worker = DlcScanWorker(self._scan_serial, directory, page.location)
+        worker.signals.batch_found.connect(lambda scan_id, entries: self.on_dlc_scan_batch(page, scan_id, entries))
+        worker.signals.finished.connect(lambda scan_id, total: self.on_dlc_scan_finished(page, scan_id, total))
+        worker.signals.missing.connect(lambda scan_id: self.on_dlc_scan_missing(page, scan_id))
+        worker.signals.failed.connect(lambda scan_id, message: self.on_dlc_scan_failed(page, scan_id, message))
+        page.scan_worker = worker
+        self.start_worker(self.scan_pool, worker)
+    
+    def start_worker(self, pool, worker):
+        """
+        在线程池中运行任务，并保留任务的引用直到它的done信号
+        （任务设置了setAutoDelete(False)，页面属性被清空后不能让任务和信号对象被回收）
+        """
+        self._running_workers.add(worker)
+        worker.signals.done.connect(lambda: self._running_workers.discard(worker))
+        pool.start(worker)
+    
+    def cancel_dlc_scan(self, page):
+        """取消页面上正在进行的扫描（有操作在等待扫描结果时继续扫描）"""
+        worker = getattr(page, 'scan_worker', None)
+        if worker and not page.scan_waiters:
+            worker.cancel()
+            page.scan_worker = None
+    
+    def after_dlc_scan(self, page, callback):
+        """
+        页面对应的位置扫描完成后执行操作：已扫描时立即执行，否则在后台扫描（或等待正在进行的扫描）完成后执行
+        
+        Args:
+            page: 已安装/未安装页面
+            callback: 无参数的函数
+        """
+        if self.dlc_repository.is_loaded(page.location):
+            callback()
+            return
+        page.scan_waiters.append(callback)
+        if page.scan_worker is None:
+            self.start_dlc_scan(page)
+    
+    def run_scan_waiters(self, page):
+        """扫描完成后执行等待中的操作"""
+        waiters, page.scan_waiters = page.scan_waiters, []
+        for callback in waiters:
+            callback()
+    
+    def is_current_scan(self, page, scan_id):
+        """判断扫描结果是否属于页面当前的扫描任务（过期、已取消或游戏路径已变化的结果直接丢弃）"""
+        worker = page.scan_worker
+        return (worker is not None and worker.scan_id == scan_id and not worker.is_cancelled()
+                and worker.directory == self.dlc_repository.directory(page.location))
+    
+    def on_dlc_scan_batch(self, page, scan_id, entries):
+        """收到一批扫描结果，写入索引并插入列表"""
+        if not self.is_current_scan(page, scan_id):
+            return
+        
+        records = self.dlc_repository.add_entries(page.location, entries)
+        self.add_dlc_items(page, records)
+    
+    def on_dlc_scan_finished(self, page, scan_id, total):
+        """扫描完成"""
+        if not self.is_current_scan(page, scan_id):
+            return
+        
+        directory = page.scan_worker.directory
+        page.scan_worker = None
+        self.dlc_repository.mark_loaded(page.location)
+        # 移除扫描中没有再出现的文件
+        page.model.sync(self.dlc_repository.files(page.location))
+        self.finish_dlc_page(page, total, directory)
+        self.run_scan_waiters(page)
+    
+    def on_dlc_scan_missing(self, page, scan_id):
+        """要扫描的目录不存在"""
+        if not self.is_current_scan(page, scan_id):
             return
         
-        # 检查内存缓存
-        cache_key = str(dlc_id)
-        if cache_key in self.image_cache:
-            pixmap = self.image_cache[cache_key]
-            if not pixmap.isNull():
-                # 使用IgnoreAspectRatio强制缩放到固定尺寸，确保所有图片大小一致
-                scaled_pixmap = pixmap.scaled(240, 120, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                item.setIcon(QIcon(scaled_pixmap))
+        page.scan_worker = None
+        self.dlc_repository.mark_loaded(page.location)
+        page.model.clear()
+        for btn in page.action_buttons:
+            btn.setVisible(False)
+        self.run_scan_waiters(page)
+    
+    def on_dlc_scan_failed(self, page, scan_id, message):
+        """扫描出错"""
+        if not self.is_current_scan(page, scan_id):
             return
         
+        page.scan_worker = None
+        # 扫描出错时放弃等待中的操作（错误信息显示在列表中）
+        page.scan_waiters = []
+        page.model.clear()
+        page.dlc_list.set_message(f"{tr('common.error')}: {message}")
+        for btn in page.action_buttons:
+            btn.setVisible(False)
+        self.logger.error(f"检查DLC文件时出错: {message}")
+    
+    @startup_phase("MainWindow.create_thumbnail_cache")
+    def create_thumbnail_cache(self):
+        """创建DLC缩略图缓存"""
         # 确定图片路径
         if getattr(sys, 'frozen', False):
             base_path = Path(sys.executable).parent
         else:
             base_path = Path(__file__).parent.parent
         
-        image_path = base_path / "resources" / "dlc_images" / f"{dlc_id}.jpg"
+        # 打包时生成的图集：所有DLC图片只需打开一个文件，不解码JPEG
+        atlas = ThumbnailAtlas.open(base_path / "resources" / ATLAS_FILE_NAME, THUMBNAIL_SIZE)
+        return ThumbnailCache(base_path / "resources" / "dlc_images", atlas=atlas)
+    
+    def start_dlc_move(self, dlc_files, target_location, success_key, empty_key):
+        """
+        在后台通过带意图日志的移动引擎批量移动DLC文件，完成后原地更新DLC索引并提示结果
+        
+        Args:
+            dlc_files: 要移动的DLC文件名列表
+            target_location: INSTALLED（安装）或 PARKED（卸载）
+            success_key: 移动成功时的提示文本键
+            empty_key: 没有文件被移动时的提示文本键
+        """
+        if self.move_worker is not None:
+            QMessageBox.information(self, tr('common.info'), tr('progress.busy'))
+            return
         
-        # 加载本地图片
-        if image_path.exists():
-            try:
-                pixmap = QPixmap(str(image_path))
-                if not pixmap.isNull():
-                    # 缓存到内存
-                    self.image_cache[cache_key] = pixmap
-                    
-                    # 使用IgnoreAspectRatio强制缩放到固定尺寸240x120，确保所有图片大小一致
-                    scaled_pixmap = pixmap.scaled(240, 120, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    item.setIcon(QIcon(scaled_pixmap))
-                    
-                    self.logger.info(f"加载DLC图片成功: {dlc_info.get('name', '')} ({dlc_id})")
-                else:
-                    self.logger.warning(f"图片文件无效: {image_path}")
-            except Exception as e:
-                self.logger.error(f"加载图片时出错: {e}")
+        source_location = PARKED if target_location == INSTALLED else INSTALLED
+        src_dir = self.dlc_repository.directory(source_location)
+        dst_dir = self.dlc_repository.directory(target_location)
+        
+        moves = [(dlc_file, os.path.join(src_dir, dlc_file), os.path.join(dst_dir, dlc_file))
+                 for dlc_file in dlc_files]
+        worker = DlcMoveWorker(self.dlc_repository.temp_dir, moves)
+        worker.signals.progress.connect(self.on_dlc_move_progress)
+        worker.signals.finished.connect(
+            lambda result: self.on_dlc_move_finished(target_location, success_key, empty_key, result))
+        worker.signals.failed.connect(self.on_dlc_move_failed)
+        self.move_worker = worker
+        
+        self.begin_dlc_move(tr('progress.preparing').format(len(moves)))
+        self.logger.info(f"开始后台移动 {len(moves)} 个DLC文件到 {dst_dir}")
+        self.start_worker(self.move_pool, worker)
+    
+    def begin_dlc_move(self, status):
+        """显示进度面板并禁用操作按钮"""
+        # 进度来自工作线程信号，不需要在回调中处理事件
+        self.move_progress_callback = create_progress_callback(
+            self.move_progress_bar, self.move_status_label, process_events=False)
+        self.move_progress_bar.setValue(0)
+        self.move_status_label.clear()
+        self.status_updated.emit(status)
+        # 恢复中断的移动时不能取消
+        self.move_cancel_btn.setEnabled(not self.move_worker.recover_mode)
+        self.move_progress_panel.setVisible(True)
+        self.set_dlc_actions_enabled(False)
+    
+    def cancel_dlc_move(self):
+        """取消正在进行的批量移动（当前文件完成后停止）"""
+        if self.move_worker is None:
+            return
+        self.move_worker.cancel()
+        self.move_cancel_btn.setEnabled(False)
+        self.status_updated.emit(tr('progress.cancelling'))
+        self.logger.info("用户取消了批量移动")
+    
+    def on_dlc_move_progress(self, name, files_done, files_total, bytes_done, bytes_total):
+        """更新批量移动进度"""
+        if self.move_worker is None:
+            return
+        if not self.move_worker.is_cancelled():
+            self.status_updated.emit(tr('progress.moving').format(name, files_done, files_total))
+        self.move_progress_callback(bytes_done, bytes_total)
+    
+    def on_dlc_move_finished(self, target_location, success_key, empty_key, result):
+        """批量移动完成，更新索引和列表并提示结果"""
+        self.end_dlc_move()
+        
+        # 只把移动过的文件从一个页面转移到另一个页面，不重新扫描或重建列表
+        changed_pages = set()
+        for dlc_file in result.moved:
+            self.sync_dlc_item(dlc_file, changed_pages,
+                               lambda: self.dlc_repository.record_move(dlc_file, target_location))
+        
+        # 移动失败、取消或源文件已不存在时，按磁盘实际状态更新索引
+        others = [dlc_file for dlc_file, _ in result.skipped + result.failed] + result.cancelled
+        for dlc_file in others:
+            self.sync_dlc_item(dlc_file, changed_pages)
+        
+        self.update_dlc_page_states(changed_pages)
+        
+        if result.cancelled:
+            QMessageBox.information(self, tr('common.info'), tr('progress.cancelled').format(len(result.moved)))
+        elif result.moved:
+            QMessageBox.information(self, tr('common.success'), tr(success_key).format(len(result.moved)))
         else:
-            self.logger.warning(f"图片文件不存在: {image_path}")
+            QMessageBox.warning(self, tr('common.warning'), tr(empty_key))
+    
+    def on_dlc_move_failed(self, message):
+        """批量移动出错（意图日志保留，下次启动时恢复）"""
+        self.end_dlc_move()
+        self.sync_game_path()
+        self.dlc_repository.invalidate()
+        self.refresh_dlc_pages()
+        QMessageBox.critical(self, tr('common.error'), tr('progress.failed').format(message))
+    
+    def wait_for_dlc_move(self):
+        """
+        关闭窗口时取消批量移动，并在进度面板显示提示直到当前文件完成
+        （意图日志保证在文件之间停止是安全的，恢复任务会完整结束）
+        """
+        worker = self.move_worker
+        worker.cancel()
+        # 关闭过程中不再更新索引或弹出结果提示
+        worker.signals.finished.disconnect()
+        worker.signals.failed.disconnect()
+        self.move_cancel_btn.setEnabled(False)
+        self.status_updated.emit(tr('progress.closing'))
+        self.centralWidget().setEnabled(False)
+        self.logger.info("等待正在移动的DLC文件完成后关闭")
+        
+        # 等待期间继续处理事件，进度面板仍会更新
+        while not self.move_pool.waitForDone(100):
+            QApplication.processEvents()
+    
+    def end_dlc_move(self):
+        """隐藏进度面板并恢复操作按钮"""
+        self.move_worker = None
+        self.move_progress_panel.setVisible(False)
+        self.set_dlc_actions_enabled(True)
+    
+    def set_dlc_actions_enabled(self, enabled):
+        """批量移动期间禁用安装/卸载按钮"""
+        for page in self.dlc_pages():
+            for btn in page.action_buttons:
+                btn.setEnabled(enabled)
+    
+    def create_recovery_worker(self, game_path):
+        """
+        游戏目录中有上次批量移动中途中断留下的意图日志时，创建恢复任务
+        
+        Returns:
+            DlcMoveWorker或None: 没有未完成的移动时返回None
+        """
+        if not game_path:
+            return None
+        journal_dir = os.path.join(game_path, TEMP_DIR_NAME)
+        try:
+            if not DlcMoveEngine(journal_dir).has_journal():
+                return None
+        except Exception as e:
+            self.logger.error(f"检查未完成的DLC移动失败: {e}")
+            return None
+        return DlcMoveWorker(journal_dir, [], recover_mode=RECOVER_REPLAY)
+    
+    def start_move_recovery(self, worker):
+        """
+        在move_pool中完成上次中断的批量移动（跨设备时需要复制整个文件），
+        使用与批量移动相同的进度面板，完成后重新扫描两个位置
+        
+        Args:
+            worker: create_recovery_worker创建的恢复任务
+        """
+        worker.signals.progress.connect(self.on_dlc_move_progress)
+        worker.signals.finished.connect(self.on_move_recovery_finished)
+        worker.signals.failed.connect(self.on_dlc_move_failed)
+        self.move_worker = worker
+        
+        # 恢复前已开始的扫描结果不再可靠
+        for page in self.dlc_pages():
+            self.cancel_dlc_scan(page)
+        self.begin_dlc_move(tr('progress.recovering'))
+        self.logger.warning(f"开始恢复上次未完成的DLC移动: {worker.journal_dir}")
+        self.start_worker(self.move_pool, worker)
+    
+    def on_move_recovery_finished(self, result):
+        """上次中断的批量移动恢复完成，重新扫描两个位置"""
+        self.end_dlc_move()
+        self.logger.warning(f"已恢复上次未完成的DLC移动: {result}")
+        self.sync_game_path()
+        self.dlc_repository.invalidate()
+        self.refresh_dlc_pages()
     
     def uninstall_all_dlcs(self):
         """卸载所有DLC"""
         try:
-            # 优先从设置界面的输入框获取路径，若为空则尝试从config读取
-            game_path = self.game_path_input.text().strip() if hasattr(self, 'game_path_input') and self.game_path_input.text().strip() else (
-                self.config.get('dlc', {}).get('game_path', '') if hasattr(self.config, 'get') else self.config.get("game_path", "")
-            )
+            game_path = self.sync_game_path()
             if not game_path or not os.path.exists(game_path):
                 QMessageBox.warning(self, tr('common.warning'), tr('settings.game_path_not_found'))
                 return
             
             # 创建temp_dlcs文件夹
-            temp_dir = os.path.join(game_path, "temp_dlcs")
+            temp_dir = self.dlc_repository.temp_dir
             if not os.path.exists(temp_dir):
                 os.makedirs(temp_dir)
+                self.dlc_watcher.refresh()
                 self.logger.info(f"创建临时DLC文件夹: {temp_dir}")
             
-            # 查找所有DLC文件
-            dlc_files = []
-            for file in os.listdir(game_path):
-                if file.lower().startswith("dlc") and file.lower().endswith(".scs"):
-                    dlc_files.append(file)
+            # 游戏目录尚未扫描时在后台扫描，完成后再确认
+            self.after_dlc_scan(self.installed_page, self.confirm_uninstall_all_dlcs)
+                    
+        except Exception as e:
+            QMessageBox.critical(self, tr('common.error'), f"{tr('installed.uninstall_error')}: {str(e)}")
+            self.logger.error(f"卸载DLC时出错: {e}")
+    
+    def confirm_uninstall_all_dlcs(self):
+        """确认后把DLC索引中所有已安装的DLC文件移动到temp_dlcs文件夹"""
+        try:
+            temp_dir = self.dlc_repository.temp_dir
+            dlc_files = self.dlc_repository.names(INSTALLED)
             
             if not dlc_files:
                 QMessageBox.information(self, tr('common.info'), tr('uninstalled.no_files'))
@@ -1879,27 +2172,7 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                moved_files = []
-                for dlc_file in dlc_files:
-                    src_path = os.path.join(game_path, dlc_file)
-                    dst_path = os.path.join(temp_dir, dlc_file)
-                    
-                    try:
-                        shutil.move(src_path, dst_path)
-                        moved_files.append(dlc_file)
-                        self.logger.info(f"移动DLC文件: {dlc_file} -> {temp_dir}")
-                    except Exception as e:
-                        self.logger.error(f"移动文件 {dlc_file} 失败: {e}")
-                
-                if moved_files:
-                    QMessageBox.information(
-                        self, tr('common.success'), 
-                        tr('installed.uninstall_success').format(len(moved_files))
-                    )
-                    # 重新检查并更新显示
-                    self.check_and_display_dlcs()
-                else:
-                    QMessageBox.warning(self, tr('common.warning'), tr('installed.no_files_moved'))
+                self.start_dlc_move(dlc_files, PARKED, 'installed.uninstall_success', 'installed.no_files_moved')
                     
         except Exception as e:
             QMessageBox.critical(self, tr('common.error'), f"{tr('installed.uninstall_error')}: {str(e)}")
@@ -1910,34 +2183,28 @@ class MainWindow(QMainWindow):
         self.logger.info("卸载选中的DLC")
         try:
             # 获取游戏路径
-            game_path = self.game_path_input.text().strip() if hasattr(self, 'game_path_input') and self.game_path_input.text().strip() else (
-                self.config.get('dlc', {}).get('game_path', '') if hasattr(self.config, 'get') else self.config.get("game_path", "")
-            )
+            game_path = self.sync_game_path()
             if not game_path or not os.path.exists(game_path):
                 QMessageBox.warning(self, tr('common.warning'), tr('settings.game_path_not_found'))
                 return
             
             # 获取选中的DLC文件
-            selected_items = self.installed_page.dlc_list.selectedItems()
-            if not selected_items:
+            if not self.installed_page.dlc_list.selectionModel().hasSelection():
                 QMessageBox.information(self, tr('common.info'), tr('installed.select_dlc_first'))
                 return
             
             # 提取选中的文件名
-            selected_files = []
-            for item in selected_items:
-                file_name = item.data(Qt.ItemDataRole.UserRole)
-                if file_name:
-                    selected_files.append(file_name)
+            selected_files = self.installed_page.dlc_list.selected_file_names()
             
             if not selected_files:
                 QMessageBox.information(self, tr('common.info'), tr('installed.no_valid_dlc'))
                 return
             
             # 创建temp_dlcs文件夹
-            temp_dir = os.path.join(game_path, "temp_dlcs")
+            temp_dir = self.dlc_repository.temp_dir
             if not os.path.exists(temp_dir):
                 os.makedirs(temp_dir)
+                self.dlc_watcher.refresh()
                 self.logger.info(f"创建temp_dlcs文件夹: {temp_dir}")
             
             # 确认对话框
@@ -1949,40 +2216,8 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                moved_files = []
-                for dlc_file in selected_files:
-                    src_path = os.path.join(game_path, dlc_file)
-                    dst_path = os.path.join(temp_dir, dlc_file)
-                    
-                    try:
-                        # 检查源文件是否存在
-                        if not os.path.exists(src_path):
-                            self.logger.warning(f"源文件不存在，跳过: {dlc_file}")
-                            continue
-                        
-                        # 检查目标文件是否已存在
-                        if os.path.exists(dst_path):
-                            self.logger.warning(f"目标文件已存在，跳过: {dlc_file}")
-                            continue
-                        
-                        # 移动文件（剪切操作）
-                        shutil.move(src_path, dst_path)
-                        moved_files.append(dlc_file)
-                        self.logger.info(f"移动DLC文件: {dlc_file} -> {temp_dir}")
-                    except Exception as e:
-                        self.logger.error(f"移动文件 {dlc_file} 失败: {e}")
-                
-                if moved_files:
-                    QMessageBox.information(
-                        self, tr('common.success'), 
-                        tr('installed.uninstall_success').format(len(moved_files))
-                    )
-                    # 重新检查并更新显示
-                    self.check_and_display_dlcs()
-                    # 同时刷新未安装DLC列表
-                    self.refresh_uninstalled_dlc()
-                else:
-                    QMessageBox.warning(self, tr('common.warning'), tr('installed.no_files_moved_detail'))
+                self.start_dlc_move(selected_files, PARKED,
+                                    'installed.uninstall_success', 'installed.no_files_moved_detail')
                     
         except Exception as e:
             QMessageBox.critical(self, tr('common.error'), f"{tr('installed.uninstall_error')}: {str(e)}")
@@ -1993,111 +2228,40 @@ class MainWindow(QMainWindow):
         self.logger.info("禁用选中的DLC")
         # 这里添加实际的禁用逻辑
     
+    def show_uninstalled_dlc_list(self):
+        """显示未安装DLC列表（索引已加载时不重新扫描）"""
+        self.display_dlc_page(self.uninstalled_page)
+    
     def refresh_uninstalled_dlc(self):
-        """刷新未安装DLC列表 - 支持网格视图和图片显示"""
+        """刷新未安装DLC列表 - 重新扫描temp_dlcs文件夹"""
         self.logger.info("刷新未安装DLC列表")
-        try:
-            # 获取游戏路径
-            game_path = self.game_path_input.text().strip() if hasattr(self, 'game_path_input') and self.game_path_input.text().strip() else (
-                self.config.get('dlc', {}).get('game_path', '') if hasattr(self.config, 'get') else self.config.get("game_path", "")
-            )
-            if not game_path or not os.path.exists(game_path):
-                self.uninstalled_page.dlc_list.clear()
-                self.install_selected_btn.setVisible(False)
-                self.install_all_btn.setVisible(False)
-                return
-            
-            # 检查temp_dlcs文件夹
-            temp_dir = os.path.join(game_path, "temp_dlcs")
-            if not os.path.exists(temp_dir):
-                self.uninstalled_page.dlc_list.clear()
-                self.install_selected_btn.setVisible(False)
-                self.install_all_btn.setVisible(False)
-                return
-            
-            # 查找temp_dlcs文件夹中的DLC文件
-            dlc_files = []
-            for file in os.listdir(temp_dir):
-                if file.lower().startswith("dlc") and file.lower().endswith(".scs"):
-                    dlc_files.append(file)
-            
-            # 清空列表并重新填充
-            self.uninstalled_page.dlc_list.clear()
-            
-            if dlc_files:
-                # 按名称排序并添加到列表
-                for file in sorted(dlc_files):
-                    # 查找对应的DLC信息
-                    dlc_info = self.find_dlc_info_by_file(file)
-                    
-                    if dlc_info:
-                        # 如果找到DLC信息，只显示DLC名称
-                        display_text = dlc_info.get('name', file)
-                        item = QListWidgetItem(display_text)
-                        item.setData(Qt.ItemDataRole.UserRole, file)  # 保存文件名
-                        item.setToolTip(f"{dlc_info.get('name', file)}\n文件: {file}")  # 悬停提示显示完整信息
-                        
-                        # 从本地加载图标
-                        self.load_image_for_item(item, dlc_info)
-                    else:
-                        # 如果没有找到DLC信息，只显示文件名
-                        item = QListWidgetItem(file)
-                        item.setData(Qt.ItemDataRole.UserRole, file)
-                        item.setToolTip(file)
-                    
-                    self.uninstalled_page.dlc_list.addItem(item)
-                
-                self.install_selected_btn.setVisible(True)
-                self.install_all_btn.setVisible(True)
-                self.logger.info(f"在 {temp_dir} 中找到 {len(dlc_files)} 个已卸载的DLC文件")
-            else:
-                # 未找到DLC文件
-                item = QListWidgetItem(tr('uninstalled.no_files'))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-                self.uninstalled_page.dlc_list.addItem(item)
-                self.install_selected_btn.setVisible(False)
-                self.install_all_btn.setVisible(False)
-                self.logger.info(f"在 {temp_dir} 中未找到DLC文件")
-                
-        except Exception as e:
-            self.uninstalled_page.dlc_list.clear()
-            error_item = QListWidgetItem(f"检查已卸载DLC文件时出错: {str(e)}")
-            error_item.setFlags(error_item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-            self.uninstalled_page.dlc_list.addItem(error_item)
-            self.install_selected_btn.setVisible(False)
-            self.install_all_btn.setVisible(False)
-            self.logger.error(f"检查已卸载DLC文件时出错: {e}")
+        self.sync_game_path()
+        self.dlc_repository.invalidate(PARKED)
+        self.display_dlc_page(self.uninstalled_page)
     
     def install_selected_dlc(self):
         """安装选中的DLC - 将temp_dlcs文件夹中选中的DLC文件移回游戏安装路径"""
         self.logger.info("安装选中的DLC")
         try:
             # 获取游戏路径
-            game_path = self.game_path_input.text().strip() if hasattr(self, 'game_path_input') and self.game_path_input.text().strip() else (
-                self.config.get('dlc', {}).get('game_path', '') if hasattr(self.config, 'get') else self.config.get("game_path", "")
-            )
+            game_path = self.sync_game_path()
             if not game_path or not os.path.exists(game_path):
                 QMessageBox.warning(self, tr('common.warning'), tr('uninstalled.game_path_not_found'))
                 return
             
             # 检查temp_dlcs文件夹
-            temp_dir = os.path.join(game_path, "temp_dlcs")
+            temp_dir = self.dlc_repository.temp_dir
             if not os.path.exists(temp_dir):
                 QMessageBox.information(self, tr('common.info'), tr('uninstalled.temp_dlcs_not_found'))
                 return
             
             # 获取选中的DLC文件
-            selected_items = self.uninstalled_page.dlc_list.selectedItems()
-            if not selected_items:
+            if not self.uninstalled_page.dlc_list.selectionModel().hasSelection():
                 QMessageBox.information(self, tr('common.info'), tr('uninstalled.select_dlc_first'))
                 return
             
             # 提取选中的文件名
-            selected_files = []
-            for item in selected_items:
-                file_name = item.data(Qt.ItemDataRole.UserRole)
-                if file_name:
-                    selected_files.append(file_name)
+            selected_files = self.uninstalled_page.dlc_list.selected_file_names()
             
             if not selected_files:
                 QMessageBox.information(self, tr('common.info'), tr('uninstalled.no_valid_dlc'))
@@ -2112,40 +2276,8 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                moved_files = []
-                for dlc_file in selected_files:
-                    src_path = os.path.join(temp_dir, dlc_file)
-                    dst_path = os.path.join(game_path, dlc_file)
-                    
-                    try:
-                        # 检查源文件是否存在
-                        if not os.path.exists(src_path):
-                            self.logger.warning(f"源文件不存在，跳过: {dlc_file}")
-                            continue
-                        
-                        # 检查目标文件是否已存在
-                        if os.path.exists(dst_path):
-                            self.logger.warning(f"目标文件已存在，跳过: {dlc_file}")
-                            continue
-                        
-                        # 移动文件（剪切操作）
-                        shutil.move(src_path, dst_path)
-                        moved_files.append(dlc_file)
-                        self.logger.info(f"移动DLC文件: {dlc_file} -> {game_path}")
-                    except Exception as e:
-                        self.logger.error(f"移动文件 {dlc_file} 失败: {e}")
-                
-                if moved_files:
-                    QMessageBox.information(
-                        self, tr('common.success'), 
-                        tr('uninstalled.install_success').format(len(moved_files))
-                    )
-                    # 重新检查并更新显示
-                    self.refresh_uninstalled_dlc()
-                    # 同时刷新已安装DLC列表
-                    self.check_and_display_dlcs()
-                else:
-                    QMessageBox.warning(self, tr('common.warning'), tr('uninstalled.no_files_moved_detail'))
+                self.start_dlc_move(selected_files, INSTALLED,
+                                    'uninstalled.install_success', 'uninstalled.no_files_moved_detail')
                     
         except Exception as e:
             QMessageBox.critical(self, tr('common.error'), f"{tr('uninstalled.install_error')}: {str(e)}")
@@ -2156,24 +2288,29 @@ class MainWindow(QMainWindow):
         self.logger.info("安装所有DLC")
         try:
             # 获取游戏路径
-            game_path = self.game_path_input.text().strip() if hasattr(self, 'game_path_input') and self.game_path_input.text().strip() else (
-                self.config.get('dlc', {}).get('game_path', '') if hasattr(self.config, 'get') else self.config.get("game_path", "")
-            )
+            game_path = self.sync_game_path()
             if not game_path or not os.path.exists(game_path):
                 QMessageBox.warning(self, tr('common.warning'), tr('uninstalled.game_path_not_found'))
                 return
             
             # 检查temp_dlcs文件夹
-            temp_dir = os.path.join(game_path, "temp_dlcs")
+            temp_dir = self.dlc_repository.temp_dir
             if not os.path.exists(temp_dir):
                 QMessageBox.information(self, tr('common.info'), tr('uninstalled.temp_dlcs_not_found'))
                 return
             
-            # 查找temp_dlcs文件夹中的所有DLC文件
-            dlc_files = []
-            for file in os.listdir(temp_dir):
-                if file.lower().startswith("dlc") and file.lower().endswith(".scs"):
-                    dlc_files.append(file)
+            # temp_dlcs尚未扫描时在后台扫描，完成后再确认
+            self.after_dlc_scan(self.ensure_uninstalled_page(), self.confirm_install_all_dlcs)
+                    
+        except Exception as e:
+            QMessageBox.critical(self, tr('common.error'), tr('uninstalled.install_error').format(str(e)))
+            self.logger.error(f"安装DLC时出错: {e}")
+    
+    def confirm_install_all_dlcs(self):
+        """确认后把DLC索引中temp_dlcs文件夹的所有DLC文件移回游戏安装路径"""
+        try:
+            temp_dir = self.dlc_repository.temp_dir
+            dlc_files = self.dlc_repository.names(PARKED)
             
             if not dlc_files:
                 QMessageBox.information(self, tr('common.info'), tr('uninstalled.no_files'))
@@ -2188,40 +2325,8 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                moved_files = []
-                for dlc_file in dlc_files:
-                    src_path = os.path.join(temp_dir, dlc_file)
-                    dst_path = os.path.join(game_path, dlc_file)
-                    
-                    try:
-                        # 检查源文件是否存在
-                        if not os.path.exists(src_path):
-                            self.logger.warning(f"源文件不存在，跳过: {dlc_file}")
-                            continue
-                        
-                        # 检查目标文件是否已存在
-                        if os.path.exists(dst_path):
-                            self.logger.warning(f"目标文件已存在，跳过: {dlc_file}")
-                            continue
-                        
-                        # 移动文件（剪切操作）
-                        shutil.move(src_path, dst_path)
-                        moved_files.append(dlc_file)
-                        self.logger.info(f"移动DLC文件: {dlc_file} -> {game_path}")
-                    except Exception as e:
-                        self.logger.error(f"移动文件 {dlc_file} 失败: {e}")
-                
-                if moved_files:
-                    QMessageBox.information(
-                        self, tr('common.success'), 
-                        tr('uninstalled.install_success').format(len(moved_files))
-                    )
-                    # 重新检查并更新显示
-                    self.refresh_uninstalled_dlc()
-                    # 同时刷新已安装DLC列表
-                    self.check_and_display_dlcs()
-                else:
-                    QMessageBox.warning(self, tr('common.warning'), tr('uninstalled.no_files_moved_detail'))
+                self.start_dlc_move(dlc_files, INSTALLED,
+                                    'uninstalled.install_success', 'uninstalled.no_files_moved_detail')
                     
         except Exception as e:
             QMessageBox.critical(self, tr('common.error'), tr('uninstalled.install_error').format(str(e)))
@@ -2243,19 +2348,21 @@ class MainWindow(QMainWindow):
             QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
         )
         
-        # 如果用户选择了目录，更新输入框
+        # 如果用户选择了目录，更新输入框并保存
         if directory:
             self.game_path_input.setText(directory)
             self.logger.info(f"用户选择了游戏路径: {directory}")
+            self.save_settings()
     
     def save_settings(self):
         """保存设置"""
         self.logger.info("保存设置")
         # 获取设置值
-        game_path = self.game_path_input.text()
+        game_path = os.path.normpath(self.game_path_input.text().strip()) if self.game_path_input.text().strip() else ""
         
         self.logger.info(f"游戏路径: {game_path}")
-        # 这里添加实际的保存逻辑
+        if game_path and self.save_game_path(game_path):
+            self.game_path = game_path
     
     def filter_dlc_list(self, status_filter):
         """根据状态过滤DLC列表"""
@@ -2266,7 +2373,9 @@ class MainWindow(QMainWindow):
     def show_settings(self):
         """显示设置页面 - 动态切换内容"""
         self.update_nav_button_state(self.settings_btn)
-        self.show_page(self.settings_page)
+        self.show_page(self.ensure_settings_page())
+        self.cancel_dlc_scan(self.installed_page)
+        self.cancel_dlc_scan(self.uninstalled_page)
         self.logger.info("显示设置")
     
     def show_about(self):
@@ -2286,46 +2395,20 @@ class MainWindow(QMainWindow):
         self.logger.info(f"窗口大小: 1000x700(固定), 左侧菜单宽度: 160px(固定)")
     
     def filter_installed_dlc(self, search_text):
-        """根据搜索文本过滤DLC列表"""
-        try:
-            search_text = search_text.lower().strip()
-            
-            # 遍历所有项目
-            for i in range(self.installed_page.dlc_list.count()):
-                item = self.installed_page.dlc_list.item(i)
-                if item:
-                    # 获取DLC名称
-                    item_text = item.text().lower()
-                    
-                    # 判断是否匹配搜索文本
-                    if search_text == "" or search_text in item_text:
-                        item.setHidden(False)
-                    else:
-                        item.setHidden(True)
-            
-            self.logger.info(f"搜索DLC: {search_text}")
-            
-        except Exception as e:
-            self.logger.error(f"搜索DLC时出错: {e}")
+        """搜索文本变化 - 输入停止后再过滤DLC列表"""
+        self.installed_page.search_timer.start()
     
     def on_dlc_selection_changed(self):
         """DLC选择变化时更新信息提示栏"""
         try:
-            selected_items = self.installed_page.dlc_list.selectedItems()
+            # 获取选中的DLC名称（显示文本）
+            selected_names = self.installed_page.dlc_list.selected_display_names()
             
-            if not selected_items:
+            if not selected_names:
                 # 没有选择任何DLC，隐藏提示栏
                 self.selection_info.setVisible(False)
                 return
             
-            # 获取选中的DLC名称
-            selected_names = []
-            for item in selected_items:
-                # 优先使用显示文本（DLC名称），如果为空则使用文件名
-                display_text = item.text()
-                if display_text:
-                    selected_names.append(display_text)
-            
             # 构建提示信息
             count = len(selected_names)
             if count <= 3:
@@ -2349,21 +2432,14 @@ class MainWindow(QMainWindow):
     def on_uninstalled_dlc_selection_changed(self):
         """未安装DLC选择变化时更新信息提示栏"""
         try:
-            selected_items = self.uninstalled_page.dlc_list.selectedItems()
+            # 获取选中的DLC名称（显示文本）
+            selected_names = self.uninstalled_page.dlc_list.selected_display_names()
             
-            if not selected_items:
+            if not selected_names:
                 # 没有选择任何DLC，隐藏提示栏
                 self.uninstalled_selection_info.setVisible(False)
                 return
             
-            # 获取选中的DLC名称
-            selected_names = []
-            for item in selected_items:
-                # 优先使用显示文本（DLC名称），如果为空则使用文件名
-                display_text = item.text()
-                if display_text:
-                    selected_names.append(display_text)
-            
             # 构建提示信息
             count = len(selected_names)
             if count <= 3:
@@ -2385,29 +2461,51 @@ class MainWindow(QMainWindow):
             self.logger.error(f"更新未安装DLC选择信息时出错: {e}")
     
     def filter_uninstalled_dlc(self, search_text):
-        """根据搜索文本过滤未安装DLC列表"""
+        """搜索文本变化 - 输入停止后再过滤未安装DLC列表"""
+        self.uninstalled_page.search_timer.start()
+    
+    def create_search_timer(self, page):
+        """创建页面搜索框的防抖定时器"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.search_delay)
+        timer.timeout.connect(lambda: self.apply_dlc_filter(page))
+        return timer
+    
+    def apply_dlc_filter(self, page):
+        """按页面搜索框的文本过滤并排序列表（由代理模型完成，源模型不变）"""
         try:
-            search_text = search_text.lower().strip()
-            
-            # 遍历所有项目
-            for i in range(self.uninstalled_page.dlc_list.count()):
-                item = self.uninstalled_page.dlc_list.item(i)
-                if item:
-                    # 获取DLC名称
-                    item_text = item.text().lower()
-                    
-                    # 判断是否匹配搜索文本
-                    if search_text == "" or search_text in item_text:
-                        item.setHidden(False)
-                    else:
-                        item.setHidden(True)
-            
-            self.logger.info(f"搜索未安装DLC: {search_text}")
-            
+            search_text = page.search_input.text()
+            if not page.proxy.set_query(search_text):
+                return
+            self.logger.debug(f"搜索DLC ({page.location}): {search_text!r}, "
+                              f"匹配 {page.proxy.rowCount()}/{page.model.rowCount()} 个")
+            page.dlc_list.scrollToTop()
         except Exception as e:
-            self.logger.error(f"搜索未安装DLC时出错: {e}")
+            self.logger.error(f"搜索DLC时出错: {e}")
     
     def closeEvent(self, event):
         """关闭事件处理 - 简化版本"""
+        if self._closing:
+            # 正在等待批量移动结束时再次关闭窗口
+            event.ignore()
+            return
+        self._closing = True
         self.logger.info("应用程序正在关闭...")
+        # 停止目录监控，取消仍在进行的后台扫描
+        self.dlc_watcher.stop()
+        self.cancel_dlc_scan(self.installed_page)
+        self.cancel_dlc_scan(self.uninstalled_page)
+        self.scan_pool.waitForDone(1000)
+        self.thumbnail_loader.shutdown()
+        # 批量移动在当前文件完成后停止，等待意图日志收尾
+        if self.move_worker is not None:
+            self.wait_for_dlc_move()
+        # 输出绘制统计报告
+        for page in self.dlc_pages():
+            if page.dlc_list.paint_profiler is not None:
+                page.dlc_list.paint_profiler.log_report()
+        # 停止接收配置变化，写入尚未保存的配置修改
+        self._unsubscribe_config()
+        self.config.flush()
         event.accept()
\ No newline at end of file
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+DLC缩略图图集 - ThumbnailAtlas
+由build_thumbnail_atlas.py生成的单个文件，包含所有DLC头图按图标尺寸解码后的像素，
+运行时内存映射该文件，直接用映射的内存构造QImage（不复制、不解码JPEG）
+
+文件结构:
+    文件头 ATLAS_HEADER
+    索引   count个ATLAS_ENTRY（DLC ID, 像素数据偏移, 源图片大小和修改时间），按DLC ID排序
+    像素   每个图块bytes_per_line * height字节，按ATLAS_ALIGN对齐
+"""
+
+import os
+import mmap
+import struct
+import logging
+
+from PyQt6 import sip
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QImage
+
+
+# 图集文件头: 标识, 版本, 宽, 高, 每行字节数, 像素格式, 图块数量
+ATLAS_MAGIC = b"DLCA"
+ATLAS_VERSION = 2
+ATLAS_HEADER = struct.Struct("<4sHHHIII")
+# 索引项: DLC ID, 像素数据在文件中的偏移, 源图片大小, 源图片修改时间（纳秒）
+ATLAS_ENTRY = struct.Struct("<Iqqq")
+# 图块起始位置对齐字节数
+ATLAS_ALIGN = 64
+
+# 默认图集文件名（位于resources目录）
+ATLAS_FILE_NAME = "dlc_images.atlas"
+
+
+def _align(offset):
+    return (offset + ATLAS_ALIGN - 1) // ATLAS_ALIGN * ATLAS_ALIGN
+
+
+def write_atlas(path, tiles):
+    """
+    写入图集文件（先写临时文件再替换）
+
+    Args:
+        path: 图集文件路径
+        tiles: {DLC ID: (QImage, 源图片的os.stat结果)}，所有图片的尺寸和像素格式必须相同
+
+    Returns:
+        int: 写入的图块数量
+
+    Raises:
+        ValueError: 图片尺寸或格式不一致
+        OSError: 写入失败
+    """
+    items = sorted(tiles.items())
+    if not items:
+        raise ValueError("没有可写入的图片")
+
+    first = items[0][1][0]
+    width, height = first.width(), first.height()
+    bytes_per_line, image_format = first.bytesPerLine(), first.format()
+    for dlc_id, (image, _) in items:
+        if (image.width(), image.height(), image.bytesPerLine(), image.format()) != \
+                (width, height, bytes_per_line, image_format):
+            raise ValueError(f"图片尺寸或格式不一致: {dlc_id}")
+
+    tile_size = bytes_per_line * height
+    data_start = _align(ATLAS_HEADER.size + ATLAS_ENTRY.size * len(items))
+    stride = _align(tile_size)
+
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(ATLAS_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, width, height,
+                                      bytes_per_line, image_format.value, len(items)))
+            for i, (dlc_id, (_, stat)) in enumerate(items):
+                f.write(ATLAS_ENTRY.pack(dlc_id, data_start + i * stride, stat.st_size, stat.st_mtime_ns))
+            for i, (_, (image, _)) in enumerate(items):
+                f.seek(data_start + i * stride)
+                f.write(image.constBits().asstring(tile_size))
+            f.truncate(data_start + (len(items) - 1) * stride + tile_size)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return len(items)
+
+
+class ThumbnailAtlas:
+    """内存映射的缩略图图集（只读，可以在工作线程中读取）"""
+
+    def __init__(self, path):
+        """
+        打开并映射图集文件
+
+        Args:
+            path: 图集文件路径
+
+        Raises:
+            OSError: 文件不存在或无法映射
+            ValueError: 文件格式错误
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._parse()
+        except Exception:
+            self._map.close()
+            raise
+
+    @classmethod
+    def open(cls, path, size=None):
+        """
+        打开图集，文件不存在、格式错误或图块尺寸不符时返回None
+
+        Args:
+            path: 图集文件路径
+            size: 期望的图块尺寸（QSize），为None时不检查
+        """
+        logger = logging.getLogger(__name__)
+        if not os.path.exists(path):
+            logger.debug(f"缩略图图集不存在: {path}")
+            return None
+        try:
+            atlas = cls(path)
+        except Exception as e:
+            logger.warning(f"打开缩略图图集失败 {path}: {e}")
+            return None
+        if size is not None and atlas.size != size:
+            logger.warning(f"缩略图图集尺寸不符 {path}: {atlas.size.width()}x{atlas.size.height()}")
+            atlas.close()
+            return None
+        logger.info(f"已加载缩略图图集: {len(atlas)} 个图块")
+        return atlas
+
+    def _parse(self):
+        """读取文件头和索引"""
+        if len(self._map) < ATLAS_HEADER.size:
+            raise ValueError("文件过小")
+        (magic, version, width, height, bytes_per_line, image_format,
+         count) = ATLAS_HEADER.unpack_from(self._map, 0)
+        if magic != ATLAS_MAGIC or version != ATLAS_VERSION:
+            raise ValueError("不是有效的缩略图图集")
+
+        self.size = QSize(width, height)
+        self.bytes_per_line = bytes_per_line
+        self.image_format = QImage.Format(image_format)
+        self.tile_size = bytes_per_line * height
+
+        # DLC ID -> (像素数据偏移, 源图片大小, 源图片修改时间)
+        self._entries = {}
+        for i in range(count):
+            dlc_id, offset, src_size, src_mtime_ns = ATLAS_ENTRY.unpack_from(
+                self._map, ATLAS_HEADER.size + i * ATLAS_ENTRY.size)
+            if offset < 0 or offset + self.tile_size > len(self._map):
+                raise ValueError(f"图块超出文件范围: {dlc_id}")
+            self._entries[dlc_id] = (offset, src_size, src_mtime_ns)
+
+        self._base = int(sip.voidptr(self._map))
+
+    def image(self, dlc_id, stat=None):
+        """
+        获取图块（直接引用映射的内存，图集关闭后不能再使用）
+
+        Args:
+            stat: 源图片当前的os.stat结果，与生成图集时的大小或修改时间不同时不使用图块
+
+        Returns:
+            QImage或None: 图集中没有该DLC或源图片已变化时返回None
+        """
+        entry = self._entries.get(dlc_id)
+        if entry is None:
+            return None
+        offset, src_size, src_mtime_ns = entry
+        if stat is not None and (stat.st_size, stat.st_mtime_ns) != (src_size, src_mtime_ns):
+            return None
+        return QImage(sip.voidptr(self._base + offset, self.tile_size, False),
+                      self.size.width(), self.size.height(), self.bytes_per_line, self.image_format)
+
+    def close(self):
+        """解除内存映射"""
+        self._entries = {}
+        self._map.close()
+
+    def __contains__(self, dlc_id):
+        return dlc_id in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+DLC缩略图缓存 - ThumbnailCache
+把DLC头图按最终图标尺寸缓存在内存（QIcon）和磁盘（未压缩像素）中，
+重复刷新和重启时不再解码JPEG，也不再做平滑缩放
+"""
+
+import os
+import struct
+import logging
+from pathlib import Path
+
+from PyQt6.QtCore import Qt, QSize, QStandardPaths
+from PyQt6.QtGui import QIcon, QImage, QImageReader, QPixmap
+
+
+# 磁盘缓存文件头: 标识, 版本, 宽, 高, 每行字节数, 像素格式, 源文件大小, 源文件修改时间(ns)
+THUMB_MAGIC = b"DLCT"
+THUMB_VERSION = 1
+THUMB_HEADER = struct.Struct("<4sHHHIIqq")
+THUMB_SUFFIX = ".thumb"
+
+# 列表图标尺寸
+THUMBNAIL_SIZE = QSize(240, 120)
+
+
+def decode_image(source, size):
+    """
+    解码图片并缩放为指定尺寸的RGB32图片（不保持宽高比，只使用QImage，可以在工作线程中调用）
+
+    Args:
+        source: 图片路径
+        size: 目标尺寸（QSize）
+
+    Returns:
+        (QImage或None, 错误信息)
+    """
+    # 解码时直接缩放，JPEG可以在解码阶段按比例缩小
+    reader = QImageReader(str(source))
+    reader.setScaledSize(size)
+    image = reader.read()
+    if image.isNull():
+        return None, reader.errorString()
+
+    if image.size() != size:
+        image = image.scaled(size, Qt.AspectRatioMode.IgnoreAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    return image.convertToFormat(QImage.Format.Format_RGB32), ""
+
+
+def default_cache_dir():
+    """默认的磁盘缓存目录（用户缓存目录，安装目录不可写时也能使用）"""
+    location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    if not location:
+        location = os.path.join(os.path.expanduser("~"), ".ets2_dlc_tools")
+    return Path(location) / "thumbnails"
+
+
+class ThumbnailCache:
+    """按DLC ID缓存缩放后的缩略图，磁盘缓存以源图片的大小和修改时间校验"""
+
+    def __init__(self, image_dir, cache_dir=None, size=THUMBNAIL_SIZE, atlas=None):
+        """
+        初始化缩略图缓存
+
+        Args:
+            image_dir: DLC头图所在目录（resources/dlc_images）
+            cache_dir: 磁盘缓存目录，默认为用户缓存目录
+            size: 缩略图尺寸
+            atlas: 随程序发布的ThumbnailAtlas，图集中的DLC不再读取JPEG
+        """
+        self.logger = logging.getLogger(__name__)
+        self.image_dir = Path(image_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.size = size
+        self.atlas = atlas
+
+        # DLC ID -> QIcon（没有图片的DLC缓存为None，避免重复检查）
+        self._icons = {}
+
+    def source_path(self, dlc_id):
+        """DLC头图路径"""
+        return self.image_dir / f"{dlc_id}.jpg"
+
+    def cache_path(self, dlc_id):
+        """磁盘缓存文件路径"""
+        return self.cache_dir / f"{dlc_id}{THUMB_SUFFIX}"
+
+    def cached_icon(self, dlc_id):
+        """
+        只查内存缓存
+
+        Returns:
+            (是否命中, QIcon或None)
+        """
+        if dlc_id in self._icons:
+            return True, self._icons[dlc_id]
+        return False, None
+
+    def icon(self, dlc_id):
+        """
+        获取DLC图标（必须在界面线程调用）
+
+        Returns:
+            QIcon或None: 图片不存在或无效时返回None
+        """
+        hit, icon = self.cached_icon(dlc_id)
+        if hit:
+            return icon
+        return self.store(dlc_id, self.load_image(dlc_id))
+
+    def store(self, dlc_id, image):
+        """
+        把缩略图转换为QIcon并放入内存缓存（必须在界面线程调用）
+
+        Args:
+            dlc_id: DLC ID
+            image: load_image返回的QImage或None
+
+        Returns:
+            QIcon或None
+        """
+        icon = QIcon(QPixmap.fromImage(image)) if image is not None else None
+        self._icons[dlc_id] = icon
+        return icon
+
+    def load_image(self, dlc_id):
+        """
+        读取缩略图：优先使用图集（源图片的大小和修改时间与生成图集时一致），其次读取磁盘缓存，
+        缓存不存在或已过期时解码源图片并写入缓存（只使用QImage，可以在工作线程中调用）
+
+        Returns:
+            QImage或None
+        """
+        source = self.source_path(dlc_id)
+        try:
+            stat = source.stat()
+        except OSError:
+            # 只有图集（没有源图片）时仍使用图集中的图块
+            image = self.atlas.image(dlc_id) if self.atlas is not None else None
+            if image is None:
+                self.logger.warning(f"图片文件不存在: {source}")
+            return image
+
+        if self.atlas is not None:
+            image = self.atlas.image(dlc_id, stat)
+            if image is not None:
+                return image
+
+        image = self._read_cache(dlc_id, stat)
+        if image is not None:
+            return image
+
+        image, error = decode_image(source, self.size)
+        if image is None:
+            self.logger.warning(f"图片文件无效: {source}: {error}")
+            return None
+
+        self._write_cache(dlc_id, stat, image)
+        self.logger.debug(f"生成DLC缩略图: {dlc_id}")
+        return image
+
+    def clear_memory(self):
+        """清空内存缓存（磁盘缓存保留）"""
+        self._icons.clear()
+
+    def _read_cache(self, dlc_id, stat):
+        """读取磁盘缓存，源图片已变化或缓存损坏时返回None"""
+        path = self.cache_path(dlc_id)
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(THUMB_HEADER.size)
+                if len(header) != THUMB_HEADER.size:
+                    return None
+                (magic, version, width, height, bytes_per_line, image_format,
+                 src_size, src_mtime_ns) = THUMB_HEADER.unpack(header)
+                if (magic != THUMB_MAGIC or version != THUMB_VERSION
+                        or src_size != stat.st_size or src_mtime_ns != stat.st_mtime_ns
+                        or width != self.size.width() or height != self.size.height()):
+                    return None
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning(f"读取缩略图缓存失败 {path}: {e}")
+            return None
+
+        if len(data) != bytes_per_line * height:
+            return None
+        # QImage不持有外部缓冲区，copy()只做一次内存复制，不涉及解码
+        return QImage(data, width, height, bytes_per_line, QImage.Format(image_format)).copy()
+
+    def _write_cache(self, dlc_id, stat, image):
+        """写入磁盘缓存（先写临时文件再替换），失败时只记录日志"""
+        path = self.cache_path(dlc_id)
+        temp_path = path.with_name(path.name + ".tmp")
+        header = THUMB_HEADER.pack(THUMB_MAGIC, THUMB_VERSION, image.width(), image.height(),
+                                   image.bytesPerLine(), image.format().value,
+                                   stat.st_size, stat.st_mtime_ns)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(header)
+                f.write(image.constBits().asstring(image.sizeInBytes()))
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.warning(f"写入缩略图缓存失败 {path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
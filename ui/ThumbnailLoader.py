@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+DLC缩略图加载器 - ThumbnailLoader
+在线程池中读取或解码缩略图，回到界面线程后转换为QPixmap/QIcon
+"""
+
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QPainter, QPixmap
+
+
+# 线程池优先级：可见项目始终排在预取项目之前，同一档内后请求的先执行
+VISIBLE_PRIORITY = 1 << 30
+PREFETCH_PRIORITY = 0
+
+
+def create_placeholder_icon(size):
+    """创建图片加载完成前显示的占位图标（所有列表项共用一个实例）"""
+    pixmap = QPixmap(size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor("#e9ecef"))
+    painter.drawRoundedRect(pixmap.rect(), 6, 6)
+    painter.end()
+    return QIcon(pixmap)
+
+
+class ThumbnailSignals(QObject):
+    """缩略图任务信号（QRunnable本身不能发射信号）"""
+
+    # DLC ID, QImage或None
+    loaded = pyqtSignal(int, object)
+
+
+class ThumbnailTask(QRunnable):
+    """读取单个缩略图的后台任务"""
+
+    def __init__(self, cache, dlc_id):
+        super().__init__()
+        # 由加载器持有引用，避免线程池删除后信号对象失效
+        self.setAutoDelete(False)
+        self.cache = cache
+        self.dlc_id = dlc_id
+        # 是否为可见项目请求的（否则为预取）
+        self.visible = False
+        self.signals = ThumbnailSignals()
+
+    def run(self):
+        """读取磁盘缓存或解码源图片（只使用QImage）"""
+        try:
+            image = self.cache.load_image(self.dlc_id)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"加载DLC缩略图失败 {self.dlc_id}: {e}")
+            image = None
+        self.signals.loaded.emit(self.dlc_id, image)
+
+
+class ThumbnailLoader(QObject):
+    """缩略图加载器 - 同一DLC同时只排队一次，可见项目先于预取项目，同一档内后请求的优先"""
+
+    # DLC ID（图标已放入ThumbnailCache的内存缓存）
+    thumbnail_ready = pyqtSignal(int)
+
+    def __init__(self, cache, max_threads=2, parent=None):
+        """
+        初始化加载器
+
+        Args:
+            cache: ThumbnailCache实例
+            max_threads: 解码线程数
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.cache = cache
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        # DLC ID -> 排队中或执行中的任务
+        self._pending = {}
+        # 每次请求时递增，作为同一档优先级内的先后顺序
+        self._serial = 0
+
+    def request(self, dlc_id, visible=True):
+        """
+        请求加载缩略图（已在排队时，可见项目的请求把任务重新排到最前面）
+
+        Args:
+            dlc_id: DLC ID
+            visible: 是否为当前可见的项目（否则为滚动方向上的预取）
+        """
+        self._serial += 1
+        priority = (VISIBLE_PRIORITY if visible else PREFETCH_PRIORITY) + self._serial % VISIBLE_PRIORITY
+
+        task = self._pending.get(dlc_id)
+        if task is not None:
+            # 已开始执行的任务无法调整，仍在排队的从队列中取出后按新的优先级重新排队
+            if visible and self.pool.tryTake(task):
+                task.visible = True
+                self.pool.start(task, priority)
+            return
+
+        task = ThumbnailTask(self.cache, dlc_id)
+        task.visible = visible
+        task.signals.loaded.connect(self._on_loaded)
+        self._pending[dlc_id] = task
+        self.pool.start(task, priority)
+
+    def is_pending(self, dlc_id):
+        """缩略图是否正在加载"""
+        return dlc_id in self._pending
+
+    def _on_loaded(self, dlc_id, image):
+        """任务完成（界面线程）：转换为QIcon放入内存缓存"""
+        self._pending.pop(dlc_id, None)
+        self.cache.store(dlc_id, image)
+        self.thumbnail_ready.emit(dlc_id)
+
+    def shutdown(self):
+        """丢弃排队中的任务并等待正在执行的任务结束（仍保留任务引用，超时未结束的任务可以安全发射信号）"""
+        self.pool.clear()
+        self.pool.waitForDone(1000)
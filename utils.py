@@ -10,6 +10,7 @@ import logging
 import logging.handlers
 import hashlib
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 import colorlog
@@ -385,10 +386,13 @@ def is_valid_game_directory(path):
         return False
 
 
-def get_ets2_default_paths():
+def get_ets2_default_paths(game_path=None):
     """
     获取ETS2默认路径
     
+    Args:
+        game_path: 已保存或已检测到的游戏安装目录（查找Steam游戏库可能较慢，由主窗口在后台进行）
+    
     Returns:
         默认路径字典
     """
@@ -401,57 +405,74 @@ def get_ets2_default_paths():
         paths['ets2_config'] = documents / "Euro Truck Simulator 2"
         paths['ets2_mods'] = documents / "Euro Truck Simulator 2" / "mod"
         
-        # Steam默认安装路径
-        steam_paths = [
-            Path("C:/Program Files (x86)/Steam/steamapps/common/Euro Truck Simulator 2"),
-            Path("C:/Program Files/Steam/steamapps/common/Euro Truck Simulator 2"),
-            Path.home() / "Steam" / "steamapps" / "common" / "Euro Truck Simulator 2"
-        ]
-        
-        for steam_path in steam_paths:
-            if steam_path.exists():
-                paths['ets2_install'] = steam_path
-                break
-    
     elif os.name == 'posix':  # Linux/Mac
         paths['documents'] = Path.home() / "Documents"
         paths['ets2_config'] = Path.home() / ".local" / "share" / "Euro Truck Simulator 2"
         paths['ets2_mods'] = Path.home() / ".local" / "share" / "Euro Truck Simulator 2" / "mod"
         
-        # Steam默认安装路径 (Linux)
-        steam_path = Path.home() / ".local" / "share" / "Steam" / "steamapps" / "common" / "Euro Truck Simulator 2"
-        if steam_path.exists():
-            paths['ets2_install'] = steam_path
+    # 游戏安装目录
+    if game_path:
+        paths['ets2_install'] = Path(game_path)
     
     return paths
 
 
-def create_progress_callback(progress_bar=None, status_label=None):
+def format_duration(seconds):
+    """
+    格式化剩余时间
+    
+    Args:
+        seconds: 秒数
+    
+    Returns:
+        格式化后的时间字符串，如 1:05 或 1:02:03
+    """
+    seconds = max(0, int(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def create_progress_callback(progress_bar=None, status_label=None, process_events=True):
     """
     创建进度回调函数
     
     Args:
         progress_bar: 进度条控件
         status_label: 状态标签控件
+        process_events: 是否在回调中处理Qt事件（进度来自工作线程信号时应为False）
     
     Returns:
         进度回调函数
     """
+    start_time = [None]
+    
     def callback(current, total):
         if total > 0:
+            if start_time[0] is None:
+                start_time[0] = time.monotonic()
             percentage = (current / total) * 100
             
             if progress_bar:
                 progress_bar.setValue(int(percentage))
             
             if status_label:
-                status_label.setText(f"进度: {percentage:.1f}% ({format_file_size(current)} / {format_file_size(total)})")
+                text = f"进度: {percentage:.1f}% ({format_file_size(current)} / {format_file_size(total)})"
+                # 根据平均速度估算剩余时间
+                elapsed = time.monotonic() - start_time[0]
+                if elapsed > 0.5 and current > 0:
+                    rate = current / elapsed
+                    text += f" {format_file_size(rate)}/s, 剩余 {format_duration((total - current) / rate)}"
+                status_label.setText(text)
             
             # 处理Qt事件
-            try:
-                from PyQt6.QtWidgets import QApplication
-                QApplication.processEvents()
-            except ImportError:
-                pass
+            if process_events:
+                try:
+                    from PyQt6.QtWidgets import QApplication
+                    QApplication.processEvents()
+                except ImportError:
+                    pass
     
     return callback
\ No newline at end of file